@@ -9,9 +9,7 @@ import time
 import sys
 import os
 
-# Add src to path
-sys.path.append('src')
-from utils.logger import setup_logger
+from voicenav.utils.logger import setup_logger
 
 # Initialize logger
 logger = setup_logger("debug_audio")
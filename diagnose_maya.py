@@ -4,9 +4,6 @@ Maya Voice System Diagnosis Tool
 Helps identify and fix recognition issues
 """
 
-import sys
-sys.path.append('src')
-
 def diagnose_maya_issues():
     """Diagnose and fix Maya voice recognition issues"""
     print("🔍 Maya Voice System Diagnosis")
@@ -35,7 +32,7 @@ def diagnose_maya_issues():
     
     # Test different confidence thresholds
     print("\n2. 🎯 Testing Confidence Thresholds...")
-    from input.enhanced_voice_listener import EnhancedVoiceListener
+    from voicenav.input.enhanced_voice_listener import EnhancedVoiceListener
     
     thresholds = [0.3, 0.5, 0.8]  # Test low, medium, high
     
@@ -200,7 +197,7 @@ def create_optimized_listener():
     input("Press ENTER...")
     
     try:
-        from input.enhanced_voice_listener import EnhancedVoiceListener
+        from voicenav.input.enhanced_voice_listener import EnhancedVoiceListener
         
         # Test with very permissive settings
         test_listener = EnhancedVoiceListener(confidence_threshold=0.1)
@@ -4,8 +4,6 @@ Voice Test Diagnostic Script
 Identifies the exact cause of voice test failures
 """
 
-import sys
-import os
 import subprocess
 import traceback
 
@@ -181,16 +179,9 @@ def test_voicenav_imports():
     print_header("TESTING VOICENAV IMPORTS")
     
     try:
-        # Add src to path
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        src_dir = os.path.join(current_dir, 'src')
-        sys.path.insert(0, src_dir)
-        
-        print(f"📁 Source directory: {src_dir}")
-        
         # Test logger import
         try:
-            from utils.logger import setup_logger
+            from voicenav.utils.logger import setup_logger
             print("✅ Logger utility imported")
         except Exception as e:
             print(f"❌ Logger import failed: {e}")
@@ -198,7 +189,7 @@ def test_voicenav_imports():
         
         # Test VoiceListener import
         try:
-            from input.voice_listener import VoiceListener
+            from voicenav.input.voice_listener import VoiceListener
             print("✅ VoiceListener imported")
         except Exception as e:
             print(f"❌ VoiceListener import failed: {e}")
@@ -218,11 +209,7 @@ def test_voicenav_initialization():
     
     try:
         # Import VoiceListener
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        src_dir = os.path.join(current_dir, 'src')
-        sys.path.insert(0, src_dir)
-        
-        from input.voice_listener import VoiceListener
+        from voicenav.input.voice_listener import VoiceListener
         
         # Try to create VoiceListener instance
         print("🎤 Creating VoiceListener instance...")
@@ -4,9 +4,7 @@ Practical Maya Configuration - Optimized for Real Use
 Use this instead of the high-threshold defaults
 """
 
-import sys
-sys.path.append('src')
-from input.enhanced_voice_listener import EnhancedVoiceListener
+from voicenav.input.enhanced_voice_listener import EnhancedVoiceListener
 
 def create_practical_maya():
     """Create Maya with practical settings"""
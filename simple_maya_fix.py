@@ -3,9 +3,6 @@
 Simple Maya Fix - Lower Confidence Threshold Test
 """
 
-import sys
-sys.path.append('src')
-
 def test_lower_confidence():
     """Test Maya with lower confidence thresholds"""
     print("🔧 Testing Maya with Lower Confidence Thresholds")
@@ -14,7 +11,7 @@ def test_lower_confidence():
     print()
     
     try:
-        from input.enhanced_voice_listener import EnhancedVoiceListener
+        from voicenav.input.enhanced_voice_listener import EnhancedVoiceListener
         
         # Test with 30% threshold (much more permissive)
         print("🎯 Testing with 30% confidence threshold...")
@@ -108,9 +105,7 @@ Practical Maya Configuration - Optimized for Real Use
 Use this instead of the high-threshold defaults
 """
 
-import sys
-sys.path.append('src')
-from input.enhanced_voice_listener import EnhancedVoiceListener
+from voicenav.input.enhanced_voice_listener import EnhancedVoiceListener
 
 def create_practical_maya():
     """Create Maya with practical settings"""
@@ -4,19 +4,50 @@ Controls user's actual browser (Safari/Chrome) via native macOS AppleScript
 """
 
 import subprocess
+import threading
+import select
+import json
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from src.utils.logger import setup_logger
+from voicenav.utils.logger import setup_logger
 
 # Initialize logger
 logger = setup_logger("applescript_browser")
 
+# Marks the end of each script sent to the osascript server
+_SCRIPT_END = "\n__VOICENAV_END__\n"
+
+# JXA loop run by one long-lived osascript process: it executes every script
+# it receives through NSAppleScript and answers with one JSON line
+_OSASCRIPT_SERVER = r"""
+ObjC.import('Foundation');
+var input = $.NSFileHandle.fileHandleWithStandardInput;
+var output = $.NSFileHandle.fileHandleWithStandardOutput;
+var sentinel = '\n__VOICENAV_END__\n';
+var pending = '';
+while (true) {
+    var data = input.availableData;
+    if (data.length == 0) break;
+    pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    var end;
+    while ((end = pending.indexOf(sentinel)) >= 0) {
+        var source = pending.slice(0, end);
+        pending = pending.slice(end + sentinel.length);
+        var error = Ref();
+        var result = $.NSAppleScript.alloc.initWithSource(source).executeAndReturnError(error);
+        var reply;
+        if (result.isNil()) {
+            reply = {ok: false, output: '', error: ObjC.unwrap(error[0].objectForKey('NSAppleScriptErrorMessage')) || 'AppleScript error'};
+        } else {
+            reply = {ok: true, output: ObjC.unwrap(result.stringValue) || '', error: ''};
+        }
+        output.writeData($(JSON.stringify(reply) + '\n').dataUsingEncoding($.NSUTF8StringEncoding));
+    }
+}
+"""
+
 
 class AppleScriptBrowserController:
     """
@@ -31,6 +62,11 @@ class AppleScriptBrowserController:
     - Lightweight and reliable
     """
     
+    # Warm osascript processes shared by every controller, each running one
+    # script at a time; the pool grows to the number of concurrent calls
+    _idle_servers = []
+    _servers_lock = threading.Lock()
+    
     def __init__(self, browser_app="auto"):
         """
         Initialize AppleScript browser controller
@@ -79,15 +115,9 @@ class AppleScriptBrowserController:
             return defaultBrowser
             '''
             
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            success, browser_name, error = self._run_applescript(script, timeout=5)
             
-            if result.returncode == 0:
-                browser_name = result.stdout.strip()
+            if success:
                 logger.info(f"System default browser: {browser_name}")
                 
                 # Map common browser names to AppleScript names
@@ -134,27 +164,22 @@ class AppleScriptBrowserController:
             end tell
             '''
             
-            result = subprocess.run(
-                ['osascript', '-e', test_script], 
-                capture_output=True, 
-                text=True,
-                timeout=5
-            )
+            success, output, error = self._run_applescript(test_script, timeout=5)
             
-            if result.returncode == 0:
+            if success:
                 self.is_initialized = True
                 logger.info(f"{self.browser_app} control initialized successfully")
                 self._speak(f"{self.browser_app} ready")
                 return True
+            elif error == "Script timed out":
+                logger.error(f"Timeout initializing {self.browser_app}")
+                self._speak("Browser initialization timed out")
+                return False
             else:
-                logger.error(f"Failed to initialize {self.browser_app}: {result.stderr}")
+                logger.error(f"Failed to initialize {self.browser_app}: {error}")
                 self._speak(f"Could not initialize {self.browser_app}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout initializing {self.browser_app}")
-            self._speak("Browser initialization timed out")
-            return False
         except Exception as e:
             logger.error(f"Browser initialization failed: {e}")
             self._speak("Browser initialization failed")
@@ -187,10 +212,118 @@ class AppleScriptBrowserController:
             logger.error(f"TTS error: {e}")
             print(f"🔊 Maya would say: {text}")
     
+    @classmethod
+    def _acquire_server(cls) -> subprocess.Popen:
+        """
+        Take an idle osascript server for one script, starting one if none is free
+        
+        Returns:
+            subprocess.Popen: Running osascript server, owned by the caller
+        """
+        with cls._servers_lock:
+            while cls._idle_servers:
+                server = cls._idle_servers.pop()
+                if server.poll() is None:
+                    return server
+        
+        server = subprocess.Popen(
+            ['osascript', '-l', 'JavaScript', '-e', _OSASCRIPT_SERVER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        logger.debug("Started osascript server")
+        return server
+    
+    @classmethod
+    def _release_server(cls, server: subprocess.Popen):
+        """Hand a server whose reply has been read back for the next script"""
+        with cls._servers_lock:
+            cls._idle_servers.append(server)
+    
     def _run_applescript(self, script: str, timeout: int = 10) -> tuple:
         """
         Run AppleScript and return result
         
+        Scripts go to a long-lived osascript process over a pipe, so osascript
+        only starts when no warm server is free; concurrent calls each get
+        their own server and run side by side. If the script cannot be sent
+        to a server it runs in a one-off osascript process instead; once it
+        has been sent it may already have run, so failures are reported
+        rather than retried.
+        
+        Args:
+            script (str): AppleScript to execute
+            timeout (int): Timeout in seconds
+            
+        Returns:
+            tuple: (success: bool, output: str, error: str)
+        """
+        server = None
+        try:
+            server = self._acquire_server()
+            server.stdin.write(script + _SCRIPT_END)
+            server.stdin.flush()
+        except Exception as e:
+            logger.debug(f"osascript server unavailable ({e}), running script directly")
+            if server is not None:
+                server.kill()
+            return self._run_applescript_once(script, timeout)
+        
+        return self._read_reply(server, timeout)
+    
+    def _read_reply(self, server: subprocess.Popen, timeout: int) -> tuple:
+        """
+        Wait for the server's reply to the script just sent
+        
+        The server goes back to the idle pool once it has replied; on any
+        failure it is killed instead.
+        
+        Args:
+            server (subprocess.Popen): Server the script was written to
+            timeout (int): Timeout in seconds
+            
+        Returns:
+            tuple: (success: bool, output: str, error: str)
+        """
+        try:
+            ready, _, _ = select.select([server.stdout], [], [], timeout)
+            if not ready:
+                # The hung script blocks the server, so it cannot be reused
+                server.kill()
+                logger.error(f"AppleScript timeout after {timeout}s")
+                return False, "", "Script timed out"
+            
+            line = server.stdout.readline()
+            if not line:
+                raise RuntimeError("osascript server exited")
+            reply = json.loads(line)
+            
+            success = reply["ok"]
+            output = reply["output"].strip()
+            error = reply["error"].strip()
+            
+        except Exception as e:
+            # The script may already have run, so running it again could
+            # repeat its side effects (opening a URL, clicking)
+            logger.error(f"AppleScript execution error: {e}")
+            server.kill()
+            return False, "", str(e)
+        
+        self._release_server(server)
+        
+        if success:
+            logger.debug(f"AppleScript success: {output}")
+        else:
+            logger.warning(f"AppleScript error: {error}")
+        
+        return success, output, error
+    
+    def _run_applescript_once(self, script: str, timeout: int = 10) -> tuple:
+        """
+        Run AppleScript in its own osascript process and return result
+        
         Args:
             script (str): AppleScript to execute
             timeout (int): Timeout in seconds
@@ -4,12 +4,11 @@ Executes parsed commands in actual browser using Playwright
 """
 
 import asyncio
+import itertools
 import subprocess
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
-import sys
-import os
+from typing import Dict, Any, List, Optional
 
 try:
     from playwright.async_api import async_playwright, Browser, Page, ElementHandle
@@ -17,13 +16,14 @@ except ImportError:
     print("⚠️  Playwright not installed. Run: pip install playwright && playwright install chromium")
     async_playwright = None
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from src.utils.logger import setup_logger
+from voicenav.utils.logger import setup_logger
 
 # Initialize logger
 logger = setup_logger("browser_control")
 
+# Scroll intents and the sign of their vertical offset
+_SCROLL_SIGN = {'scroll_down': 1, 'scroll_up': -1}
+
 
 class BrowserController:
     """
@@ -337,6 +337,45 @@ class BrowserController:
             self._speak("Sorry, I couldn't scroll")
             return False
     
+    async def _scroll_batch(self, commands: List[Dict[str, Any]]) -> bool:
+        """
+        Apply several scroll commands in one page.evaluate round trip
+        
+        Args:
+            commands (list): Parsed scroll_down/scroll_up commands, in order
+            
+        Returns:
+            bool: Success status for the whole run
+        """
+        if not self.page:
+            logger.error("No page available")
+            self._speak("Browser not ready")
+            return False
+        
+        deltas = [
+            _SCROLL_SIGN[command['intent']] * command.get('params', {}).get('amount', 300)
+            for command in commands
+        ]
+        
+        try:
+            logger.info(f"Scrolling in {len(deltas)} steps: {deltas}")
+            
+            # Each step is applied separately so clamping at the page edges
+            # matches running the commands one by one
+            await self.page.evaluate('deltas => deltas.forEach(dy => window.scrollBy(0, dy))', deltas)
+            
+            # Maya gives one confirmation for the run
+            direction = 'down' if deltas[-1] > 0 else 'up'
+            self._speak(f"Scrolling {direction}")
+            
+            logger.info("Successfully applied scroll batch")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Scroll batch failed: {e}")
+            self._speak("Sorry, I couldn't scroll")
+            return False
+    
     async def go_back(self) -> bool:
         """
         Navigate back in browser history
@@ -568,6 +607,33 @@ class BrowserController:
             self._speak("Sorry, something went wrong")
             return False
     
+    async def execute_batch(self, commands: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Execute parsed commands in order
+        
+        Consecutive scroll commands are coalesced into a single browser
+        round trip; every other command goes through execute_command.
+        
+        Args:
+            commands (list): Parsed commands from CommandParser
+            
+        Returns:
+            list: Success status for each command, in order
+        """
+        results = []
+        
+        for is_scroll, group in itertools.groupby(commands, key=lambda c: c.get('intent') in _SCROLL_SIGN):
+            group = list(group)
+            
+            if is_scroll and len(group) > 1:
+                logger.info(f"Executing {len(group)} scroll commands as one batch")
+                results.extend([await self._scroll_batch(group)] * len(group))
+            else:
+                for command in group:
+                    results.append(await self.execute_command(command))
+        
+        return results
+    
     async def cleanup(self):
         """Clean up browser resources"""
         try:
@@ -4,18 +4,33 @@ Interprets voice commands into actionable intents
 """
 
 import re
+import functools
 from datetime import datetime
 from typing import Dict, Any, Optional
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from src.utils.logger import setup_logger
+from voicenav.utils.logger import setup_logger
+
+# Import hyperscan to match every intent pattern in one scan
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 # Initialize logger
 logger = setup_logger("command_parser")
 
+# A pattern that is only a word-bounded list of fixed phrases
+_PHRASE_PATTERN = re.compile(r'\\b\(\?:([^()]*)\)')
+
+# Patterns used on every URL and element parse, compiled once
+_URL_FILLER = re.compile(r'\b(?:the|website|site|page)\b')
+_BUTTON_TEXT = re.compile(r'(?:the\s+)?(.+?)\s+button')
+_BUTTON_WORD = re.compile(r'\bbutton\b')
+_LINK_TEXT = re.compile(r'(?:the\s+)?(.+?)\s+link')
+_LINK_WORD = re.compile(r'\blink\b')
+_ARTICLES = re.compile(r'\b(?:the|a|an|this|that)\b')
+
 
 class CommandParser:
     """
@@ -36,6 +51,9 @@ class CommandParser:
         """Initialize the command parser with patterns and URL mappings"""
         self.setup_patterns()
         self.setup_url_mappings()
+        # Users reopen the same few sites, so repeat lookups skip the
+        # fuzzy-match scan; the cache lives and dies with this parser
+        self.normalize_url = functools.lru_cache(maxsize=256)(self.normalize_url)
         logger.info("CommandParser initialized")
     
     def setup_patterns(self):
@@ -100,6 +118,48 @@ class CommandParser:
                 r'\b(?:update page)',
             ]
         }
+        
+        self._compile_patterns()
+    
+    def _compile_patterns(self):
+        """
+        Precompile the command patterns in priority order
+        
+        With hyperscan installed, all patterns also go into one database so a
+        command is scanned once and only the patterns that hit are re-run
+        with re to extract their groups.
+        """
+        self.compiled_patterns = [
+            (intent, re.compile(pattern, re.IGNORECASE))
+            for intent, patterns in self.patterns.items()
+            for pattern in patterns
+        ]
+        
+        self.pattern_db = None
+        if HYPERSCAN_AVAILABLE:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[regex.pattern.encode() for _, regex in self.compiled_patterns],
+                    ids=list(range(len(self.compiled_patterns))),
+                    flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self.compiled_patterns)
+                )
+                self.pattern_db = db
+            except Exception as e:
+                logger.warning(f"Hyperscan compile failed, using re only: {e}")
+        
+        # Whole-command lookup for the fixed phrases the patterns list, so
+        # common commands like "go back" skip the pattern scan entirely.
+        # Each entry is what the pattern scan returns for that phrase.
+        self.exact_matches = {}
+        for _, regex in self.compiled_patterns:
+            phrase_list = _PHRASE_PATTERN.fullmatch(regex.pattern)
+            if not phrase_list:
+                continue
+            for phrase in phrase_list.group(1).split('|'):
+                phrase = phrase.replace('\\', '')
+                if phrase not in self.exact_matches:
+                    self.exact_matches[phrase] = self._scan_patterns(phrase)
     
     def setup_url_mappings(self):
         """Setup common website URL mappings"""
@@ -157,7 +217,7 @@ class CommandParser:
         url_input = url_input.lower().strip()
         
         # Remove common phrases
-        url_input = re.sub(r'\b(?:the|website|site|page)\b', '', url_input).strip()
+        url_input = _URL_FILLER.sub('', url_input).strip()
         
         # Check direct mappings first
         if url_input in self.url_mappings:
@@ -200,20 +260,20 @@ class CommandParser:
         if any(word in description for word in ['button', 'btn']):
             element['type'] = 'button'
             # Extract button text
-            text_match = re.search(r'(?:the\s+)?(.+?)\s+button', description)
+            text_match = _BUTTON_TEXT.search(description)
             if text_match:
                 element['text'] = text_match.group(1).strip()
             else:
-                element['text'] = re.sub(r'\bbutton\b', '', description).strip()
+                element['text'] = _BUTTON_WORD.sub('', description).strip()
         
         # Link patterns
         elif any(word in description for word in ['link', 'hyperlink']):
             element['type'] = 'link'
-            text_match = re.search(r'(?:the\s+)?(.+?)\s+link', description)
+            text_match = _LINK_TEXT.search(description)
             if text_match:
                 element['text'] = text_match.group(1).strip()
             else:
-                element['text'] = re.sub(r'\blink\b', '', description).strip()
+                element['text'] = _LINK_WORD.sub('', description).strip()
         
         # Input patterns
         elif any(word in description for word in ['input', 'field', 'box', 'textbox']):
@@ -235,7 +295,7 @@ class CommandParser:
         else:
             # Check for specific text content
             # Remove articles and common words
-            clean_text = re.sub(r'\b(?:the|a|an|this|that)\b', '', description).strip()
+            clean_text = _ARTICLES.sub('', description).strip()
             element['text'] = clean_text
             element['type'] = 'any'  # Will try multiple selectors
         
@@ -268,14 +328,36 @@ class CommandParser:
         """
         text = text.lower().strip()
         
-        for intent, patterns in self.patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    # Return the matched groups if any, otherwise the full match
-                    matched_text = match.groups()[0] if match.groups() else match.group(0)
-                    logger.debug(f"Matched intent '{intent}' with pattern '{pattern}'")
-                    return intent, matched_text
+        if text in self.exact_matches:
+            return self.exact_matches[text]
+        
+        return self._scan_patterns(text)
+    
+    def _scan_patterns(self, text: str) -> tuple:
+        """
+        Find the highest-priority pattern matching normalized text
+        
+        Args:
+            text (str): Lowercased, stripped input text
+            
+        Returns:
+            tuple: (intent, matched_text) or (None, None)
+        """
+        candidates = range(len(self.compiled_patterns))
+        if self.pattern_db is not None:
+            # One pass finds every pattern that matches; the lowest id wins
+            hits = []
+            self.pattern_db.scan(text.encode(), match_event_handler=lambda pattern_id, *_: hits.append(pattern_id))
+            candidates = sorted(hits)
+        
+        for index in candidates:
+            intent, regex = self.compiled_patterns[index]
+            match = regex.search(text)
+            if match:
+                # Return the matched groups if any, otherwise the full match
+                matched_text = match.groups()[0] if match.groups() else match.group(0)
+                logger.debug(f"Matched intent '{intent}' with pattern '{regex.pattern}'")
+                return intent, matched_text
         
         return None, None
     
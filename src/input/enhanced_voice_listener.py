@@ -4,21 +4,27 @@ Advanced voice detection with confidence scoring, noise cancellation,
 custom wake words, visual feedback, and undo functionality
 """
 
-import whisper
 import pyaudio
-import wave
-import tempfile
 import os
 import time
 import threading
 import json
 import pickle
+import hashlib
+import functools
+import importlib.util
+from collections import OrderedDict
 from datetime import datetime
-import sys
 import subprocess
 import numpy as np
 import warnings
 
+# openai-whisper is only imported when the first model loads, so check for it
+# up front: importing this module must still fail without it, which keeps
+# ENHANCED_AVAILABLE in voice_listener accurate
+if importlib.util.find_spec("whisper") is None:
+    raise ImportError("openai-whisper is not installed: pip install openai-whisper")
+
 # Suppress Whisper FP16 warning on CPU
 warnings.filterwarnings("ignore", message="FP16 is not supported on CPU.*")
 
@@ -29,6 +35,20 @@ try:
 except ImportError:
     NOISEREDUCE_AVAILABLE = False
 
+# Import sounddevice for callback-driven capture
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+
+# Import webrtcvad to gate recordings on speech
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
 # Import colorama for visual feedback
 try:
     from colorama import Fore, Back, Style, init
@@ -37,14 +57,31 @@ try:
 except ImportError:
     COLORAMA_AVAILABLE = False
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.logger import setup_logger
+from voicenav.utils.logger import setup_logger
 
 # Initialize logger
 logger = setup_logger("enhanced_voice_listener")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_whisper_model(model_size):
+    """
+    Load a Whisper model once per process
+    
+    Listeners created later with the same model size (e.g. re-running the
+    test menu) reuse the weights already in memory instead of reloading them.
+    
+    Args:
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        
+    Returns:
+        Loaded Whisper model
+    """
+    # Imported here so loading this module does not pay for torch/whisper
+    import whisper
+    return whisper.load_model(model_size)
+
+
 class EnhancedVoiceListener:
     """
     Enhanced voice listening system with advanced features:
@@ -91,12 +128,24 @@ class EnhancedVoiceListener:
         self.false_trigger_count = 0
         self.successful_commands = 0
         
+        # Transcripts of recent clips keyed by audio hash, so retrying the
+        # same recording (e.g. with another threshold) skips Whisper
+        self.transcript_cache = OrderedDict()
+        self.TRANSCRIPT_CACHE_SIZE = 100
+        self.last_command_audio = None
+        
         # Audio settings optimized for Whisper
         self.CHUNK = 1024
         self.FORMAT = pyaudio.paInt16
         self.CHANNELS = 1
         self.RATE = 16000  # Whisper's preferred sample rate
         
+        # Voice activity gate: 30ms frames, stop once 0.5s of silence
+        # follows at least 0.3s of speech
+        self.VAD_FRAME = self.RATE * 30 // 1000
+        self.VAD_MIN_SPEECH = 0.3
+        self.VAD_TRAILING_SILENCE = 0.5
+        
         # Visual feedback colors
         self.colors = {
             'idle': Fore.CYAN,
@@ -142,7 +191,7 @@ class EnhancedVoiceListener:
             logger.info(f"Loading Whisper model: {self.model_size}")
             self._update_visual_state("processing", "Loading Whisper AI model...")
             
-            self.whisper_model = whisper.load_model(self.model_size)
+            self.whisper_model = _load_whisper_model(self.model_size)
             logger.info("Whisper model loaded successfully")
             
             self._update_visual_state("success", "Whisper AI model ready!")
@@ -233,15 +282,21 @@ class EnhancedVoiceListener:
             return audio_data
         
         try:
-            # Convert to numpy array
+            # Convert to numpy array, normalizing to [-1, 1] in place
             audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-            audio_np = audio_np / 32768.0  # Normalize to [-1, 1]
+            audio_np *= 1 / 32768.0
             
-            # Apply noise reduction
-            reduced_audio = nr.reduce_noise(y=audio_np, sr=sample_rate)
+            # Non-stationary reduction with a short STFT window; the torch
+            # backend (installed alongside Whisper) runs the FFTs on CPU
+            reduced_audio = nr.reduce_noise(
+                y=audio_np, sr=sample_rate, stationary=False,
+                n_fft=512, hop_length=128, prop_decrease=0.9,
+                use_torch=True, device='cpu'
+            )
             
             # Convert back to int16
-            reduced_audio = (reduced_audio * 32768.0).astype(np.int16)
+            reduced_audio *= 32768.0
+            reduced_audio = reduced_audio.astype(np.int16)
             
             return reduced_audio.tobytes()
             
@@ -324,6 +379,9 @@ class EnhancedVoiceListener:
         Returns:
             tuple: (audio_data_bytes, success_flag)
         """
+        if SOUNDDEVICE_AVAILABLE:
+            return self._record_audio_callback(duration, stop_event, show_progress)
+        
         try:
             # Open audio stream
             stream = self.audio_interface.open(
@@ -334,7 +392,11 @@ class EnhancedVoiceListener:
                 frames_per_buffer=self.CHUNK
             )
             
-            frames = []
+            # Preallocated sample buffer; one chunk of headroom for the
+            # read that straddles the duration limit
+            buffer = bytearray((int(self.RATE * duration) + self.CHUNK) * 2)
+            view = memoryview(buffer)
+            offset = 0
             start_time = time.time()
             
             # Visual progress
@@ -360,7 +422,11 @@ class EnhancedVoiceListener:
                     if self.noise_reduction:
                         data = self._apply_noise_reduction(data, self.RATE)
                     
-                    frames.append(data)
+                    count = min(len(data), len(buffer) - offset)
+                    view[offset:offset + count] = data[:count]
+                    offset += count
+                    if offset >= len(buffer):
+                        break
                     
                     # Update progress
                     if show_progress:
@@ -380,8 +446,8 @@ class EnhancedVoiceListener:
             stream.close()
             
             # Return raw audio data
-            if frames:
-                return b''.join(frames), True
+            if offset:
+                return bytes(view[:offset]), True
             
             return None, False
             
@@ -389,7 +455,126 @@ class EnhancedVoiceListener:
             logger.error(f"Audio recording failed: {e}")
             return None, False
     
+    def _record_audio_callback(self, duration, stop_event, show_progress):
+        """
+        Record audio through a sounddevice callback into a preallocated buffer
+        
+        PortAudio's thread copies each block straight into the buffer, so the
+        Python side only waits for the stop event instead of reading chunks.
+        
+        Args:
+            duration (int): Maximum recording duration in seconds
+            stop_event (threading.Event): Optional event to stop recording early
+            show_progress (bool): Show visual recording progress
+            
+        Returns:
+            tuple: (audio_data_bytes, success_flag); with webrtcvad installed
+            only the voiced span is returned, and (None, True) means no speech
+        """
+        buffer = np.zeros(int(self.RATE * duration), dtype=np.int16)
+        write_index = [0]
+        finished = threading.Event()
+        
+        vad = webrtcvad.Vad(2) if WEBRTCVAD_AVAILABLE else None
+        vad_index = 0
+        voiced_frames = 0
+        first_voiced = last_voiced = None
+        
+        def callback(indata, frames, time_info, status):
+            start = write_index[0]
+            count = min(frames, len(buffer) - start)
+            buffer[start:start + count] = indata[:count, 0]
+            write_index[0] = start + count
+            if write_index[0] >= len(buffer):
+                raise sd.CallbackStop
+        
+        try:
+            progress_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+            progress_index = 0
+            
+            with sd.InputStream(samplerate=self.RATE, channels=self.CHANNELS, dtype='int16',
+                                blocksize=128, latency='low', callback=callback,
+                                finished_callback=finished.set):
+                while not finished.wait(0.1):
+                    if stop_event and stop_event.is_set():
+                        break
+                    
+                    if vad is not None:
+                        # Classify the frames captured since the last wake-up
+                        while vad_index + self.VAD_FRAME <= write_index[0]:
+                            frame = buffer[vad_index:vad_index + self.VAD_FRAME]
+                            if vad.is_speech(frame.tobytes(), self.RATE):
+                                if first_voiced is None:
+                                    first_voiced = vad_index
+                                last_voiced = vad_index + self.VAD_FRAME
+                                voiced_frames += 1
+                            vad_index += self.VAD_FRAME
+                        
+                        # Speech followed by enough silence ends the recording
+                        if (voiced_frames * self.VAD_FRAME >= self.VAD_MIN_SPEECH * self.RATE
+                                and vad_index - last_voiced >= self.VAD_TRAILING_SILENCE * self.RATE):
+                            break
+                    
+                    if show_progress:
+                        remaining = duration - write_index[0] / self.RATE
+                        char = progress_chars[progress_index % len(progress_chars)]
+                        print(f"\r{self.colors['processing']}{char} Recording... {remaining:.1f}s{self.colors['reset']}", end="", flush=True)
+                        progress_index += 1
+            
+            if show_progress:
+                print()  # New line after progress
+            
+            if not write_index[0]:
+                return None, False
+            
+            start, end = 0, write_index[0]
+            if vad is not None:
+                if first_voiced is None:
+                    return None, True
+                # Keep 100ms either side so word edges are not clipped
+                padding = self.RATE // 10
+                start = max(0, first_voiced - padding)
+                end = min(write_index[0], last_voiced + padding)
+            
+            # Noise reduction runs once over the whole clip
+            audio_data = buffer[start:end].tobytes()
+            if self.noise_reduction:
+                audio_data = self._apply_noise_reduction(audio_data, self.RATE)
+            
+            return audio_data, True
+            
+        except Exception as e:
+            logger.error(f"Audio recording failed: {e}")
+            return None, False
+    
     def _transcribe_audio(self, audio_data):
+        """
+        Transcribe audio data, reusing the result for a clip seen recently
+        
+        Args:
+            audio_data (bytes): Raw audio data
+            
+        Returns:
+            tuple: (text, confidence_score)
+        """
+        key = hashlib.blake2b(audio_data, digest_size=16).digest()
+        cached = self.transcript_cache.get(key)
+        if cached is not None:
+            self.transcript_cache.move_to_end(key)
+            logger.debug("Transcript cache hit")
+            return cached
+        
+        text, confidence = self._run_whisper(audio_data)
+        
+        # Failures are not cached so a retry runs Whisper again
+        if text:
+            self.transcript_cache[key] = (text, confidence)
+            if len(self.transcript_cache) > self.TRANSCRIPT_CACHE_SIZE:
+                self.transcript_cache.popitem(last=False)
+        
+        return text, confidence
+    
+    def _run_whisper(self, audio_data):
         """
         Transcribe audio data using Whisper with confidence scoring
         
@@ -400,20 +585,22 @@ class EnhancedVoiceListener:
             tuple: (text, confidence_score)
         """
         try:
-            # Save to temporary file for Whisper
-            temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-            
-            # Write WAV file
-            wf = wave.open(temp_file.name, 'wb')
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(self.audio_interface.get_sample_size(self.FORMAT))
-            wf.setframerate(self.RATE)
-            wf.writeframes(audio_data)
-            wf.close()
-            temp_file.close()
-            
-            # Transcribe with Whisper
-            result = self.whisper_model.transcribe(temp_file.name)
+            # Whisper accepts 16 kHz float32 samples directly, so the clip
+            # never goes through a WAV file and ffmpeg
+            samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+            samples *= 1 / 32768.0
+            
+            # Commands are English: fixing the language skips the detection
+            # pass, and no timestamp tokens are sampled since none are used.
+            # inference_mode skips autograd bookkeeping entirely, unlike no_grad
+            import torch
+            with torch.inference_mode():
+                result = self.whisper_model.transcribe(
+                    samples,
+                    language="en",
+                    without_timestamps=True,
+                    fp16=self.whisper_model.device.type == "cuda"
+                )
             text = result["text"].strip().lower()
             
             # Calculate confidence from Whisper segments
@@ -443,13 +630,18 @@ class EnhancedVoiceListener:
         except Exception as e:
             logger.error(f"Whisper transcription failed: {e}")
             return "", 0.0
-        finally:
-            # Clean up temporary file
-            try:
-                if 'temp_file' in locals() and os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-            except:
-                pass
+    
+    def warmup(self, duration_s=15):
+        """
+        Run one throwaway transcription so the first real command does not
+        pay for the model's one-time initialization
+        
+        Args:
+            duration_s (int): Seconds of silence to transcribe
+        """
+        start_time = time.time()
+        self._run_whisper(bytes(self.RATE * duration_s * 2))
+        logger.info(f"Whisper warm-up finished in {time.time() - start_time:.2f}s")
     
     def _check_wake_word(self, text, confidence):
         """
@@ -522,6 +714,9 @@ class EnhancedVoiceListener:
                         
                     # Return to listening state
                     self._update_visual_state("listening")
+                elif success:
+                    # The voice activity gate heard no speech
+                    print(f"\r{self.colors['idle']}🔇 (silence){self.colors['reset']}", end="")
                 else:
                     logger.warning("Recording failed")
                     time.sleep(0.5)
@@ -550,6 +745,7 @@ class EnhancedVoiceListener:
             
             if success and audio_data:
                 self._update_visual_state("processing", "Maya is processing your command...")
+                self.last_command_audio = audio_data
                 text, confidence = self._transcribe_audio(audio_data)
                 
                 # Create enhanced command object
@@ -609,6 +805,32 @@ class EnhancedVoiceListener:
             self._update_visual_state("error", f"Error: {str(e)}")
             return command
     
+    def reevaluate_last_command(self, confidence_threshold):
+        """
+        Check the last captured command against a different confidence threshold
+        
+        The transcript comes from the cache, so Whisper is not run again.
+        
+        Args:
+            confidence_threshold (float): Threshold to test against (0.0-1.0)
+            
+        Returns:
+            dict or None: Command object for the last recording, None if there is none
+        """
+        if self.last_command_audio is None:
+            return None
+        
+        text, confidence = self._transcribe_audio(self.last_command_audio)
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "raw_text": text,
+            "confidence": confidence,
+            "confidence_threshold": confidence_threshold,
+            "meets_threshold": confidence >= confidence_threshold,
+            "wake_word_used": self.wake_word,
+            "noise_reduction": self.noise_reduction
+        }
+    
     def train_custom_wake_word(self, name, num_samples=5):
         """
         Train a custom wake word by recording multiple samples
@@ -8,23 +8,24 @@ import speech_recognition as sr
 import pyttsx3
 import time
 import threading
+import gc
 from datetime import datetime
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.logger import setup_logger
+from voicenav.utils.logger import setup_logger
 
 # Try to import Whisper and Enhanced listeners, fallback to Google Speech
 try:
-    from input.whisper_voice_listener import WhisperVoiceListener
+    from voicenav.input.whisper_voice_listener import WhisperVoiceListener, FASTER_WHISPER_AVAILABLE, WHISPER_CPP_BINARY
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
+    FASTER_WHISPER_AVAILABLE = False
+    WHISPER_CPP_BINARY = None
 
 try:
-    from input.enhanced_voice_listener import EnhancedVoiceListener
+    from voicenav.input.enhanced_voice_listener import EnhancedVoiceListener
     ENHANCED_AVAILABLE = True
 except ImportError:
     ENHANCED_AVAILABLE = False
@@ -422,7 +423,9 @@ def main():
         logger.error(f"Voice listener test error: {e}")
 
 
-def create_voice_listener(wake_word="hey maya", command_timeout=5, prefer_whisper=True):
+def create_voice_listener(wake_word="hey maya", command_timeout=5, prefer_whisper=True,
+                          backend="openai_whisper", model_size=None, dtype="auto", use_vad=True,
+                          quantization=None):
     """
     Factory function to create the best available voice listener
     
@@ -430,15 +433,45 @@ def create_voice_listener(wake_word="hey maya", command_timeout=5, prefer_whispe
         wake_word (str): The wake word to listen for
         command_timeout (int): Seconds to wait for command after wake word  
         prefer_whisper (bool): Use Whisper if available (recommended)
+        backend (str): Whisper backend, "openai_whisper", "faster_whisper" or "whisper_cpp"
+        model_size (str): Whisper model to load; defaults to $VOICENAV_WHISPER_MODEL,
+            else distil-small.en for faster-whisper, tiny.en for whisper.cpp and
+            base for OpenAI Whisper
+        dtype (str): Whisper precision, "auto", "float16", "bfloat16" or "float32";
+            auto uses half precision on CUDA and full/int8 precision on CPU
+        use_vad (bool): Trim recordings to the detected speech before transcribing
+        quantization (str): Overrides backend; "int8" for faster-whisper int8
+            (int8_float16 on CUDA), "q5_0" for whisper.cpp GGML q5_0 weights
         
     Returns:
         WhisperVoiceListener or VoiceListener: Best available listener
     """
+    if quantization == "int8":
+        backend = "faster_whisper"
+    elif quantization == "q5_0":
+        backend = "whisper_cpp"
+    
+    if backend == "whisper_cpp" and not WHISPER_CPP_BINARY:
+        logger.warning("whisper.cpp not available, using faster-whisper")
+        backend = "faster_whisper"
+    
+    if backend == "faster_whisper" and not FASTER_WHISPER_AVAILABLE:
+        logger.warning("faster-whisper not available, using OpenAI Whisper")
+        backend = "openai_whisper"
+    
+    if model_size is None:
+        model_size = os.environ.get('VOICENAV_WHISPER_MODEL') or {
+            "faster_whisper": "distil-small.en",
+            "whisper_cpp": "tiny.en",
+        }.get(backend, "base")
+    
     # Use the working Whisper listener (revert to original working system)
     if prefer_whisper and WHISPER_AVAILABLE:
         try:
-            logger.info("Creating Whisper voice listener (high accuracy - REVERTED)")
-            return WhisperVoiceListener(wake_word=wake_word, command_timeout=command_timeout)
+            logger.info(f"Creating Whisper voice listener (high accuracy - REVERTED, {backend})")
+            return WhisperVoiceListener(wake_word=wake_word, command_timeout=command_timeout,
+                                        model_size=model_size, backend=backend, dtype=dtype,
+                                        use_vad=use_vad)
         except Exception as e:
             logger.warning(f"Whisper initialization failed: {e}, falling back to Google Speech")
     
@@ -475,5 +508,50 @@ def create_enhanced_voice_listener(wake_word="hey maya", command_timeout=5, conf
     )
 
 
+# Listeners handed out by get_or_create_listener, keyed by their sorted
+# factory options; release_listener cleans them up and empties it
+_shared_listeners = {}
+
+
+def get_or_create_listener(**kwargs):
+    """
+    Return a shared listener, creating it on first use
+    
+    Scripts run in the same process (e.g. from test_stage1.py) get the same
+    instance for the same options, so the Whisper weights load only once.
+    Do not call cleanup() on the result; use release_listener() instead.
+    
+    Args:
+        **kwargs: Options accepted by create_voice_listener
+        
+    Returns:
+        WhisperVoiceListener or VoiceListener: Shared listener
+    """
+    options = tuple(sorted(kwargs.items()))
+    if options not in _shared_listeners:
+        _shared_listeners[options] = create_voice_listener(**kwargs)
+    return _shared_listeners[options]
+
+
+def release_listener():
+    """Clean up every shared listener and free the memory held by their models"""
+    for listener in _shared_listeners.values():
+        try:
+            if hasattr(listener, 'cleanup'):
+                listener.cleanup()
+        except Exception as e:
+            logger.error(f"Listener cleanup error: {e}")
+    
+    _shared_listeners.clear()
+    gc.collect()
+    
+    # Only touch CUDA if a Whisper backend already pulled in torch
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    
+    logger.info("Shared voice listeners released")
+
+
 if __name__ == "__main__":
     main()
@@ -1,29 +1,57 @@
 """
 VoiceNav Whisper Voice Listener Module
-High-accuracy voice detection using OpenAI Whisper
+High-accuracy voice detection using OpenAI Whisper or faster-whisper
 """
 
-import whisper
 import pyaudio
+import numpy as np
+import io
 import wave
 import tempfile
 import os
 import time
+import shutil
+import subprocess
 import threading
+from pathlib import Path
 from datetime import datetime
-import sys
-import warnings
 
-# Suppress Whisper FP16 warning on CPU
-warnings.filterwarnings("ignore", message="FP16 is not supported on CPU.*")
+# Import the available Whisper backends
+try:
+    import whisper
+    OPENAI_WHISPER_AVAILABLE = True
+except ImportError:
+    OPENAI_WHISPER_AVAILABLE = False
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.logger import setup_logger
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+try:
+    from silero_vad import load_silero_vad, get_speech_timestamps
+    SILERO_VAD_AVAILABLE = True
+except ImportError:
+    SILERO_VAD_AVAILABLE = False
+
+# whisper.cpp command line build, used for q5_0 quantized GGML models
+WHISPER_CPP_BINARY = (os.environ.get('VOICENAV_WHISPER_CPP')
+                      or shutil.which('whisper-cli') or shutil.which('whisper-cpp'))
+
+if not (OPENAI_WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE):
+    raise ImportError("No Whisper backend installed: pip install openai-whisper or faster-whisper")
+
+from voicenav.utils.logger import setup_logger
+from voicenav.utils.probe_cache import probe_passed, record_probe
 
 # Initialize logger
 logger = setup_logger("whisper_voice_listener")
 
+# int16 PCM -> float32 in [-1, 1]; np.multiply converts and scales in one pass
+_INT16_SCALE = np.float32(1 / 32768)
+
 
 class WhisperVoiceListener:
     """
@@ -31,13 +59,15 @@ class WhisperVoiceListener:
     
     Features:
     - High-accuracy offline speech recognition using OpenAI Whisper
+      or faster-whisper (CTranslate2, int8 quantized)
     - Wake word detection ("hey maya") 
     - Command capture with configurable timeout
     - Audio feedback and text-to-speech
     - Error handling and robust microphone management
     """
     
-    def __init__(self, wake_word="hey maya", command_timeout=5, model_size="base"):
+    def __init__(self, wake_word="hey maya", command_timeout=5, model_size="base",
+                 backend="openai_whisper", dtype="auto", use_vad=True):
         """
         Initialize the Whisper voice listener
         
@@ -45,10 +75,19 @@ class WhisperVoiceListener:
             wake_word (str): The wake word to listen for
             command_timeout (int): Seconds to wait for command after wake word
             model_size (str): Whisper model size (tiny, base, small, medium, large)
+            backend (str): "openai_whisper", "faster_whisper" or "whisper_cpp"
+            dtype (str): "auto", "float16", "bfloat16" or "float32"; auto runs
+                half precision on CUDA and full/int8 precision on CPU
+            use_vad (bool): Trim recordings to the detected speech with Silero VAD
         """
         self.wake_word = wake_word.lower()
         self.command_timeout = command_timeout
         self.model_size = model_size
+        self.backend = backend
+        self.dtype = dtype
+        self.fp16 = False
+        self.use_vad = use_vad and SILERO_VAD_AVAILABLE
+        self.vad_model = None
         self.is_listening = False
         self.whisper_model = None
         self.audio_interface = None
@@ -60,6 +99,9 @@ class WhisperVoiceListener:
         self.CHANNELS = 1
         self.RATE = 16000  # Whisper's preferred sample rate
         
+        if use_vad and not SILERO_VAD_AVAILABLE:
+            logger.warning("silero-vad not installed, transcribing untrimmed audio")
+        
         # Initialize components
         self._setup_whisper()
         self._setup_audio()
@@ -70,10 +112,52 @@ class WhisperVoiceListener:
     def _setup_whisper(self):
         """Setup Whisper model"""
         try:
-            logger.info(f"Loading Whisper model: {self.model_size}")
+            logger.info(f"Loading Whisper model: {self.model_size} ({self.backend})")
             print(f"🧠 Loading Whisper {self.model_size} model...")
-            self.whisper_model = whisper.load_model(self.model_size)
-            logger.info("Whisper model loaded successfully")
+            
+            if self.backend == "faster_whisper":
+                if not FASTER_WHISPER_AVAILABLE:
+                    raise RuntimeError("faster-whisper is not installed")
+                # int8 weights on CPU; int8 with fp16 activations on CUDA
+                if ctranslate2.get_cuda_device_count() > 0:
+                    device, compute_type = "cuda", "int8_float16"
+                else:
+                    device, compute_type = "cpu", "int8"
+                # An explicit dtype is only honoured where CTranslate2 supports it
+                # (e.g. float16 on CUDA); otherwise keep the device default
+                if self.dtype != "auto":
+                    if self.dtype in ctranslate2.get_supported_compute_types(device):
+                        compute_type = self.dtype
+                    else:
+                        logger.warning(f"dtype {self.dtype} is not supported on {device}, using {compute_type}")
+                self.whisper_model = WhisperModel(self.model_size, device=device, compute_type=compute_type)
+            elif self.backend == "whisper_cpp":
+                if not WHISPER_CPP_BINARY:
+                    raise RuntimeError("whisper.cpp is not installed (brew install whisper-cpp)")
+                model_path = Path(os.environ.get('VOICENAV_WHISPER_CPP_MODEL') or
+                                  Path.home() / ".cache" / "whisper.cpp" / f"ggml-{self.model_size}-q5_0.bin")
+                if not model_path.exists():
+                    raise RuntimeError(f"whisper.cpp model not found: {model_path}")
+                # whisper.cpp runs as a separate process per clip; keep the model path
+                device, compute_type = "whisper.cpp", "q5_0"
+                self.whisper_model = str(model_path)
+                # Every clip is rewritten to this one file instead of a new temp file
+                self.wav_path = str(Path(tempfile.gettempdir()) / f"voicenav-{os.getpid()}-{id(self)}.wav")
+            else:
+                if not OPENAI_WHISPER_AVAILABLE:
+                    raise RuntimeError("openai-whisper is not installed")
+                import torch
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                compute_type = "float32"
+                self.whisper_model = whisper.load_model(self.model_size, device=device)
+                # Whisper only decodes in half precision on CUDA (bfloat16 runs as float16)
+                self.fp16 = device == "cuda" and self.dtype != "float32"
+                if self.fp16:
+                    compute_type = "float16"
+            logger.info(f"Whisper model loaded successfully on {device} ({compute_type})")
+            
+            if self.use_vad:
+                self.vad_model = load_silero_vad()
             print("✅ Whisper model ready!")
         except Exception as e:
             error_msg = f"Whisper setup failed: {e}"
@@ -183,7 +267,8 @@ class WhisperVoiceListener:
             stop_event (threading.Event): Optional event to stop recording early
             
         Returns:
-            str: Path to temporary audio file, or None if failed
+            WAV audio (a temporary file path for whisper.cpp, an in-memory
+                buffer otherwise), "" if VAD heard no speech, or None if failed
         """
         try:
             # Open audio stream
@@ -218,18 +303,31 @@ class WhisperVoiceListener:
             stream.stop_stream()
             stream.close()
             
-            # Save to temporary file
+            # Encode as WAV; only whisper.cpp, a separate process, needs it on disk
             if frames:
-                temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-                wf = wave.open(temp_file.name, 'wb')
+                audio_data = b''.join(frames)
+                if self.use_vad:
+                    audio_data = self._trim_to_speech(audio_data)
+                    if not audio_data:
+                        return ""
+                
+                if self.backend == "whisper_cpp":
+                    wav_target = self.wav_path
+                else:
+                    wav_target = io.BytesIO()
+                
+                wf = wave.open(wav_target, 'wb')
                 wf.setnchannels(self.CHANNELS)
                 wf.setsampwidth(self.audio_interface.get_sample_size(self.FORMAT))
                 wf.setframerate(self.RATE)
-                wf.writeframes(b''.join(frames))
+                wf.writeframes(audio_data)
                 wf.close()
-                temp_file.close()
                 
-                return temp_file.name
+                if self.backend == "whisper_cpp":
+                    return wav_target
+                
+                wav_target.seek(0)
+                return wav_target
             
             return None
             
@@ -237,26 +335,86 @@ class WhisperVoiceListener:
             logger.error(f"Audio recording failed: {e}")
             return None
     
+    def _trim_to_speech(self, audio_data):
+        """
+        Cut a recording down to the span Silero VAD marks as speech
+        
+        Whisper's encoder cost grows with the number of mel frames, so
+        leading/trailing silence is dropped before transcription.
+        
+        Args:
+            audio_data (bytes): 16-bit mono PCM at self.RATE
+            
+        Returns:
+            bytes: PCM from the first to the last speech segment, or b'' if none
+        """
+        try:
+            import torch
+            samples = np.multiply(np.frombuffer(audio_data, dtype=np.int16), _INT16_SCALE, dtype=np.float32)
+            timestamps = get_speech_timestamps(
+                torch.from_numpy(samples), self.vad_model,
+                sampling_rate=self.RATE, min_silence_duration_ms=300
+            )
+        except Exception as e:
+            logger.warning(f"VAD trimming failed: {e}")
+            return audio_data
+        
+        if not timestamps:
+            return b''
+        
+        # Timestamps are in samples; 2 bytes per int16 sample
+        return audio_data[timestamps[0]['start'] * 2:timestamps[-1]['end'] * 2]
+    
     def _transcribe_audio(self, audio_file_path, force_english=True):
         """
         Transcribe audio file using Whisper
         
         Args:
-            audio_file_path (str): Path to audio file
+            audio_file_path (str or io.BytesIO): WAV file path or in-memory WAV buffer
             force_english (bool): Force English language detection
             
         Returns:
             str: Transcribed text (lowercase)
         """
         try:
+            if self.backend == "whisper_cpp":
+                result = subprocess.run(
+                    [WHISPER_CPP_BINARY, '-m', self.whisper_model, '-f', audio_file_path,
+                     '-l', 'en' if force_english else 'auto', '-nt', '-np'],
+                    capture_output=True, text=True, check=True
+                )
+                text = " ".join(result.stdout.split()).lower()
+                logger.debug(f"Whisper transcription: '{text}'")
+                return text
+            
+            if self.backend == "faster_whisper":
+                segments, _ = self.whisper_model.transcribe(
+                    audio_file_path,
+                    language="en" if force_english else None,
+                    beam_size=1,
+                    vad_filter=True
+                )
+                text = "".join(segment.text for segment in segments).strip().lower()
+                logger.debug(f"Whisper transcription: '{text}'")
+                return text
+            
+            # openai-whisper only decodes files through ffmpeg; hand it the samples
+            if isinstance(audio_file_path, io.BytesIO):
+                with wave.open(audio_file_path, 'rb') as wf:
+                    audio_file_path = np.multiply(np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16),
+                                                  _INT16_SCALE, dtype=np.float32)
+            
             # Force English language to prevent Korean/other language detection
             transcribe_options = {
                 "language": "english" if force_english else None,
                 "task": "transcribe",
-                "fp16": False  # Prevent FP16 warnings on CPU
+                "fp16": self.fp16  # Half precision on CUDA, float32 on CPU
             }
             
-            result = self.whisper_model.transcribe(audio_file_path, **transcribe_options)
+            # inference_mode skips autograd bookkeeping entirely, unlike no_grad
+            import torch
+            with torch.inference_mode():
+                result = self.whisper_model.transcribe(audio_file_path, **transcribe_options)
             text = result["text"].strip().lower()
             logger.debug(f"Whisper transcription: '{text}'")
             return text
@@ -264,13 +422,38 @@ class WhisperVoiceListener:
         except Exception as e:
             logger.error(f"Whisper transcription failed: {e}")
             return ""
-        finally:
-            # Clean up temporary file
-            try:
-                if os.path.exists(audio_file_path):
-                    os.unlink(audio_file_path)
-            except:
-                pass
+    
+    def warmup(self, duration_s=15):
+        """
+        Run one throwaway transcription so the first real command does not
+        pay for the model's one-time initialization
+        
+        Args:
+            duration_s (int): Seconds of silence to transcribe
+        """
+        if self.backend == "whisper_cpp":
+            # Every clip starts a fresh whisper.cpp process; nothing stays warm
+            return
+        
+        try:
+            start_time = time.time()
+            silence = np.zeros(self.RATE * duration_s, dtype=np.float32)
+            
+            # Same options as _transcribe_audio, so the same kernels get set up,
+            # except VAD: it would drop the silence and skip the encoder entirely
+            if self.backend == "faster_whisper":
+                segments, _ = self.whisper_model.transcribe(silence, language="en", beam_size=1,
+                                                            vad_filter=False)
+                list(segments)  # Segments are generated lazily
+            else:
+                import torch
+                with torch.inference_mode():
+                    self.whisper_model.transcribe(silence, language="english", task="transcribe", fp16=self.fp16)
+            
+            logger.info(f"Whisper warm-up finished in {time.time() - start_time:.2f}s")
+            
+        except Exception as e:
+            logger.warning(f"Whisper warm-up failed: {e}")
     
     def _listen_for_wake_word(self):
         """
@@ -321,6 +504,8 @@ class WhisperVoiceListener:
                             return True
                     else:
                         print("🔇 (silence)")
+                elif audio_file == "":
+                    print("🔇 (silence)")
                 else:
                     print("❌ Recording failed")
                     time.sleep(0.5)
@@ -366,6 +551,12 @@ class WhisperVoiceListener:
                         "raw_text": "No speech detected",
                         "confidence": 0.0
                     }
+            elif audio_file == "":
+                return {
+                    "timestamp": datetime.now().isoformat(),
+                    "raw_text": "No speech detected",
+                    "confidence": 0.0
+                }
             else:
                 return {
                     "timestamp": datetime.now().isoformat(),
@@ -477,12 +668,20 @@ class WhisperVoiceListener:
         """Test microphone setup and permissions"""
         print("🎤 Testing microphone access...")
         
+        # A sibling test script opened the microphone moments ago (test runs
+        # opt in with VOICENAV_PROBE_CACHE=1)
+        if probe_passed("mic_ok"):
+            print("✅ Microphone test passed just now, skipping")
+            return True
+        
         try:
             self._test_microphone_access()
+            record_probe("mic_ok", True)
             print("✅ Microphone test successful!")
             return True
                 
         except Exception as e:
+            record_probe("mic_ok", False)
             print(f"❌ Microphone test failed: {e}")
             self._print_microphone_error()
             return False
@@ -490,6 +689,11 @@ class WhisperVoiceListener:
     def test_whisper_recognition(self):
         """Test Whisper speech recognition"""
         print("🧠 Testing Whisper recognition...")
+        
+        if probe_passed("whisper_ok"):
+            print("✅ Whisper recognition passed just now, skipping")
+            return True
+        
         print("Say something clearly (3 seconds):")
         
         try:
@@ -497,25 +701,31 @@ class WhisperVoiceListener:
             if audio_file:
                 text = self._transcribe_audio(audio_file)
                 if text:
+                    record_probe("whisper_ok", True)
                     print(f"✅ Whisper recognition successful!")
                     print(f"Maya heard: '{text}'")
                     return True
                 else:
                     print("❌ No speech detected")
-                    return False
+            elif audio_file == "":
+                print("❌ No speech detected")
             else:
                 print("❌ Recording failed")
-                return False
                 
         except Exception as e:
             print(f"❌ Whisper test failed: {e}")
-            return False
+        
+        record_probe("whisper_ok", False)
+        return False
     
     def cleanup(self):
         """Clean up resources"""
         try:
             if self.audio_interface:
                 self.audio_interface.terminate()
+            # The whisper.cpp clip file is reused for the listener's lifetime
+            if self.backend == "whisper_cpp":
+                Path(self.wav_path).unlink(missing_ok=True)
             logger.info("Resources cleaned up")
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
@@ -10,22 +10,16 @@ Usage:
     python main.py --help       # Show help
 """
 
-import sys
-import os
 import asyncio
 import threading
-import queue
 import signal
 import argparse
 from datetime import datetime
 
-# Add src directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.utils.logger import setup_logger
-from src.input.voice_listener import create_voice_listener
-from src.brain.command_parser import CommandParser
-from src.actions.applescript_browser import AppleScriptBrowserController
+from voicenav.utils.logger import setup_logger
+from voicenav.input.voice_listener import create_voice_listener
+from voicenav.brain.command_parser import CommandParser
+from voicenav.actions.applescript_browser import AppleScriptBrowserController
 
 # Initialize logger
 logger = setup_logger("main")
@@ -46,7 +40,10 @@ class VoiceNavApp:
         self.maya = None
         self.parser = None
         self.browser = None
-        self.command_queue = queue.Queue()
+        # asyncio.Queue on the running loop; the voice thread hands commands
+        # over with call_soon_threadsafe so the processor wakes immediately
+        self.command_queue = None
+        self.loop = None
         self.is_running = False
         self.voice_thread = None
         
@@ -104,7 +101,7 @@ class VoiceNavApp:
                 
                 if result and result.get('raw_text'):
                     # Put command in queue for main thread to process
-                    self.command_queue.put(result)
+                    self.loop.call_soon_threadsafe(self.command_queue.put_nowait, result)
                 
                 # Small delay to prevent CPU spinning
                 if self.is_running:
@@ -125,33 +122,29 @@ class VoiceNavApp:
         
         while self.is_running:
             try:
-                # Check for voice commands (non-blocking)
+                # Wait for the next voice command; the timeout only bounds
+                # how long a stop request can go unnoticed
                 try:
-                    voice_result = self.command_queue.get_nowait()
+                    voice_result = await asyncio.wait_for(self.command_queue.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                
+                command_text = voice_result.get('raw_text', '').strip()
+                if command_text:
+                    logger.info(f"Processing command: '{command_text}'")
                     
-                    command_text = voice_result.get('raw_text', '').strip()
-                    if command_text:
-                        logger.info(f"Processing command: '{command_text}'")
-                        
-                        # Parse the command (Stage 2)
-                        parsed_command = self.parser.parse(command_text)
-                        
-                        logger.info(f"Parsed intent: {parsed_command['intent']}")
-                        
-                        # Execute browser action (Stage 2)
-                        success = await self.browser.execute_command(parsed_command)
-                        
-                        if success:
-                            logger.info("Command executed successfully")
-                        else:
-                            logger.warning("Command execution failed")
+                    # Parse the command (Stage 2)
+                    parsed_command = self.parser.parse(command_text)
                     
-                except queue.Empty:
-                    # No commands in queue, continue
-                    pass
-                
-                # Small async delay
-                await asyncio.sleep(0.1)
+                    logger.info(f"Parsed intent: {parsed_command['intent']}")
+                    
+                    # Execute browser action (Stage 2)
+                    success = await self.browser.execute_command(parsed_command)
+                    
+                    if success:
+                        logger.info("Command executed successfully")
+                    else:
+                        logger.warning("Command execution failed")
                 
             except Exception as e:
                 logger.error(f"Command processing error: {e}")
@@ -182,6 +175,8 @@ class VoiceNavApp:
         print("-" * 50)
         
         # Start voice listening in background thread
+        self.loop = asyncio.get_running_loop()
+        self.command_queue = asyncio.Queue()
         self.is_running = True
         self.voice_thread = threading.Thread(target=self.voice_listener_thread, daemon=True)
         self.voice_thread.start()
@@ -247,7 +242,7 @@ async def main():
 def run_menu_bar():
     """Run VoiceNav in menu bar mode (Stage 3)"""
     try:
-        from src.ui.menu_bar import VoiceNavMenuBar
+        from voicenav.ui.menu_bar import VoiceNavMenuBar
         app = VoiceNavMenuBar()
         app.run()
     except ImportError:
@@ -260,7 +255,7 @@ def run_menu_bar():
 def run_settings():
     """Run VoiceNav settings panel"""
     try:
-        from src.ui.settings_panel import VoiceNavSettingsPanel
+        from voicenav.ui.settings_panel import VoiceNavSettingsPanel
         panel = VoiceNavSettingsPanel()
         panel.run()
     except ImportError as e:
@@ -285,8 +280,13 @@ def run_voicenav():
         logger.error(f"Fatal error: {e}")
 
 
-def parse_args():
-    """Parse command line arguments"""
+def parse_args(argv=None):
+    """
+    Parse command line arguments
+    
+    Args:
+        argv (list): Arguments to parse instead of sys.argv[1:]
+    """
     parser = argparse.ArgumentParser(
         description="VoiceNav - Voice-Controlled Browser Automation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -323,7 +323,7 @@ VoiceNav Commands:
         version='VoiceNav 0.1.0 - Maya AI Assistant'
     )
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def main_entry():
@@ -7,22 +7,27 @@ import rumps
 import asyncio
 import threading
 import subprocess
-import sys
 import os
 from datetime import datetime
+from enum import IntEnum
 from typing import Optional, Dict, Any
 
-# Add src directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-from src.utils.logger import setup_logger
-from src.input.voice_listener import create_voice_listener
-from src.brain.command_parser import CommandParser
-from src.actions.applescript_browser import AppleScriptBrowserController
+from voicenav.utils.logger import setup_logger
+from voicenav.input.voice_listener import create_voice_listener
+from voicenav.brain.command_parser import CommandParser
+from voicenav.actions.applescript_browser import AppleScriptBrowserController
 
 logger = setup_logger("menu_bar")
 
 
+class VoiceState(IntEnum):
+    """Voice control pipeline states"""
+    IDLE = 0
+    LISTENING = 1
+    PROCESSING = 2
+    EXECUTING = 3
+
+
 class VoiceNavMenuBar(rumps.App):
     """
     VoiceNav Menu Bar Application
@@ -54,7 +59,7 @@ class VoiceNavMenuBar(rumps.App):
         
         # Application state
         self.is_voice_active = False
-        self.is_maya_listening = False
+        self._state = VoiceState.IDLE
         self.maya = None
         self.parser = None
         self.browser = None
@@ -196,6 +201,22 @@ class VoiceNavMenuBar(rumps.App):
         self.status_item.title = f"Status: {status}"
         logger.debug(f"Status updated: {status} ({icon_key})")
     
+    def _set_state(self, new_state: VoiceState, status: str, icon_key: str):
+        """
+        Move the voice pipeline to a new state
+        
+        The status display is only refreshed on an actual transition.
+        
+        Args:
+            new_state: Target pipeline state
+            status: Status text for the new state
+            icon_key: Icon key for the new state
+        """
+        if new_state == self._state:
+            return
+        self._state = new_state
+        self.update_status(status, icon_key)
+    
     @rumps.clicked("Start Voice Control")
     def start_voice_control(self, _):
         """Start Maya voice control system"""
@@ -295,10 +316,7 @@ class VoiceNavMenuBar(rumps.App):
         
         while self.is_voice_active:
             try:
-                # Update status to show listening
-                if not self.is_maya_listening:
-                    self.update_status("Listening for 'Hey Maya'", 'listening')
-                    self.is_maya_listening = True
+                self._set_state(VoiceState.LISTENING, "Listening for 'Hey Maya'", 'listening')
                 
                 # Listen for Maya wake word + command
                 result = self.maya.listen_once()
@@ -309,36 +327,34 @@ class VoiceNavMenuBar(rumps.App):
                     if command_text:
                         logger.info(f"Processing command: '{command_text}'")
                         
-                        # Update status to show processing
-                        self.update_status(f"Processing: {command_text[:20]}...", 'processing')
+                        self._set_state(VoiceState.PROCESSING, f"Processing: {command_text[:20]}...", 'processing')
                         
                         # Parse the command (Stage 2)
                         parsed_command = self.parser.parse(command_text)
                         
                         logger.info(f"Parsed intent: {parsed_command['intent']}")
                         
-                        # Update status to show execution
-                        self.update_status("Executing command...", 'speaking')
+                        self._set_state(VoiceState.EXECUTING, "Executing command...", 'speaking')
                         
                         # Execute browser action (Stage 2)
                         success = await self.browser.execute_command(parsed_command)
                         
                         if success:
                             logger.info("Command executed successfully")
-                            self.update_status("Command completed", 'idle')
+                            self._set_state(VoiceState.IDLE, "Command completed", 'idle')
                         else:
                             logger.warning("Command execution failed")
-                            self.update_status("Command failed", 'error')
+                            self._set_state(VoiceState.IDLE, "Command failed", 'error')
                         
                         # Brief pause before returning to listening
                         await asyncio.sleep(1)
-                        self.is_maya_listening = False
                 
                 # Small delay to prevent CPU spinning
                 await asyncio.sleep(0.1)
                 
             except Exception as e:
                 logger.error(f"Voice loop error: {e}")
+                self._state = VoiceState.IDLE
                 self.update_status("Voice Error", 'error')
                 await asyncio.sleep(1)
         
@@ -357,7 +373,7 @@ class VoiceNavMenuBar(rumps.App):
         try:
             # Stop voice system
             self.is_voice_active = False
-            self.is_maya_listening = False
+            self._state = VoiceState.IDLE
             
             # Cleanup components
             if self.maya:
@@ -443,7 +459,7 @@ class VoiceNavMenuBar(rumps.App):
         
         # Force stop everything
         self.is_voice_active = False
-        self.is_maya_listening = False
+        self._state = VoiceState.IDLE
         
         # Update status
         self.update_status("Emergency Stop", 'error')
@@ -557,8 +573,19 @@ Created for hands-free web browsing accessibility.
             
         )
         
+        # Tell a launching process (e.g. test_stage3.py) once the status item
+        # is live; the timer only fires after the event loop has started
+        if os.environ.get("VOICENAV_READY_SIGNAL"):
+            self._ready_timer = rumps.Timer(self._signal_ready, 0.1)
+            self._ready_timer.start()
+        
         # Start the rumps app (this blocks)
         super(VoiceNavMenuBar, self).run()
+    
+    def _signal_ready(self, timer):
+        """Print the READY handshake line once, then stop the timer"""
+        timer.stop()
+        print("READY", flush=True)
 
 
 def main():
@@ -3,20 +3,209 @@ VoiceNav Settings Panel
 Configuration interface for VoiceNav preferences
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import yaml
 import os
-import sys
-from typing import Dict, Any
+import copy
+import hashlib
+import io
+import json
+import functools
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
 
-# Add src directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Optional faster JSON codec for the parsed-config sidecar
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-from src.utils.logger import setup_logger
+from voicenav.utils.logger import setup_logger
 
 logger = setup_logger("settings_panel")
 
+# Tk and PyYAML are imported on first use so that importing this module
+# stays cheap; see _import_tk() and _import_yaml()
+tk = None
+ttk = None
+messagebox = None
+filedialog = None
+yaml = None
+YamlLoader = None
+YamlDumper = None
+
+
+def _import_tk():
+    """Import tkinter modules on first use"""
+    global tk, ttk, messagebox, filedialog
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, messagebox, filedialog
+
+
+def _import_yaml():
+    """Import PyYAML on first use, preferring the libyaml loader/dumper"""
+    global yaml, YamlLoader, YamlDumper
+    if yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# Repository root, resolved once (src/ui/settings_panel.py -> repo)
+_BASE_DIR = Path(__file__).resolve().parents[2]
+
+# Sentinel for config lookups that have not been cached yet
+_MISSING = object()
+
+# Parsed config cache: absolute path -> (mtime_ns, size, config)
+_YAML_CACHE_MAXLEN = 100
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+
+
+@functools.lru_cache(maxsize=1)
+def _find_config_path() -> str:
+    """Find config.yaml file, probing the filesystem only once per process"""
+    # Explicit override needs no probing at all
+    env_path = os.environ.get('VOICENAV_CONFIG')
+    if env_path:
+        return env_path
+    
+    # Try relative to the repository root
+    config_path = _BASE_DIR / "config.yaml"
+    if config_path.exists():
+        return str(config_path)
+    
+    # Current directory, or default path when it does not exist yet
+    return "config.yaml"
+
+
+def _atomic_write(path: str, data: bytes):
+    """
+    Write a file in one syscall via a temp file and atomic rename
+    
+    Args:
+        path: Destination path
+        data: Complete file contents
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # A regular file takes this in one write; loop only on short writes
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _config_digest(data: bytes) -> str:
+    """Short content hash of raw config.yaml bytes"""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _sidecar_path(config_path: str) -> str:
+    """Path of the JSON sidecar holding the parsed config"""
+    return config_path + ".cache.json"
+
+
+def _read_sidecar(config_path: str, digest: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the parsed config from the JSON sidecar
+    
+    Args:
+        config_path: Path to config.yaml file
+        digest: Content hash of the current config.yaml bytes
+    
+    Returns:
+        Parsed config, or None if the sidecar is missing or stale
+    """
+    try:
+        with open(_sidecar_path(config_path), 'rb') as f:
+            raw = f.read()
+        cached = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get('_hash') != digest:
+        return None
+    return cached.get('data')
+
+
+def _write_sidecar(config_path: str, digest: str, config: Dict[str, Any]):
+    """
+    Store the parsed config next to config.yaml as JSON
+    
+    Args:
+        config_path: Path to config.yaml file
+        digest: Content hash of the config.yaml bytes just written
+        config: Parsed configuration
+    """
+    payload = {'_hash': digest, 'data': config}
+    try:
+        raw = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode('utf-8')
+        with open(_sidecar_path(config_path), 'wb') as f:
+            f.write(raw)
+    except (OSError, TypeError) as e:
+        logger.debug(f"Config sidecar not written: {e}")
+
+
+def _read_config_cached(config_path: str) -> Dict[str, Any]:
+    """
+    Load a YAML config file, reusing the parsed result while it is unchanged
+    
+    Args:
+        config_path: Path to config.yaml file
+    
+    Returns:
+        A private copy of the parsed configuration
+    """
+    key = os.path.abspath(config_path)
+    st = os.stat(key)
+    
+    entry = _YAML_CACHE.get(key)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(entry[2])
+    
+    with open(key, 'rb') as f:
+        data = f.read()
+    
+    # The sidecar is only trusted when it was written for these exact bytes
+    config = _read_sidecar(key, _config_digest(data))
+    if config is None:
+        _import_yaml()
+        config = yaml.load(data, Loader=YamlLoader) or {}
+    
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAXLEN:
+        _YAML_CACHE.popitem(last=False)
+    
+    # Callers mutate their config, so never hand out the cached object
+    return copy.deepcopy(config)
+
+
+def _schema_defaults(schema, base: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a nested default config from a settings schema
+    
+    Args:
+        schema: Settings schema rows
+        base: Sections that are not part of the schema
+    
+    Returns:
+        Nested config dict
+    """
+    defaults = copy.deepcopy(base)
+    for _, _, _, _, path, default, _, _ in schema:
+        section, name = path.split('.', 1)
+        defaults.setdefault(section, {})[name] = default
+    return defaults
+
 
 class VoiceNavSettingsPanel:
     """
@@ -30,6 +219,68 @@ class VoiceNavSettingsPanel:
     - Advanced options
     """
     
+    # Fixed attribute set; no per-instance __dict__
+    __slots__ = ('config_path', 'config', '_cfg_cache', 'root', 'vars', '_tab_builders', '_dirty')
+    
+    # One row per setting:
+    # (tab, var key, label, tk variable class name, config path, default, widget, widget options)
+    _SETTINGS_SCHEMA = (
+        ('voice', 'wake_word', "Wake Word:", 'StringVar', 'voice.wake_word', 'Hey Maya',
+         'entry', {'width': 30}),
+        ('voice', 'recognizer', "Recognition Engine:", 'StringVar', 'voice.recognizer', 'whisper',
+         'combo', {'values': ['whisper', 'google', 'enhanced'], 'state': 'readonly'}),
+        ('voice', 'whisper_model', "Whisper Model:", 'StringVar', 'voice.whisper_model', 'base',
+         'combo', {'values': ['tiny', 'base', 'small', 'medium', 'large'], 'state': 'readonly'}),
+        ('voice', 'timeout', "Command Timeout (seconds):", 'IntVar', 'voice.timeout', 5,
+         'spin', {'from_': 1, 'to': 30, 'width': 10}),
+        ('voice', 'language', "Language:", 'StringVar', 'voice.language', 'en-US',
+         'combo', {'values': ['en-US', 'en-GB', 'es-ES', 'fr-FR', 'de-DE'], 'state': 'readonly'}),
+        
+        ('audio', 'tts_engine', "Text-to-Speech Engine:", 'StringVar', 'tts.engine', 'macos_say',
+         'combo', {'values': ['macos_say', 'pyttsx3', 'edge_tts'], 'state': 'readonly'}),
+        ('audio', 'voice', "Maya Voice:", 'StringVar', 'tts.voice', 'Samantha',
+         'combo', {'values': ['Samantha', 'Alex', 'Victoria', 'Allison', 'Ava'], 'state': 'readonly'}),
+        ('audio', 'rate', "Speech Rate:", 'IntVar', 'tts.rate', 150,
+         'scale', {'from_': 50, 'to': 300, 'orient': 'horizontal'}),
+        ('audio', 'volume', "Volume:", 'DoubleVar', 'tts.volume', 1.0,
+         'scale', {'from_': 0.0, 'to': 1.0, 'orient': 'horizontal'}),
+        
+        ('browser', 'browser', "Default Browser:", 'StringVar', 'browser.default', 'auto',
+         'combo', {'values': ['auto', 'safari', 'chrome', 'firefox'], 'state': 'readonly'}),
+        ('browser', 'browser_timeout', "Browser Timeout (seconds):", 'IntVar', 'browser.timeout', 30,
+         'spin', {'from_': 5, 'to': 120, 'width': 10}),
+        ('browser', 'control_method', "Browser Control Method:", 'StringVar', 'browser.method', 'applescript',
+         'combo', {'values': ['applescript', 'playwright'], 'state': 'readonly'}),
+        
+        ('interface', 'show_notifications', "Show Notifications", 'BooleanVar', 'ui.show_notifications', True,
+         'check', {}),
+        ('interface', 'auto_start', "Start with macOS", 'BooleanVar', 'ui.auto_start', False,
+         'check', {}),
+        ('interface', 'minimize_to_tray', "Minimize to Menu Bar", 'BooleanVar', 'ui.minimize_to_tray', True,
+         'check', {}),
+        ('interface', 'icon_style', "Menu Bar Icon Style:", 'StringVar', 'ui.icon_style', 'emoji',
+         'combo', {'values': ['emoji', 'text', 'minimal'], 'state': 'readonly'}),
+        
+        ('advanced', 'log_level', "Logging Level:", 'StringVar', 'logging.level', 'INFO',
+         'combo', {'values': ['DEBUG', 'INFO', 'WARNING', 'ERROR'], 'state': 'readonly'}),
+    )
+    
+    # Default config: app metadata plus every schema default, built once
+    _DEFAULTS = _schema_defaults(_SETTINGS_SCHEMA, {
+        'app': {
+            'name': 'VoiceNav',
+            'version': '0.1.0'
+        }
+    })
+    
+    # Widget kind -> (ttk widget class name, variable option, grid sticky)
+    _WIDGETS = {
+        'entry': ('Entry', 'textvariable', ''),
+        'combo': ('Combobox', 'textvariable', ''),
+        'spin': ('Spinbox', 'textvariable', ''),
+        'scale': ('Scale', 'variable', 'ew'),
+    }
+    
     def __init__(self, config_path: str = None):
         """
         Initialize settings panel
@@ -37,8 +288,11 @@ class VoiceNavSettingsPanel:
         Args:
             config_path: Path to config.yaml file
         """
-        self.config_path = config_path or self._find_config_path()
+        _import_tk()
+        
+        self.config_path = config_path or _find_config_path()
         self.config = self._load_config()
+        self._cfg_cache = {}
         
         # Create main window
         self.root = tk.Tk()
@@ -46,36 +300,23 @@ class VoiceNavSettingsPanel:
         self.root.geometry("600x500")
         self.root.resizable(True, True)
         
-        # Variables for settings
+        # Variables for settings, created together up front
         self.vars = {}
+        self._create_vars()
         
         # Create UI
         self._create_ui()
         
-        logger.info("Settings panel initialized")
-    
-    def _find_config_path(self) -> str:
-        """Find config.yaml file"""
-        # Try relative to this file
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        config_path = os.path.join(base_dir, "config.yaml")
-        
-        if os.path.exists(config_path):
-            return config_path
+        # Nothing to save until a setting is edited
+        self._dirty = False
         
-        # Try current directory
-        if os.path.exists("config.yaml"):
-            return "config.yaml"
-        
-        # Default path
-        return "config.yaml"
+        logger.info("Settings panel initialized")
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                return _read_config_cached(self.config_path)
             else:
                 logger.warning(f"Config file not found: {self.config_path}")
                 return self._default_config()
@@ -83,36 +324,50 @@ class VoiceNavSettingsPanel:
             logger.error(f"Failed to load config: {e}")
             return self._default_config()
     
-    def _default_config(self) -> Dict[str, Any]:
+    def _cfg(self, path: str, default: Any = None) -> Any:
+        """
+        Look up a dotted config path such as 'voice.wake_word'
+        
+        Results are memoized until the config is reset or saved.
+        
+        Args:
+            path: Dotted path of section and key
+            default: Value used when the path is missing
+        
+        Returns:
+            Configured value or default
+        """
+        value = self._cfg_cache.get(path, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        value = self.config
+        for part in path.split('.'):
+            if not isinstance(value, dict) or part not in value:
+                value = default
+                break
+            value = value[part]
+        
+        self._cfg_cache[path] = value
+        return value
+    
+    @staticmethod
+    def _default_config() -> Dict[str, Any]:
         """Return default configuration"""
-        return {
-            'app': {
-                'name': 'VoiceNav',
-                'version': '0.1.0'
-            },
-            'voice': {
-                'wake_word': 'Hey Maya',
-                'timeout': 5,
-                'language': 'en-US',
-                'recognizer': 'whisper',
-                'whisper_model': 'base'
-            },
-            'tts': {
-                'engine': 'macos_say',
-                'voice': 'Samantha',
-                'rate': 150,
-                'volume': 1.0
-            },
-            'browser': {
-                'default': 'auto',
-                'timeout': 30
-            },
-            'ui': {
-                'show_notifications': True,
-                'auto_start': False,
-                'minimize_to_tray': True
-            }
-        }
+        return copy.deepcopy(VoiceNavSettingsPanel._DEFAULTS)
+    
+    def _create_vars(self):
+        """Create one named tk variable per schema row, initialized from config"""
+        for _, key, _, var_type, path, default, _, _ in self._SETTINGS_SCHEMA:
+            # Passing value= initializes the Tcl variable in a single call
+            self.vars[key] = getattr(tk, var_type)(
+                master=self.root, value=self._cfg(path, default), name=f"voicenav_{key}"
+            )
+            self.vars[key].trace_add('write', self._mark_dirty)
+    
+    def _mark_dirty(self, *args):
+        """Record that a setting changed since the last save"""
+        self._dirty = True
     
     def _create_ui(self):
         """Create the settings user interface"""
@@ -121,175 +376,103 @@ class VoiceNavSettingsPanel:
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Voice Recognition Tab
-        self._create_voice_tab(notebook)
-        
-        # Audio & TTS Tab
-        self._create_audio_tab(notebook)
-        
-        # Browser Tab
-        self._create_browser_tab(notebook)
-        
-        # Interface Tab
-        self._create_interface_tab(notebook)
-        
-        # Advanced Tab
-        self._create_advanced_tab(notebook)
+        # Tabs are added empty and only filled in when first selected
+        tabs = [
+            ("Voice Recognition", self._create_voice_tab),
+            ("Audio & Voice", self._create_audio_tab),
+            ("Browser", self._create_browser_tab),
+            ("Interface", self._create_interface_tab),
+            ("Advanced", self._create_advanced_tab),
+        ]
+        self._tab_builders = {}
+        for title, builder in tabs:
+            frame = ttk.Frame(notebook)
+            notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = (frame, builder)
+        
+        # Build the initially visible tab right away
+        self._ensure_tab(notebook.select())
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Buttons frame
         self._create_buttons()
     
-    def _create_voice_tab(self, notebook):
-        """Create voice recognition settings tab"""
-        voice_frame = ttk.Frame(notebook)
-        notebook.add(voice_frame, text="Voice Recognition")
-        
-        # Wake word setting
-        ttk.Label(voice_frame, text="Wake Word:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.vars['wake_word'] = tk.StringVar(value=self.config.get('voice', {}).get('wake_word', 'Hey Maya'))
-        wake_word_entry = ttk.Entry(voice_frame, textvariable=self.vars['wake_word'], width=30)
-        wake_word_entry.grid(row=0, column=1, padx=5, pady=5)
-        
-        # Recognition engine
-        ttk.Label(voice_frame, text="Recognition Engine:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.vars['recognizer'] = tk.StringVar(value=self.config.get('voice', {}).get('recognizer', 'whisper'))
-        recognizer_combo = ttk.Combobox(voice_frame, textvariable=self.vars['recognizer'], 
-                                       values=['whisper', 'google', 'enhanced'], state='readonly')
-        recognizer_combo.grid(row=1, column=1, padx=5, pady=5)
+    def _on_tab_changed(self, event):
+        """Build a notebook tab the first time it is selected"""
+        self._ensure_tab(event.widget.select())
+    
+    def _ensure_tab(self, tab_name):
+        """Fill in a notebook tab unless it was already built"""
+        entry = self._tab_builders.pop(str(tab_name), None)
+        if entry:
+            frame, builder = entry
+            builder(frame)
+    
+    def _build_tab(self, frame, tab: str) -> int:
+        """
+        Create the schema-driven settings widgets of one tab
         
-        # Whisper model
-        ttk.Label(voice_frame, text="Whisper Model:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        self.vars['whisper_model'] = tk.StringVar(value=self.config.get('voice', {}).get('whisper_model', 'base'))
-        model_combo = ttk.Combobox(voice_frame, textvariable=self.vars['whisper_model'],
-                                  values=['tiny', 'base', 'small', 'medium', 'large'], state='readonly')
-        model_combo.grid(row=2, column=1, padx=5, pady=5)
+        Args:
+            frame: Tab frame to place widgets in
+            tab: Tab name used in _SETTINGS_SCHEMA
         
-        # Timeout
-        ttk.Label(voice_frame, text="Command Timeout (seconds):").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        self.vars['timeout'] = tk.IntVar(value=self.config.get('voice', {}).get('timeout', 5))
-        timeout_spin = ttk.Spinbox(voice_frame, from_=1, to=30, textvariable=self.vars['timeout'], width=10)
-        timeout_spin.grid(row=3, column=1, padx=5, pady=5)
+        Returns:
+            Next free grid row
+        """
+        row = 0
+        for field_tab, key, label, _, _, _, kind, options in self._SETTINGS_SCHEMA:
+            if field_tab != tab:
+                continue
+            
+            if kind == 'check':
+                # Checkbuttons carry their own label
+                ttk.Checkbutton(frame, text=label, variable=self.vars[key], **options).grid(
+                    row=row, column=0, sticky="w", padx=5, pady=5)
+            else:
+                ttk.Label(frame, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=5)
+                widget_name, var_option, sticky = self._WIDGETS[kind]
+                widget = getattr(ttk, widget_name)(frame, **{var_option: self.vars[key]}, **options)
+                widget.grid(row=row, column=1, padx=5, pady=5, sticky=sticky)
+            
+            row += 1
         
-        # Language
-        ttk.Label(voice_frame, text="Language:").grid(row=4, column=0, sticky="w", padx=5, pady=5)
-        self.vars['language'] = tk.StringVar(value=self.config.get('voice', {}).get('language', 'en-US'))
-        lang_combo = ttk.Combobox(voice_frame, textvariable=self.vars['language'],
-                                 values=['en-US', 'en-GB', 'es-ES', 'fr-FR', 'de-DE'], state='readonly')
-        lang_combo.grid(row=4, column=1, padx=5, pady=5)
-    
-    def _create_audio_tab(self, notebook):
+        return row
+    
+    def _create_voice_tab(self, voice_frame):
+        """Create voice recognition settings tab"""
+        self._build_tab(voice_frame, 'voice')
+    
+    def _create_audio_tab(self, audio_frame):
         """Create audio and TTS settings tab"""
-        audio_frame = ttk.Frame(notebook)
-        notebook.add(audio_frame, text="Audio & Voice")
-        
-        # TTS Engine
-        ttk.Label(audio_frame, text="Text-to-Speech Engine:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.vars['tts_engine'] = tk.StringVar(value=self.config.get('tts', {}).get('engine', 'macos_say'))
-        tts_combo = ttk.Combobox(audio_frame, textvariable=self.vars['tts_engine'],
-                                values=['macos_say', 'pyttsx3', 'edge_tts'], state='readonly')
-        tts_combo.grid(row=0, column=1, padx=5, pady=5)
-        
-        # Voice selection
-        ttk.Label(audio_frame, text="Maya Voice:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.vars['voice'] = tk.StringVar(value=self.config.get('tts', {}).get('voice', 'Samantha'))
-        voice_combo = ttk.Combobox(audio_frame, textvariable=self.vars['voice'],
-                                  values=['Samantha', 'Alex', 'Victoria', 'Allison', 'Ava'], state='readonly')
-        voice_combo.grid(row=1, column=1, padx=5, pady=5)
-        
-        # Speech rate
-        ttk.Label(audio_frame, text="Speech Rate:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        self.vars['rate'] = tk.IntVar(value=self.config.get('tts', {}).get('rate', 150))
-        rate_scale = ttk.Scale(audio_frame, from_=50, to=300, variable=self.vars['rate'], orient=tk.HORIZONTAL)
-        rate_scale.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
-        
-        # Volume
-        ttk.Label(audio_frame, text="Volume:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        self.vars['volume'] = tk.DoubleVar(value=self.config.get('tts', {}).get('volume', 1.0))
-        volume_scale = ttk.Scale(audio_frame, from_=0.0, to=1.0, variable=self.vars['volume'], orient=tk.HORIZONTAL)
-        volume_scale.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
+        row = self._build_tab(audio_frame, 'audio')
         
         # Test voice button
         test_button = ttk.Button(audio_frame, text="Test Maya Voice", command=self._test_voice)
-        test_button.grid(row=4, column=1, padx=5, pady=10)
+        test_button.grid(row=row, column=1, padx=5, pady=10)
     
-    def _create_browser_tab(self, notebook):
+    def _create_browser_tab(self, browser_frame):
         """Create browser settings tab"""
-        browser_frame = ttk.Frame(notebook)
-        notebook.add(browser_frame, text="Browser")
-        
-        # Default browser
-        ttk.Label(browser_frame, text="Default Browser:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.vars['browser'] = tk.StringVar(value=self.config.get('browser', {}).get('default', 'auto'))
-        browser_combo = ttk.Combobox(browser_frame, textvariable=self.vars['browser'],
-                                    values=['auto', 'safari', 'chrome', 'firefox'], state='readonly')
-        browser_combo.grid(row=0, column=1, padx=5, pady=5)
-        
-        # Browser timeout
-        ttk.Label(browser_frame, text="Browser Timeout (seconds):").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.vars['browser_timeout'] = tk.IntVar(value=self.config.get('browser', {}).get('timeout', 30))
-        timeout_spin = ttk.Spinbox(browser_frame, from_=5, to=120, textvariable=self.vars['browser_timeout'], width=10)
-        timeout_spin.grid(row=1, column=1, padx=5, pady=5)
-        
-        # AppleScript vs Playwright
-        ttk.Label(browser_frame, text="Browser Control Method:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        self.vars['control_method'] = tk.StringVar(value=self.config.get('browser', {}).get('method', 'applescript'))
-        method_combo = ttk.Combobox(browser_frame, textvariable=self.vars['control_method'],
-                                   values=['applescript', 'playwright'], state='readonly')
-        method_combo.grid(row=2, column=1, padx=5, pady=5)
-    
-    def _create_interface_tab(self, notebook):
+        self._build_tab(browser_frame, 'browser')
+    
+    def _create_interface_tab(self, ui_frame):
         """Create interface settings tab"""
-        ui_frame = ttk.Frame(notebook)
-        notebook.add(ui_frame, text="Interface")
-        
-        # Notifications
-        self.vars['show_notifications'] = tk.BooleanVar(value=self.config.get('ui', {}).get('show_notifications', True))
-        notifications_check = ttk.Checkbutton(ui_frame, text="Show Notifications", 
-                                             variable=self.vars['show_notifications'])
-        notifications_check.grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        
-        # Auto start
-        self.vars['auto_start'] = tk.BooleanVar(value=self.config.get('ui', {}).get('auto_start', False))
-        autostart_check = ttk.Checkbutton(ui_frame, text="Start with macOS", 
-                                         variable=self.vars['auto_start'])
-        autostart_check.grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        
-        # Minimize to tray
-        self.vars['minimize_to_tray'] = tk.BooleanVar(value=self.config.get('ui', {}).get('minimize_to_tray', True))
-        minimize_check = ttk.Checkbutton(ui_frame, text="Minimize to Menu Bar", 
-                                        variable=self.vars['minimize_to_tray'])
-        minimize_check.grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        
-        # Menu bar icon
-        ttk.Label(ui_frame, text="Menu Bar Icon Style:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        self.vars['icon_style'] = tk.StringVar(value=self.config.get('ui', {}).get('icon_style', 'emoji'))
-        icon_combo = ttk.Combobox(ui_frame, textvariable=self.vars['icon_style'],
-                                 values=['emoji', 'text', 'minimal'], state='readonly')
-        icon_combo.grid(row=3, column=1, padx=5, pady=5)
-    
-    def _create_advanced_tab(self, notebook):
+        self._build_tab(ui_frame, 'interface')
+    
+    def _create_advanced_tab(self, advanced_frame):
         """Create advanced settings tab"""
-        advanced_frame = ttk.Frame(notebook)
-        notebook.add(advanced_frame, text="Advanced")
-        
-        # Logging level
-        ttk.Label(advanced_frame, text="Logging Level:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.vars['log_level'] = tk.StringVar(value=self.config.get('logging', {}).get('level', 'INFO'))
-        log_combo = ttk.Combobox(advanced_frame, textvariable=self.vars['log_level'],
-                                values=['DEBUG', 'INFO', 'WARNING', 'ERROR'], state='readonly')
-        log_combo.grid(row=0, column=1, padx=5, pady=5)
+        row = self._build_tab(advanced_frame, 'advanced')
         
         # Config file path
-        ttk.Label(advanced_frame, text="Config File:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        ttk.Label(advanced_frame, text=self.config_path, foreground="gray").grid(row=1, column=1, sticky="w", padx=5, pady=5)
+        ttk.Label(advanced_frame, text="Config File:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        ttk.Label(advanced_frame, text=self.config_path, foreground="gray").grid(row=row, column=1, sticky="w", padx=5, pady=5)
         
         # Raw config editor button
         edit_button = ttk.Button(advanced_frame, text="Edit Raw Config", command=self._edit_raw_config)
-        edit_button.grid(row=2, column=1, padx=5, pady=10)
+        edit_button.grid(row=row + 1, column=1, padx=5, pady=10)
         
         # Reset to defaults button
         reset_button = ttk.Button(advanced_frame, text="Reset to Defaults", command=self._reset_defaults)
-        reset_button.grid(row=3, column=1, padx=5, pady=5)
+        reset_button.grid(row=row + 2, column=1, padx=5, pady=5)
     
     def _create_buttons(self):
         """Create action buttons"""
@@ -329,36 +512,16 @@ class VoiceNavSettingsPanel:
         """Reset all settings to defaults"""
         if messagebox.askyesno("Reset Settings", "Reset all settings to defaults? This cannot be undone."):
             self.config = self._default_config()
+            self._cfg_cache.clear()
             self._update_ui_from_config()
+            # Defaults differ from the file on disk even if no variable changed
+            self._dirty = True
     
     def _update_ui_from_config(self):
         """Update UI elements from current config"""
-        # Voice settings
-        self.vars['wake_word'].set(self.config.get('voice', {}).get('wake_word', 'Hey Maya'))
-        self.vars['recognizer'].set(self.config.get('voice', {}).get('recognizer', 'whisper'))
-        self.vars['whisper_model'].set(self.config.get('voice', {}).get('whisper_model', 'base'))
-        self.vars['timeout'].set(self.config.get('voice', {}).get('timeout', 5))
-        self.vars['language'].set(self.config.get('voice', {}).get('language', 'en-US'))
-        
-        # Audio settings
-        self.vars['tts_engine'].set(self.config.get('tts', {}).get('engine', 'macos_say'))
-        self.vars['voice'].set(self.config.get('tts', {}).get('voice', 'Samantha'))
-        self.vars['rate'].set(self.config.get('tts', {}).get('rate', 150))
-        self.vars['volume'].set(self.config.get('tts', {}).get('volume', 1.0))
-        
-        # Browser settings
-        self.vars['browser'].set(self.config.get('browser', {}).get('default', 'auto'))
-        self.vars['browser_timeout'].set(self.config.get('browser', {}).get('timeout', 30))
-        self.vars['control_method'].set(self.config.get('browser', {}).get('method', 'applescript'))
-        
-        # UI settings
-        self.vars['show_notifications'].set(self.config.get('ui', {}).get('show_notifications', True))
-        self.vars['auto_start'].set(self.config.get('ui', {}).get('auto_start', False))
-        self.vars['minimize_to_tray'].set(self.config.get('ui', {}).get('minimize_to_tray', True))
-        self.vars['icon_style'].set(self.config.get('ui', {}).get('icon_style', 'emoji'))
-        
-        # Advanced settings
-        self.vars['log_level'].set(self.config.get('logging', {}).get('level', 'INFO'))
+        # Variables outlive widgets, so unbuilt tabs pick these values up too
+        for _, key, _, _, path, default, _, _ in self._SETTINGS_SCHEMA:
+            self.vars[key].set(self._cfg(path, default))
     
     def _apply_settings(self):
         """Apply settings without closing"""
@@ -374,45 +537,31 @@ class VoiceNavSettingsPanel:
         """Cancel without saving"""
         self.root.destroy()
     
+    def _rebuild_config_from_vars(self):
+        """Copy UI values into self.config"""
+        for _, key, _, _, path, _, _, _ in self._SETTINGS_SCHEMA:
+            section, name = path.split('.', 1)
+            self.config.setdefault(section, {})[name] = self.vars[key].get()
+        self._cfg_cache.clear()
+    
     def _save_config(self):
         """Save current settings to config file"""
+        if not self._dirty:
+            logger.debug("No settings changed, skipping save")
+            return
+        
         try:
-            # Update config from UI
-            self.config['voice'] = {
-                'wake_word': self.vars['wake_word'].get(),
-                'recognizer': self.vars['recognizer'].get(),
-                'whisper_model': self.vars['whisper_model'].get(),
-                'timeout': self.vars['timeout'].get(),
-                'language': self.vars['language'].get()
-            }
-            
-            self.config['tts'] = {
-                'engine': self.vars['tts_engine'].get(),
-                'voice': self.vars['voice'].get(),
-                'rate': self.vars['rate'].get(),
-                'volume': self.vars['volume'].get()
-            }
-            
-            self.config['browser'] = {
-                'default': self.vars['browser'].get(),
-                'timeout': self.vars['browser_timeout'].get(),
-                'method': self.vars['control_method'].get()
-            }
-            
-            self.config['ui'] = {
-                'show_notifications': self.vars['show_notifications'].get(),
-                'auto_start': self.vars['auto_start'].get(),
-                'minimize_to_tray': self.vars['minimize_to_tray'].get(),
-                'icon_style': self.vars['icon_style'].get()
-            }
-            
-            if 'logging' not in self.config:
-                self.config['logging'] = {}
-            self.config['logging']['level'] = self.vars['log_level'].get()
+            self._rebuild_config_from_vars()
             
             # Save to file
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+            _import_yaml()
+            buf = io.BytesIO()
+            yaml.dump(self.config, buf, Dumper=YamlDumper, default_flow_style=False, indent=2,
+                      encoding='utf-8')
+            data = buf.getvalue()
+            _atomic_write(self.config_path, data)
+            _write_sidecar(self.config_path, _config_digest(data), self.config)
+            self._dirty = False
             
             logger.info(f"Settings saved to {self.config_path}")
             
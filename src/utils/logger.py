@@ -1,15 +1,69 @@
 """
 Logger utility for VoiceNav application
 """
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 
+# Shared formatter; the format never varies between loggers
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Names of loggers already wired up by setup_logger
+_CONFIGURED = set()
+
+# Resolved log file -> (record queue, background listener writing it)
+_LISTENERS = {}
+
+
+def _get_log_queue(log_file: str) -> queue.Queue:
+    """
+    Return the record queue drained by the background writer for a log file.
+    
+    The console and rotating file handlers live on a QueueListener thread,
+    so callers only pay for an enqueue instead of a locked disk write.
+    
+    Args:
+        log_file: Path to log file
+    
+    Returns:
+        Queue to attach a QueueHandler to
+    """
+    key = str(Path(log_file).resolve())
+    if key not in _LISTENERS:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_FORMATTER)
+        
+        file_handler = logging.handlers.RotatingFileHandler(
+            key,
+            maxBytes=10485760,  # 10MB
+            backupCount=5
+        )
+        file_handler.setFormatter(_FORMATTER)
+        
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        # Flush pending records on interpreter shutdown
+        atexit.register(listener.stop)
+        _LISTENERS[key] = (log_queue, listener)
+    
+    return _LISTENERS[key][0]
+
 
 def setup_logger(name: str = "voicenav", log_level: str = "INFO", log_file: str = "voicenav.log"):
     """
-    Set up a logger with both file and console handlers.
+    Set up a logger whose records reach file and console handlers through a queue.
+    
+    Repeated calls for the same name return the already configured logger
+    instead of stacking another handler on it.
     
     Args:
         name: Logger name
@@ -20,29 +74,21 @@ def setup_logger(name: str = "voicenav", log_level: str = "INFO", log_file: str
         Logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    log_path = Path(log_file)
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_path,
-        maxBytes=10485760,  # 10MB
-        backupCount=5
-    )
-    file_handler.setLevel(getattr(logging, log_level.upper()))
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
+    # The module may be imported under two names (src.utils / utils), so
+    # also trust handlers already attached to the shared logger registry
+    if name in _CONFIGURED or logger.handlers:
+        _CONFIGURED.add(name)
+        return logger
+    
+    level = logging.getLevelNamesMapping().get(log_level.upper(), logging.INFO)
+    logger.setLevel(level)
+    logger.propagate = False
+    
+    # Console and file output are written by the shared listener thread
+    queue_handler = logging.handlers.QueueHandler(_get_log_queue(log_file))
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+    
+    _CONFIGURED.add(name)
     return logger
@@ -0,0 +1,67 @@
+"""
+Short-lived record of successful microphone/Whisper probes for VoiceNav
+
+Test scripts run back to back (e.g. from test_stage1.py) would otherwise
+re-open the microphone and re-run recognition checks that just passed.
+The cache is opt-in: it does nothing unless VOICENAV_PROBE_CACHE=1, so the
+app itself always runs its checks.
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+PROBE_FILE = Path.home() / ".cache" / "voicenav" / "probe.json"
+PROBE_MAX_AGE = 60  # seconds
+
+
+def _enabled() -> bool:
+    return os.environ.get('VOICENAV_PROBE_CACHE') == '1'
+
+
+def _read_probes() -> dict:
+    try:
+        return json.loads(PROBE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def probe_passed(name: str) -> bool:
+    """
+    Check whether a probe succeeded within the last PROBE_MAX_AGE seconds.
+
+    Args:
+        name: Probe name, e.g. "mic_ok" or "whisper_ok"
+
+    Returns:
+        True if the cache is enabled and a recent success is on record
+    """
+    if not _enabled():
+        return False
+    passed_at = _read_probes().get(name)
+    return isinstance(passed_at, (int, float)) and time.time() - passed_at < PROBE_MAX_AGE
+
+
+def record_probe(name: str, ok: bool):
+    """
+    Record a probe result; any failure invalidates every recorded probe.
+
+    Does nothing unless the cache is enabled.
+
+    Args:
+        name: Probe name, e.g. "mic_ok" or "whisper_ok"
+        ok: Whether the probe succeeded
+    """
+    if not _enabled():
+        return
+    try:
+        if not ok:
+            PROBE_FILE.unlink(missing_ok=True)
+            return
+
+        probes = _read_probes()
+        probes[name] = time.time()
+        PROBE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PROBE_FILE.write_text(json.dumps(probes))
+    except OSError:
+        pass
@@ -0,0 +1,26 @@
+"""
+Cached host information for VoiceNav
+
+Some platform lookups spawn a child process (platform.processor() runs
+`uname -p` on macOS), so each value is computed once per process.
+"""
+import functools
+import platform
+
+
+@functools.lru_cache(maxsize=1)
+def platform_name() -> str:
+    """Return platform.platform(), computed once"""
+    return platform.platform()
+
+
+@functools.lru_cache(maxsize=1)
+def processor() -> str:
+    """Return platform.processor(), computed once"""
+    return platform.processor()
+
+
+@functools.lru_cache(maxsize=1)
+def machine() -> str:
+    """Return platform.machine(), computed once"""
+    return platform.machine()
@@ -5,13 +5,19 @@ Tests native macOS browser control via AppleScript
 """
 
 import sys
-import os
 import asyncio
 
-# Add src directory to path
-sys.path.append('src')
+from voicenav.actions.applescript_browser import AppleScriptBrowserController
 
-from actions.applescript_browser import AppleScriptBrowserController
+
+async def run_in_thread(method, *args):
+    """
+    Run an async controller method in a worker thread
+    
+    AppleScriptBrowserController's coroutines call osascript synchronously,
+    so they only overlap with each other when run on separate threads.
+    """
+    return await asyncio.to_thread(asyncio.run, method(*args))
 
 
 async def test_applescript_browser():
@@ -66,9 +72,14 @@ async def test_applescript_browser():
         # Wait for user to see result
         input("\nPress ENTER to continue to next test...")
         
-        # Test 2: Scroll down
+        # Tests 2 and 3 are independent, so run them concurrently. The
+        # controller's osascript calls block, hence one worker thread each.
         print(f"\n📜 Test 2: Scrolling down...")
-        success2 = await controller.scroll_page('down', 300)
+        print(f"📖 Test 3: Reading page title...")
+        success2, success3 = await asyncio.gather(
+            run_in_thread(controller.scroll_page, 'down', 300),
+            run_in_thread(controller.read_content, 'title')
+        )
         
         if success2:
             print("✅ Successfully scrolled down")
@@ -76,19 +87,15 @@ async def test_applescript_browser():
         else:
             print("❌ Failed to scroll")
         
-        # Wait for user to see result
-        input("\nPress ENTER to continue to next test...")
-        
-        # Test 3: Read page title
-        print(f"\n📖 Test 3: Reading page title...")
-        success3 = await controller.read_content('title')
-        
         if success3:
             print("✅ Successfully read page title")
             print("   (Maya should have spoken the page title)")
         else:
             print("❌ Failed to read page title")
         
+        # Wait for user to see result
+        input("\nPress ENTER to continue to next test...")
+        
         # Test 4: Go back (if there's history)
         print(f"\n⬅️ Test 4: Testing go back...")
         success4 = await controller.go_back()
@@ -159,8 +166,8 @@ async def test_command_integration():
     
     try:
         # Import all components
-        from input.voice_listener import create_voice_listener
-        from brain.command_parser import CommandParser
+        from voicenav.input.voice_listener import create_voice_listener
+        from voicenav.brain.command_parser import CommandParser
         
         print("🎤 Initializing Maya...")
         maya = create_voice_listener(wake_word="hey maya")
@@ -213,24 +220,31 @@ async def test_command_integration():
         return False
 
 
+async def run_all_tests():
+    """Run browser control test, then the pipeline test if it passed"""
+    browser_success = await test_applescript_browser()
+    
+    if not browser_success:
+        return False
+    
+    return await test_command_integration()
+
+
 def main():
     """Run AppleScript browser tests"""
     print("🧪 VoiceNav AppleScript Browser - Test Suite")
     print("=" * 60)
     
     try:
-        # Run browser control test
-        browser_success = asyncio.run(test_applescript_browser())
-        
-        if browser_success:
-            # Run integration test
-            integration_success = asyncio.run(test_command_integration())
-            
-            if integration_success:
-                print("\n🎉 ALL TESTS PASSED!")
-                print("✅ Stage 2 browser control is working!")
-                print("✅ Maya can control your browser!")
-                return True
+        # One event loop for both tests instead of one asyncio.run() each
+        with asyncio.Runner() as runner:
+            all_success = runner.run(run_all_tests())
+        
+        if all_success:
+            print("\n🎉 ALL TESTS PASSED!")
+            print("✅ Stage 2 browser control is working!")
+            print("✅ Maya can control your browser!")
+            return True
         
         print("\n⚠️  Some tests failed")
         return False
@@ -4,11 +4,17 @@ Test assistant names that work well with different accents
 Focus on phonetically simple names
 """
 
-import whisper
-import pyaudio
-import wave
-import tempfile
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+import numpy as np
+import ahocorasick
+import sounddevice as sd
+import threading
+import _thread
+import queue
 import os
+import sys
+
+from whisper_runtime import transcribe_batch
 
 print("🎤 Assistant Name Testing - Accent-Friendly Options")
 print("=" * 65)
@@ -42,8 +48,9 @@ assistant_names = [
     "hey ocean",       # Open vowels, peaceful
 ]
 
-print("🧠 Loading Whisper...")
-model = whisper.load_model("base")
+print("🧠 Loading Whisper (faster-whisper, int8)...")
+model = WhisperModel("base", device="cpu", compute_type="int8", cpu_threads=os.cpu_count())
+batched_model = BatchedInferencePipeline(model=model)
 print("✅ Ready!")
 print()
 
@@ -60,118 +67,133 @@ print("   • No complex letter combinations")
 print()
 
 # Audio settings
-CHUNK = 1024
-FORMAT = pyaudio.paInt16
 CHANNELS = 1
 RATE = 16000
-audio = pyaudio.PyAudio()
+MAX_SECS = 30  # Longest recording kept per name
+
+# Result code per name: -1 untested, 0 failed, 1 partial, 2 all words, 3 perfect
+RESULT_CODES = {"NO_AUDIO": 0, "FAILED": 0, "PARTIAL": 1, "ALL_WORDS": 2, "PERFECT": 3}
+RESULT_LINES = [
+    "❌ FAILED:      '{}' - Not recognized",
+    "⚡ PARTIAL:     '{}' - Some recognition",
+    "✅ EXCELLENT:   '{}' - All words recognized!",
+    "🎉 PERFECT:     '{}' - Exact match!",
+]
+codes = np.full(len(assistant_names), -1, dtype=np.int8)
+recordings = []  # (name index, float32 samples) awaiting transcription
+
+
+# One automaton over every name word, so each transcription is scanned once
+name_matcher = ahocorasick.Automaton()
+for assistant_name in assistant_names:
+    for word in assistant_name.split():
+        name_matcher.add_word(word, word)
+name_matcher.make_automaton()
+
+
+RECOGNITION_MESSAGES = {
+    "PERFECT": "🎉 PERFECT MATCH!",
+    "ALL_WORDS": "✅ ALL WORDS RECOGNIZED!",
+    "PARTIAL": "⚡ PARTIAL RECOGNITION",
+    "FAILED": "❌ NOT RECOGNIZED",
+}
+
+
+def check_recognition(name, text):
+    """Classify how well Whisper recognized an assistant name"""
+    name_clean = name.lower()
+    name_words = set(name_clean.split())
+    hits = {word for _, word in name_matcher.iter(text)}
+    
+    if name_clean in text:
+        return "PERFECT"
+    elif name_words <= hits:
+        return "ALL_WORDS"
+    elif name_words & hits:
+        return "PARTIAL"
+    else:
+        return "FAILED"
+
+
+# One thread owns stdin for the whole run and reports each ENTER press
+enter_presses = queue.Queue()
+
+def watch_enter():
+    try:
+        while True:
+            input()
+            enter_presses.put(None)
+    except EOFError:
+        # No more input; stop the test like Ctrl-C would
+        _thread.interrupt_main()
 
-results = {}
+threading.Thread(target=watch_enter, daemon=True).start()
+
+# The audio thread fills this buffer; it is reused for every name
+buffer = np.zeros(RATE * MAX_SECS, dtype=np.int16)
+write_index = [0]
+
+def callback(indata, frames, time_info, status):
+    start = write_index[0]
+    count = min(frames, len(buffer) - start)
+    buffer[start:start + count] = indata[:count, 0]
+    write_index[0] = start + count
 
 try:
     for i, name in enumerate(assistant_names, 1):
-        print(f"\n🧪 TEST {i}/{len(assistant_names)}: '{name}'")
-        print("-" * 50)
-        
-        input(f"Press ENTER to test '{name}'...")
+        sys.stdout.write(f"\n🧪 TEST {i}/{len(assistant_names)}: '{name}'\n{'-' * 50}\n"
+                         f"Press ENTER to test '{name}'...")
+        sys.stdout.flush()
+        enter_presses.get()
         print(f"🎙️ RECORDING... Say: '{name}' clearly, then press ENTER")
         
-        # Record
-        stream = audio.open(format=FORMAT, channels=CHANNELS, rate=RATE, 
-                          input=True, frames_per_buffer=CHUNK)
-        frames = []
-        
-        import threading
-        recording = True
-        def stop():
-            global recording
-            input()
-            recording = False
-        
-        stop_thread = threading.Thread(target=stop)
-        stop_thread.daemon = True
-        stop_thread.start()
-        
-        while recording:
-            try:
-                data = stream.read(CHUNK, exception_on_overflow=False)
-                frames.append(data)
-            except:
-                break
+        # Record until the next ENTER
+        write_index[0] = 0
+        with sd.InputStream(samplerate=RATE, channels=CHANNELS, dtype='int16',
+                            blocksize=128, latency='low', callback=callback):
+            enter_presses.get()
         
-        stream.stop_stream()
-        stream.close()
-        
-        # Process
-        if frames:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                wf = wave.open(temp_file.name, 'wb')
-                wf.setnchannels(CHANNELS)
-                wf.setsampwidth(audio.get_sample_size(FORMAT))
-                wf.setframerate(RATE)
-                wf.writeframes(b''.join(frames))
-                wf.close()
-                
-                print("🧠 Whisper processing...")
-                result = model.transcribe(temp_file.name)
-                text = result["text"].strip().lower()
-                os.unlink(temp_file.name)
-            
-            print(f"✅ Whisper heard: '{text}'")
-            
-            # Check accuracy
-            name_clean = name.lower()
-            name_words = name_clean.split()
-            
-            if name_clean in text:
-                print(f"🎉 PERFECT MATCH!")
-                results[name] = "PERFECT"
-            elif all(word in text for word in name_words):
-                print(f"✅ ALL WORDS RECOGNIZED!")
-                results[name] = "ALL_WORDS"
-            elif any(word in text for word in name_words):
-                print(f"⚡ PARTIAL RECOGNITION")
-                results[name] = "PARTIAL"
-            else:
-                print(f"❌ NOT RECOGNIZED")
-                results[name] = "FAILED"
+        # Keep the recording; transcription happens in one batch afterwards
+        if write_index[0]:
+            # Whisper takes 16 kHz float32 samples directly, no WAV needed
+            clip = buffer[:write_index[0]].astype(np.float32)
+            clip *= 1 / 32768.0
+            recordings.append((i - 1, clip))
+            print("✅ Recorded")
         else:
             print("❌ No audio recorded")
-            results[name] = "NO_AUDIO"
-        
-        # Quick feedback
-        if name in results and results[name] in ["PERFECT", "ALL_WORDS"]:
-            print(f"   👍 '{name}' works well with your voice!")
+            codes[i - 1] = RESULT_CODES["NO_AUDIO"]
 
 except KeyboardInterrupt:
     print("\n🛑 Stopping test...")
 
-finally:
-    audio.terminate()
+if recordings:
+    print(f"\n🧠 Whisper processing {len(recordings)} recordings in one batch...")
+    texts = transcribe_batch([clip for _, clip in recordings], batched_model=batched_model, batch_size=16)
+    
+    for (index, _), text in zip(recordings, texts):
+        name = assistant_names[index]
+        label = check_recognition(name, text)
+        codes[index] = RESULT_CODES[label]
+        
+        # Each name's report goes out in one write
+        lines = [f"\n'{name}' - Whisper heard: '{text}'", RECOGNITION_MESSAGES[label]]
+        if codes[index] >= RESULT_CODES["ALL_WORDS"]:
+            lines.append(f"   👍 '{name}' works well with your voice!")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 # Analyze results
 print("\n" + "=" * 65)
 print("📊 ASSISTANT NAME TEST RESULTS")
 print("=" * 65)
 
-perfect = []
-good = []
-partial = []
-failed = []
-
-for name, result in results.items():
-    if result == "PERFECT":
-        perfect.append(name)
-        print(f"🎉 PERFECT:     '{name}' - Exact match!")
-    elif result == "ALL_WORDS":
-        good.append(name)
-        print(f"✅ EXCELLENT:   '{name}' - All words recognized!")
-    elif result == "PARTIAL":
-        partial.append(name)
-        print(f"⚡ PARTIAL:     '{name}' - Some recognition")
-    else:
-        failed.append(name)
-        print(f"❌ FAILED:      '{name}' - Not recognized")
+sys.stdout.write("".join(
+    RESULT_LINES[codes[index]].format(assistant_names[index]) + "\n"
+    for index in np.flatnonzero(codes >= 0)
+))
+
+perfect = [assistant_names[index] for index in np.flatnonzero(codes == RESULT_CODES["PERFECT"])]
+good = [assistant_names[index] for index in np.flatnonzero(codes == RESULT_CODES["ALL_WORDS"])]
 
 print("\n🏆 RECOMMENDATIONS:")
 
@@ -7,9 +7,28 @@ noise cancellation, custom wake words, visual feedback, and undo functionality
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+
+# Feature test menu, written to stdout in one go
+MENU = "\n".join([
+    "",
+    "=" * 50,
+    "🎯 Enhanced Maya Feature Tests",
+    "=" * 50,
+    "1. 🎤 Basic microphone and Whisper test",
+    "2. 🧠 Confidence threshold demonstration",
+    "3. 🎓 Train custom wake word",
+    "4. 📋 List custom wake words",
+    "5. 🔊 Full voice interaction test",
+    "6. ↩️  Test undo functionality",
+    "7. 📊 View system statistics",
+    "8. 🧪 Test all features automatically",
+    "9. ❌ Exit",
+    "",
+    "",
+])
 
-# Add src directory to path
-sys.path.append('src')
 
 def test_enhanced_maya():
     """Test all enhanced Maya features"""
@@ -19,7 +38,7 @@ def test_enhanced_maya():
     
     try:
         # Import the enhanced voice listener
-        from input.enhanced_voice_listener import EnhancedVoiceListener
+        from voicenav.input.enhanced_voice_listener import EnhancedVoiceListener
         
         print("✅ Enhanced Maya module loaded successfully!")
         print()
@@ -36,19 +55,7 @@ def test_enhanced_maya():
         
         # Feature Test Menu
         while True:
-            print("\n" + "="*50)
-            print("🎯 Enhanced Maya Feature Tests")
-            print("="*50)
-            print("1. 🎤 Basic microphone and Whisper test")
-            print("2. 🧠 Confidence threshold demonstration")
-            print("3. 🎓 Train custom wake word")
-            print("4. 📋 List custom wake words")
-            print("5. 🔊 Full voice interaction test")
-            print("6. ↩️  Test undo functionality")
-            print("7. 📊 View system statistics")
-            print("8. 🧪 Test all features automatically")
-            print("9. ❌ Exit")
-            print()
+            sys.stdout.write(MENU)
             
             choice = input("Choose a test (1-9): ").strip()
             
@@ -129,30 +136,43 @@ def test_confidence_threshold(listener):
     print("3. Compare the confidence scores")
     print()
     
-    # Test 1: Clear speech
-    input("Press ENTER for Test 1 - Speak CLEARLY and LOUDLY...")
-    print("🎤 Speak clearly now (3 seconds):")
-    audio_data, success = listener._record_audio(duration=3)
-    if success:
-        text, confidence = listener._transcribe_audio(audio_data)
-        meets_threshold = confidence >= listener.confidence_threshold
-        status = "✅ ACCEPTED" if meets_threshold else "❌ REJECTED"
-        print(f"   Result: '{text}'")
-        print(f"   Confidence: {confidence*100:.1f}% - {status}")
+    # Whisper transcribes each sample in the background while the next
+    # one is being recorded
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = []
+        
+        # Test 1: Clear speech
+        input("Press ENTER for Test 1 - Speak CLEARLY and LOUDLY...")
+        print("🎤 Speak clearly now (3 seconds):")
+        audio_data, success = listener._record_audio(duration=3)
+        if success and audio_data:
+            pending.append(("Test 1 result", executor.submit(listener._transcribe_audio, audio_data)))
+        
+        print()
+        
+        # Test 2: Unclear speech
+        input("Press ENTER for Test 2 - Speak quietly or mumble...")
+        print("🎤 Speak quietly/mumble now (3 seconds):")
+        audio_data, success = listener._record_audio(duration=3)
+        if success and audio_data:
+            pending.append(("Test 2 result", executor.submit(listener._transcribe_audio, audio_data)))
+        
+        results = [future.result() for _, future in pending]
     
-    print()
+    # Threshold every sample in one comparison
+    import numpy as np
+    confidences = np.asarray([confidence for _, confidence in results], dtype=np.float32)
+    accepted = confidences >= listener.confidence_threshold
     
-    # Test 2: Unclear speech
-    input("Press ENTER for Test 2 - Speak quietly or mumble...")
-    print("🎤 Speak quietly/mumble now (3 seconds):")
-    audio_data, success = listener._record_audio(duration=3)
-    if success:
-        text, confidence = listener._transcribe_audio(audio_data)
-        meets_threshold = confidence >= listener.confidence_threshold
+    print()
+    for (label, _), (text, confidence), meets_threshold in zip(pending, results, accepted):
         status = "✅ ACCEPTED" if meets_threshold else "❌ REJECTED"
-        print(f"   Result: '{text}'")
+        print(f"   {label}: '{text}'")
         print(f"   Confidence: {confidence*100:.1f}% - {status}")
     
+    if results:
+        print(f"\n   {np.count_nonzero(accepted)}/{len(results)} samples accepted")
+    
     print(f"\n💡 Only commands above {listener.confidence_threshold*100:.0f}% confidence are processed!")
     print("   This prevents false triggers from unclear speech.")
 
@@ -328,11 +348,11 @@ def check_dependencies():
     
     missing_packages = []
     
+    # find_spec only locates the package; nothing is imported yet
     for package, description in required_packages:
-        try:
-            __import__(package)
+        if find_spec(package) is not None:
             print(f"   ✅ {package} - {description}")
-        except ImportError:
+        else:
             print(f"   ❌ {package} - {description} (MISSING)")
             missing_packages.append(package)
     
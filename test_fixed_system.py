@@ -3,17 +3,25 @@
 Test the fixed VoiceNav system with audio issue fixes
 """
 
-import sys
-import os
 import asyncio
 import time
 
-# Add src directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from voicenav.input.voice_listener import create_voice_listener
+from voicenav.brain.command_parser import CommandParser
+from voicenav.actions.applescript_browser import AppleScriptBrowserController
 
-from src.input.voice_listener import create_voice_listener
-from src.brain.command_parser import CommandParser
-from src.actions.applescript_browser import AppleScriptBrowserController
+# One voice listener (and Whisper model) shared by every test below
+_shared_listener = None
+_listener_lock = asyncio.Lock()
+
+
+async def get_shared_listener():
+    """Create the voice listener on first use and reuse it afterwards"""
+    global _shared_listener
+    async with _listener_lock:
+        if _shared_listener is None:
+            _shared_listener = create_voice_listener(wake_word="hey maya")
+    return _shared_listener
 
 
 async def test_individual_components():
@@ -63,7 +71,7 @@ async def test_individual_components():
     # Test 3: Voice Listener (Basic setup only)
     print("\n3️⃣ Testing Voice Listener Setup...")
     try:
-        maya = create_voice_listener(wake_word="hey maya")
+        maya = await get_shared_listener()
         if maya.test_microphone():
             print("   ✅ Voice listener setup successful")
         else:
@@ -82,7 +90,7 @@ async def test_simple_integration():
     try:
         # Initialize components
         print("🎤 Initializing Maya...")
-        maya = create_voice_listener(wake_word="hey maya")
+        maya = await get_shared_listener()
         
         print("🧠 Initializing parser...")
         parser = CommandParser()
@@ -126,7 +134,7 @@ async def test_one_voice_cycle():
     
     try:
         # Initialize everything
-        maya = create_voice_listener(wake_word="hey maya")
+        maya = await get_shared_listener()
         parser = CommandParser()
         browser = AppleScriptBrowserController("Safari")
         await browser.initialize()
@@ -169,7 +177,6 @@ async def test_one_voice_cycle():
     finally:
         try:
             await browser.cleanup()
-            maya.cleanup()
         except:
             pass
 
@@ -211,6 +218,9 @@ async def main():
         print("\n\n👋 Test interrupted by user")
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
+    finally:
+        if _shared_listener is not None:
+            _shared_listener.cleanup()
 
 
 if __name__ == "__main__":
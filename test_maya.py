@@ -3,10 +3,7 @@
 Quick test for 'Hey Maya' wake word
 """
 
-import sys
-sys.path.append('src')
-
-from input.voice_listener import create_voice_listener, WHISPER_AVAILABLE
+from voicenav.input.voice_listener import get_or_create_listener, WHISPER_AVAILABLE
 
 print("🎤 Testing VoiceNav with 'Hey Maya'")
 print("=" * 40)
@@ -22,7 +19,8 @@ print()
 
 try:
     # Initialize with Maya using the factory function
-    listener = create_voice_listener(wake_word="hey maya")
+    # Wake word + short command only, so the English tiny model is enough
+    listener = get_or_create_listener(wake_word="hey maya", model_size="tiny.en")
     
     print("🔧 Testing microphone...")
     if not listener.test_microphone():
@@ -30,6 +28,11 @@ try:
         exit(1)
     
     print("\n✅ Microphone working!")
+    
+    # Get Whisper's first-call setup out of the way before listening
+    if hasattr(listener, 'warmup'):
+        listener.warmup()
+    
     print("🎤 Now testing wake word detection...")
     print(f"Say: '{listener.wake_word}' followed by a command")
     print("Press Ctrl+C to stop")
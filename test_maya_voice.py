@@ -4,9 +4,28 @@ Test Maya's new Samantha voice
 """
 
 import sys
-sys.path.append('src')
+import hashlib
+import subprocess
+from pathlib import Path
 
-from input.voice_listener import create_voice_listener
+# --interactive speaks and confirms one phrase at a time
+INTERACTIVE = '--interactive' in sys.argv
+
+# Rendered speech, named by a hash of voice + text so edited phrases re-render
+SPEECH_CACHE_DIR = Path.home() / ".cache" / "voicenav" / "speech"
+
+
+def rendered_speech(text, voice="Samantha"):
+    """Return an AIFF of text spoken by voice, rendering it with say on first use"""
+    digest = hashlib.sha1(f"{voice}\n{text}".encode()).hexdigest()[:16]
+    path = SPEECH_CACHE_DIR / f"voice_{digest}.aiff"
+    if not path.exists():
+        SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        subprocess.run(['say', '-v', voice, '-o', str(path), '-f', '-'],
+                       input=text, text=True, check=True)
+    return path
+
+from voicenav.input.voice_listener import get_or_create_listener
 
 print("🎤 Testing Maya's New Voice (Samantha)")
 print("=" * 50)
@@ -16,7 +35,6 @@ print()
 try:
     # Test the voice directly first
     print("🧪 Testing Samantha voice directly...")
-    import subprocess
     
     test_phrases = [
         "Hello! I'm Maya, your voice assistant.",
@@ -25,24 +43,30 @@ try:
         "Command received. Ready for browser control."
     ]
     
-    for i, phrase in enumerate(test_phrases, 1):
-        print(f"   {i}. Testing: '{phrase}'")
-        try:
-            subprocess.run(['say', '-v', 'Samantha', phrase], check=True)
-            print(f"   ✅ Samantha voice working!")
-        except Exception as e:
-            print(f"   ❌ Voice test failed: {e}")
-            break
-        
-        if i < len(test_phrases):
-            input("      Press Enter for next test...")
+    try:
+        if INTERACTIVE:
+            for i, phrase in enumerate(test_phrases, 1):
+                print(f"   {i}. Testing: '{phrase}'")
+                subprocess.run(['afplay', str(rendered_speech(phrase))], check=True)
+                input("      Press Enter for the next phrase...")
+        else:
+            for i, phrase in enumerate(test_phrases, 1):
+                print(f"   {i}. Testing: '{phrase}'")
+            
+            # All phrases are rendered as one clip (once, then cached) and
+            # played back with afplay instead of being synthesized every run
+            subprocess.run(['afplay', str(rendered_speech("\n".join(test_phrases)))], check=True)
+            input("   Heard all four phrases? Press Enter to continue...")
+        print(f"   ✅ Samantha voice working!")
+    except Exception as e:
+        print(f"   ❌ Voice test failed: {e}")
     
     print("\n🎤 Now testing Maya with integrated voice...")
     print("This will test both wake word detection AND Maya speaking back")
     print()
     
     # Initialize Maya with new voice
-    listener = create_voice_listener(wake_word="hey maya")
+    listener = get_or_create_listener(wake_word="hey maya")
     
     print("🔧 Testing microphone...")
     if not listener.test_microphone():
@@ -81,13 +105,6 @@ except KeyboardInterrupt:
 except Exception as e:
     print(f"\n❌ Error: {e}")
 
-finally:
-    try:
-        if 'listener' in locals() and hasattr(listener, 'cleanup'):
-            listener.cleanup()
-    except:
-        pass
-
 print("\n🎯 Maya Voice Status:")
 print("   Voice Engine: macOS Samantha")
 print("   Quality: Natural human-like speech")
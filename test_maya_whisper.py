@@ -4,10 +4,7 @@ Maya + Whisper Integration Test
 High-accuracy voice recognition with "Hey Maya"
 """
 
-import sys
-sys.path.append('src')
-
-from input.voice_listener import create_voice_listener, WHISPER_AVAILABLE
+from voicenav.input.voice_listener import get_or_create_listener, WHISPER_AVAILABLE, FASTER_WHISPER_AVAILABLE
 
 print("🎤 Maya + Whisper Integration Test")
 print("=" * 50)
@@ -18,6 +15,8 @@ print()
 # Check Whisper availability
 if WHISPER_AVAILABLE:
     print("✅ Whisper is available - using high-accuracy mode")
+    if FASTER_WHISPER_AVAILABLE:
+        print("⚡ faster-whisper backend (CTranslate2 int8)")
 else:
     print("⚠️  Whisper not available - using standard recognition")
     print("   To get Whisper: pip install openai-whisper")
@@ -27,7 +26,9 @@ print()
 try:
     # Create the best available voice listener
     print("🧠 Initializing Maya's voice system...")
-    listener = create_voice_listener(wake_word="hey maya", prefer_whisper=True)
+    # Wake word + short command only, so the English tiny model is enough
+    listener = get_or_create_listener(wake_word="hey maya", prefer_whisper=True, quantization="int8",
+                                      model_size="tiny.en", dtype="auto")
     
     # Check what type we got
     if hasattr(listener, 'whisper_model'):
@@ -48,6 +49,10 @@ try:
     
     print("✅ Microphone working!")
     
+    # Get Whisper's first-call setup out of the way before listening
+    if hasattr(listener, 'warmup'):
+        listener.warmup()
+    
     # Test recognition if it's Whisper
     if hasattr(listener, 'test_whisper_recognition'):
         print("\n🧠 Testing Whisper recognition...")
@@ -95,13 +100,6 @@ except Exception as e:
     print("🔧 Make sure all dependencies are installed:")
     print("   pip install -r requirements.txt")
 
-finally:
-    try:
-        if hasattr(listener, 'cleanup'):
-            listener.cleanup()
-    except:
-        pass
-
 print(f"\n🎯 Maya Voice System Status:")
 print(f"   Recognition Engine: {recognition_type if 'recognition_type' in locals() else 'Unknown'}")
 print(f"   Wake Word: Hey Maya")
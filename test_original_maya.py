@@ -4,9 +4,6 @@ Test Original Maya System - Reverted to Working Version
 This uses the original Whisper + Maya system that was working before Step 1 Extra
 """
 
-import sys
-sys.path.append('src')
-
 def main():
     print("🔄 Testing REVERTED Maya System")
     print("="*50)
@@ -16,20 +13,26 @@ def main():
     
     try:
         # Import the factory function (should now default to Whisper)
-        from input.voice_listener import create_voice_listener
+        from voicenav.input.voice_listener import get_or_create_listener
         
         print("🧠 Creating Maya using original working system...")
         
         # This should create WhisperVoiceListener (not Enhanced)
-        maya = create_voice_listener(
+        maya = get_or_create_listener(
             wake_word="hey maya",
-            prefer_whisper=True  # Use the working Whisper system
+            prefer_whisper=True,  # Use the working Whisper system
+            quantization="int8",  # faster-whisper int8 (int8_float16 on CUDA)
+            model_size="tiny.en"  # Wake word + short command only
         )
         
         print(f"✅ Created: {type(maya).__name__}")
         print("   (Should be WhisperVoiceListener)")
         print()
         
+        # Get Whisper's first-call setup out of the way before listening
+        if hasattr(maya, 'warmup'):
+            maya.warmup()
+        
         # Test the original system
         print("🎤 Testing Maya with original Whisper system...")
         print("Say: 'Hey Maya test command'")
@@ -47,13 +50,11 @@ def main():
             print("❌ No wake word detected")
             print("   Try speaking 'Hey Maya' clearly")
         
-        maya.cleanup()
-        
         print("\n" + "="*50)
         print("🎯 REVERT SUMMARY:")
         print("✅ Removed enhanced confidence threshold system")
         print("✅ Restored original working Whisper + Maya")
-        print("✅ Suppressed FP16 warnings") 
+        print("✅ FP16 on CUDA, FP32 on CPU (no FP16 warnings)")
         print("✅ Factory function now defaults to Whisper")
         print()
         print("Maya should now work as it did before the Step 1 Extra changes!")
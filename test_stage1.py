@@ -5,9 +5,33 @@ Complete testing workflow for voice input system
 """
 
 import os
+import io
 import sys
+import json
+import runpy
+import contextlib
+import time
+import hashlib
+import argparse
+import threading
 import subprocess
 import importlib.util
+import importlib.metadata
+from pathlib import Path
+
+# Import names whose PyPI distribution is called something else
+DISTRIBUTION_NAMES = {
+    'speech_recognition': 'speechrecognition',
+    'whisper': 'openai_whisper',
+    'dotenv': 'python_dotenv',
+}
+
+# Passing results of steps 1-3 are reused for a day per interpreter/venv
+CACHE_DIR = Path.home() / ".cache" / "voicenav"
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# Seconds the environment test may take once its output is being read
+ENVIRONMENT_TEST_TIMEOUT = 30
 
 
 def print_header(title):
@@ -23,6 +47,15 @@ def print_step(step_num, title):
     print("-" * 40)
 
 
+def preload_heavy_modules():
+    """Import torch and Whisper ahead of the voice test; import errors surface there"""
+    for name in ('torch', 'whisper'):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
 def check_python_version():
     """Check Python version"""
     print_step(1, "CHECKING PYTHON VERSION")
@@ -53,6 +86,41 @@ def check_virtual_environment():
         return False
 
 
+def normalize_distribution_name(name):
+    """Lower-case a distribution name and unify '-' / '.' separators to '_'"""
+    return name.lower().replace('-', '_').replace('.', '_')
+
+
+def find_installed_distributions():
+    """Return the normalized names of every distribution in this environment"""
+    return {
+        normalize_distribution_name(dist.metadata['Name'])
+        for dist in importlib.metadata.distributions()
+        if dist.metadata['Name']
+    }
+
+
+def is_module_installed(name, installed):
+    """
+    Check whether a module is available
+    
+    Args:
+        name: Import name of the module
+        installed: Normalized distribution names from find_installed_distributions
+    
+    Returns:
+        bool: True if the module's distribution is installed or it can be found
+    """
+    if DISTRIBUTION_NAMES.get(name, name) in installed:
+        return True
+    
+    # Not installed under the expected distribution name; ask the import system
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     print_step(3, "CHECKING DEPENDENCIES")
@@ -66,31 +134,77 @@ def check_dependencies():
         'dotenv',
         'whisper',
         'torch',
-        'numpy'
+        'numpy',
+        'voicenav'  # The project itself, installed with pip install -e .
     ]
     
+    # One sweep over the installed distributions answers most lookups
+    installed = find_installed_distributions()
+    
     missing = []
     for dep in dependencies:
-        try:
-            spec = importlib.util.find_spec(dep)
-            if spec is None:
-                missing.append(dep)
-                print(f"❌ {dep} not installed")
-            else:
-                print(f"✅ {dep} installed")
-        except ImportError:
+        if not is_module_installed(dep, installed):
             missing.append(dep)
             print(f"❌ {dep} not installed")
+        else:
+            print(f"✅ {dep} installed")
     
     if missing:
         print(f"\n⚠️ Missing dependencies: {', '.join(missing)}")
-        print("Run: pip install -r requirements.txt")
+        print("Run: pip install -r requirements.txt && pip install -e .")
         return False
     else:
         print("\n✅ All dependencies installed")
         return True
 
 
+def get_check_cache_path():
+    """Cache file for steps 1-3, keyed on the interpreter and environment"""
+    key = "|".join([
+        sys.executable,
+        sys.prefix,
+        str(os.path.getmtime(sys.prefix)),
+        os.environ.get('VIRTUAL_ENV', ''),
+    ])
+    return CACHE_DIR / f"stage1-{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def run_environment_checks(force=False):
+    """
+    Run the Python version, virtual environment and dependency checks
+    
+    A recent passing result for the same interpreter is reused instead;
+    failures are never cached so fixes are picked up on the next run.
+    """
+    cache_path = get_check_cache_path()
+    
+    if not force:
+        try:
+            if time.time() - cache_path.stat().st_mtime < CACHE_MAX_AGE:
+                results = json.loads(cache_path.read_text())
+                print_step("1-3", "CHECKING PYTHON, VIRTUAL ENVIRONMENT & DEPENDENCIES")
+                print(f"✅ Passed on a previous run (cached in {cache_path})")
+                print("   Use --force to run these checks again")
+                return results
+        except (OSError, ValueError):
+            pass
+    
+    results = [
+        check_python_version(),
+        check_virtual_environment(),
+        check_dependencies(),
+    ]
+    
+    if all(results):
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(results))
+        except OSError:
+            pass
+    
+    return results
+
+
 def check_microphone_permissions():
     """Guide user through microphone permission check"""
     print_step(4, "CHECKING MICROPHONE PERMISSIONS")
@@ -107,24 +221,119 @@ def check_microphone_permissions():
     return response == 'y'
 
 
-def run_environment_test():
-    """Run the environment test script"""
+def run_script_in_process(path, capture=False):
+    """
+    Run a test script in this interpreter, reusing modules already imported
+    
+    Args:
+        path: Script to run as __main__
+        capture: Collect stdout/stderr instead of letting them through
+    
+    Returns:
+        tuple: (exit code, stdout, stderr)
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    
+    with contextlib.ExitStack() as stack:
+        if capture:
+            stack.enter_context(contextlib.redirect_stdout(stdout))
+            stack.enter_context(contextlib.redirect_stderr(stderr))
+        try:
+            runpy.run_path(path, run_name='__main__')
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+    
+    return returncode, stdout.getvalue(), stderr.getvalue()
+
+
+def start_environment_test():
+    """
+    Launch the environment test in a fresh interpreter
+    
+    Output collects in the pipe until stream_environment_test reads it,
+    so the test can run while other prompts are on screen.
+    
+    Returns:
+        subprocess.Popen: Running test with stderr merged into stdout
+    """
+    return subprocess.Popen(
+        [sys.executable, 'tests/test_environment.py'],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    )
+
+
+def stream_environment_test(proc, timeout=ENVIRONMENT_TEST_TIMEOUT):
+    """
+    Echo a running environment test's output line by line as it arrives
+    
+    Args:
+        proc: Process from start_environment_test
+        timeout: Seconds before the test is killed
+    
+    Returns:
+        int: Exit code of the test
+    
+    Raises:
+        subprocess.TimeoutExpired: If the test had to be killed
+    """
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+    
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            print(line, end='')
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return returncode
+
+
+def run_environment_test(isolated=False, pending=None):
+    """
+    Run the environment test script and report its output
+    
+    Args:
+        isolated: Run it in a fresh interpreter instead of this one
+        pending: Process already started by start_environment_test, if any
+    """
     print_step(5, "RUNNING ENVIRONMENT TEST")
     
     try:
-        result = subprocess.run([
-            sys.executable, 'tests/test_environment.py'
-        ], capture_output=True, text=True, timeout=30)
+        if pending is None and isolated:
+            pending = start_environment_test()
         
         print("Environment test output:")
-        print(result.stdout)
-        
-        if result.stderr:
-            print("Errors:")
-            print(result.stderr)
+        if pending is not None:
+            returncode = stream_environment_test(pending)
+        else:
+            returncode, stdout, stderr = run_script_in_process('tests/test_environment.py', capture=True)
+            print(stdout)
+            
+            if stderr:
+                print("Errors:")
+                print(stderr)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Environment test passed")
+            # Its microphone check passed, so the voice test need not repeat it.
+            # Imported here: the guide itself runs before `pip install -e .`
+            from voicenav.utils.probe_cache import record_probe
+            record_probe("mic_ok", True)
             return True
         else:
             print("❌ Environment test failed")
@@ -138,7 +347,7 @@ def run_environment_test():
         return False
 
 
-def run_voice_test():
+def run_voice_test(model_size=None, isolated=False):
     """Run the voice system test"""
     print_step(6, "RUNNING VOICE SYSTEM TEST")
     
@@ -161,12 +370,24 @@ def run_voice_test():
         return False
     
     try:
-        # Run the voice test
-        result = subprocess.run([
-            sys.executable, 'tests/test_voice.py'
-        ], timeout=300)  # 5 minute timeout
+        # The listener factory reads the model choice from the environment
+        if model_size:
+            os.environ['VOICENAV_WHISPER_MODEL'] = model_size
+        
+        if isolated:
+            result = subprocess.run([
+                sys.executable, 'tests/test_voice.py'
+            ], timeout=300)  # 5 minute timeout
+            return result.returncode == 0
+        
+        returncode, _, _ = run_script_in_process('tests/test_voice.py')
         
-        return result.returncode == 0
+        # The script shares its listener; free it (and its Whisper model) here
+        voice_listener = sys.modules.get('voicenav.input.voice_listener')
+        if voice_listener is not None:
+            voice_listener.release_listener()
+        
+        return returncode == 0
         
     except subprocess.TimeoutExpired:
         print("❌ Voice test timed out")
@@ -235,6 +456,23 @@ def print_success_message():
 
 def main():
     """Main testing workflow"""
+    arg_parser = argparse.ArgumentParser(description="VoiceNav Stage 1 testing guide")
+    arg_parser.add_argument('--force', action='store_true',
+                            help="Re-run the environment checks even if a cached result exists")
+    arg_parser.add_argument('--model-size',
+                            help="Whisper model for the voice test (e.g. tiny.en, base)")
+    arg_parser.add_argument('--isolated', action='store_true',
+                            help="Run the environment and voice tests in fresh interpreters (with timeouts)")
+    args = arg_parser.parse_args()
+    
+    # Opt this run (and the test scripts it starts) into voicenav's probe cache
+    os.environ['VOICENAV_PROBE_CACHE'] = '1'
+    
+    # The in-process voice test needs torch/Whisper (seconds to import);
+    # load them while the user works through the prompts
+    if not args.isolated:
+        threading.Thread(target=preload_heavy_modules, daemon=True).start()
+    
     print_header("VOICENAV STAGE 1 TESTING GUIDE")
     
     print("This script will guide you through testing Stage 1:")
@@ -253,20 +491,24 @@ def main():
         return
     
     # Run all checks
-    checks = [
-        check_python_version(),
-        check_virtual_environment(), 
-        check_dependencies(),
-        check_microphone_permissions(),
-    ]
+    checks = run_environment_checks(force=args.force)
+    
+    # With --isolated, start the environment test's interpreter while the user
+    # answers the microphone prompt. Otherwise it runs in this interpreter after
+    # the prompt: capturing an in-process run would also swallow the prompt.
+    env_proc = start_environment_test() if args.isolated and all(checks) else None
+    
+    checks.append(check_microphone_permissions())
     
     # Only run environment test if basic checks pass
     if all(checks):
-        checks.append(run_environment_test())
+        checks.append(run_environment_test(isolated=args.isolated, pending=env_proc))
+    elif env_proc is not None:
+        env_proc.kill()
     
     # Only run voice test if all checks pass
     if all(checks):
-        checks.append(run_voice_test())
+        checks.append(run_voice_test(model_size=args.model_size, isolated=args.isolated))
     
     # Print results
     print_header("TEST RESULTS")
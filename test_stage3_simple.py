@@ -6,12 +6,77 @@ This test doesn't require all dependencies to validate Stage 3 structure
 
 import sys
 import os
+import re
 import subprocess
+import functools
+
+# Directories holding every file the checks below look for
+CHECKED_DIRS = ['.', 'src', 'src/ui', 'tests']
+
+# Functions and markers the structural tests look for in src/main.py
+MAIN_FUNCTIONS = ['run_menu_bar', 'run_settings', 'parse_args', 'main_entry']
+MAIN_MARKERS = ['--menu-bar', '--settings', 'run_menu_bar', 'VoiceNavMenuBar']
+MAIN_PATTERN = re.compile('|'.join(
+    ['def (?:' + '|'.join(MAIN_FUNCTIONS) + ')'] + [re.escape(marker) for marker in MAIN_MARKERS]
+))
+
+def scan_main_source(path='src/main.py'):
+    """
+    Read src/main.py once and find every function definition and marker in one pass
+    
+    Returns:
+        set: Matched text, e.g. 'def run_settings' or '--menu-bar'
+    """
+    with open(path, 'r') as f:
+        content = f.read()
+    
+    found = set()
+    for match in MAIN_PATTERN.finditer(content):
+        token = match.group(0)
+        found.add(token)
+        if token.startswith('def '):
+            # The name inside a definition also counts as a marker (indicator
+            # counts only; the function check looks for the 'def ' form)
+            found.add(token[4:])
+    return found
+
+def collect_paths(roots):
+    """
+    List the files directly inside each root with one directory read per root
+    
+    Returns:
+        set: Normalized relative paths, e.g. 'src/ui/menu_bar.py'
+    """
+    found = set()
+    for root in roots:
+        try:
+            with os.scandir(root) as entries:
+                found.update(os.path.normpath(os.path.join(root, entry.name)) for entry in entries)
+        except OSError:
+            pass
+    return found
+
+@functools.lru_cache(maxsize=1)
+def _collect_state():
+    """
+    Gather everything the structural tests inspect in one pass over the disk
+    
+    Cached, so every check in a run shares the same listing and main.py scan.
+    
+    Returns:
+        tuple: (present file paths, markers found in src/main.py)
+    """
+    present_files = collect_paths(CHECKED_DIRS)
+    # The listing already says whether main.py exists, so skip a doomed open
+    main_found = scan_main_source() if 'src/main.py' in present_files else set()
+    return present_files, main_found
 
 def test_file_structure():
     """Test that Stage 3 files exist"""
     print("🔄 Testing Stage 3 file structure...")
     
+    present_files, _ = _collect_state()
+    
     required_files = [
         'src/ui/__init__.py',
         'src/ui/menu_bar.py',
@@ -22,7 +87,7 @@ def test_file_structure():
     
     all_exist = True
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if file_path in present_files:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path} - MISSING")
@@ -45,12 +110,11 @@ def test_config_updates():
             return False
         
         ui_keys = ['show_notifications', 'auto_start', 'minimize_to_tray', 'icon_style']
-        for key in ui_keys:
-            if key in content:
-                print(f"✅ {key} setting found")
-            else:
-                print(f"❌ {key} setting missing")
-                return False
+        missing = [key for key in ui_keys if key not in content]
+        if missing:
+            print(f"❌ Settings missing: {', '.join(missing)}")
+            return False
+        print(f"✅ UI settings found: {', '.join(ui_keys)}")
         
         return True
         
@@ -62,20 +126,17 @@ def test_main_structure():
     """Test main.py has Stage 3 functions"""
     print("\n🔄 Testing main.py Stage 3 integration...")
     
+    _, main_found = _collect_state()
+    
     try:
-        with open('src/main.py', 'r') as f:
-            content = f.read()
-        
-        required_functions = ['run_menu_bar', 'run_settings', 'parse_args', 'main_entry']
-        
-        for func in required_functions:
-            if f"def {func}" in content:
-                print(f"✅ {func}() function found")
-            else:
-                print(f"❌ {func}() function missing")
-                return False
+        # Only a definition counts here; a bare name may just be a call
+        missing = [func for func in MAIN_FUNCTIONS if 'def ' + func not in main_found]
+        if missing:
+            print(f"❌ Functions missing: {', '.join(f'{func}()' for func in missing)}")
+            return False
+        print(f"✅ Functions found: {', '.join(f'{func}()' for func in MAIN_FUNCTIONS)}")
         
-        if '--menu-bar' in content and '--settings' in content:
+        if '--menu-bar' in main_found and '--settings' in main_found:
             print("✅ Command-line arguments implemented")
         else:
             print("❌ Command-line arguments missing")
@@ -91,6 +152,8 @@ def test_todo_completed():
     """Check if Stage 3 implementation is complete"""
     print("\n🔄 Testing Stage 3 completion...")
     
+    present_files, main_found = _collect_state()
+    
     try:
         # Check for key Stage 3 files existence (indicates completion)
         key_files = [
@@ -99,27 +162,18 @@ def test_todo_completed():
             'test_stage3.py'
         ]
         
-        files_exist = 0
-        for file_path in key_files:
-            if os.path.exists(file_path):
-                files_exist += 1
+        files_exist = len(present_files.intersection(key_files))
         
         print(f"✅ Stage 3 key files: {files_exist}/{len(key_files)}")
         
         # Check if main.py has Stage 3 integration
-        with open('src/main.py', 'r') as f:
-            main_content = f.read()
-        
         stage3_indicators = [
             '--menu-bar',
             'run_menu_bar',
             'VoiceNavMenuBar'
         ]
         
-        indicators_found = 0
-        for indicator in stage3_indicators:
-            if indicator in main_content:
-                indicators_found += 1
+        indicators_found = len(main_found.intersection(stage3_indicators))
         
         print(f"✅ Stage 3 integration indicators: {indicators_found}/{len(stage3_indicators)}")
         
@@ -138,6 +192,8 @@ def test_basic_imports():
     """Test basic Python imports without dependencies"""
     print("\n🔄 Testing basic Python imports...")
     
+    present_files, _ = _collect_state()
+    
     try:
         # Test basic Python modules
         import argparse
@@ -146,12 +202,8 @@ def test_basic_imports():
         import signal
         print("✅ Basic Python modules available")
         
-        # Test if files can be imported (structure-wise)
-        import sys
-        sys.path.append('src')
-        
         # Test UI module structure (not actual import due to dependencies)
-        if os.path.exists('src/ui/__init__.py'):
+        if 'src/ui/__init__.py' in present_files:
             print("✅ UI package structure exists")
         else:
             print("❌ UI package structure missing")
@@ -170,6 +222,9 @@ def main():
     print("Testing Stage 3 implementation without requiring all dependencies")
     print("")
     
+    # One listing of the checked directories and one read of main.py
+    # (cached by _collect_state) answer every structure, integration and
+    # completion check
     tests = [
         ("File Structure", test_file_structure),
         ("Config Updates", test_config_updates), 
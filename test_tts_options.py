@@ -5,9 +5,19 @@ Test different TTS options for Maya's voice
 
 import os
 import sys
+import time
+import shutil
 import tempfile
+import functools
 import subprocess
 
+# Import AppKit to speak through one in-process synthesizer instead of a say process per phrase
+try:
+    from AppKit import NSSpeechSynthesizer
+    APPKIT_AVAILABLE = True
+except ImportError:
+    APPKIT_AVAILABLE = False
+
 print("🎤 Maya Voice Testing - AI Text-to-Speech Options")
 print("=" * 60)
 print("Testing different ways for Maya to speak back to you")
@@ -21,22 +31,66 @@ test_messages = [
     "Ready for your next request."
 ]
 
+# Shared synthesizer and voice name -> identifier table, created on first use
+_synthesizer = None
+_voice_ids = {}
+
+def speak_with_synthesizer(text, voice, timeout=5):
+    """Speak text with the shared NSSpeechSynthesizer; False if the voice is missing or hangs"""
+    global _synthesizer
+    if _synthesizer is None:
+        _synthesizer = NSSpeechSynthesizer.alloc().init()
+        for voice_id in NSSpeechSynthesizer.availableVoices():
+            _voice_ids[NSSpeechSynthesizer.attributesForVoice_(voice_id)['VoiceName']] = voice_id
+    
+    voice_id = _voice_ids.get(voice)
+    if voice_id is None or not _synthesizer.setVoice_(voice_id):
+        return False
+    
+    _synthesizer.startSpeakingString_(text)
+    deadline = time.monotonic() + timeout
+    while _synthesizer.isSpeaking():
+        if time.monotonic() > deadline:
+            _synthesizer.stopSpeaking()
+            return False
+        time.sleep(0.05)
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _voice_catalog():
+    """Lines of `say -v ?`, read once per run; empty if say fails"""
+    # close_fds=False lets CPython spawn with posix_spawn instead of fork/exec
+    try:
+        result = subprocess.run(['say', '-v', '?'], capture_output=True, text=True, close_fds=False)
+    except OSError:
+        # No say binary (not macOS): every voice is simply unavailable
+        return ()
+    if result.returncode != 0:
+        return ()
+    return tuple(line.strip() for line in result.stdout.splitlines() if line.strip())
+
+@functools.lru_cache(maxsize=1)
+def _available_voices():
+    """Names of the installed voices (first word of each catalog line)"""
+    return frozenset(line.split()[0] for line in _voice_catalog())
+
 def test_macos_say():
     """Test macOS built-in 'say' command"""
     print("🧪 Testing macOS built-in speech...")
     try:
         # Test basic say command
-        result = subprocess.run(['say', '-v', '?'], capture_output=True, text=True)
-        if result.returncode == 0:
-            voices = result.stdout.split('\n')[:5]  # Show first 5 voices
+        voices = _voice_catalog()
+        if voices:
             print("✅ macOS speech available. Sample voices:")
-            for voice in voices:
-                if voice.strip():
-                    print(f"   {voice.strip()}")
+            for voice in voices[:5]:  # Show first 5 voices
+                print(f"   {voice}")
             
             # Test speaking
             print("\n🎤 Testing Maya speaking...")
-            subprocess.run(['say', '-v', 'Samantha', test_messages[0]])
+            if APPKIT_AVAILABLE:
+                speak_with_synthesizer(test_messages[0], 'Samantha')
+            else:
+                subprocess.run(['say', '-v', 'Samantha', test_messages[0]], close_fds=False)
             return True
         else:
             print("❌ macOS speech not available")
@@ -66,33 +120,44 @@ def test_openai_tts():
         print("   Install with: pip install openai")
         return False
 
+# Edge TTS neural voices to compare
+edge_tts_voices = ['en-US-AriaNeural', 'en-US-JennyNeural']
+
 def test_edge_tts():
     """Test Microsoft Edge TTS (free)"""
     print("\n🧪 Testing Microsoft Edge TTS (free)...")
     try:
-        # Check if edge-tts is available
-        result = subprocess.run(['which', 'edge-tts'], capture_output=True)
-        if result.returncode == 0:
+        # Check if edge-tts is available (PATH lookup in-process, no `which` child)
+        if shutil.which('edge-tts') is not None:
             print("✅ Edge TTS available")
             
             # Test speaking
             print("🎤 Testing Edge TTS...")
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_file = f.name
-            
-            # Generate speech
-            cmd = ['edge-tts', '--voice', 'en-US-AriaNeural', '--text', test_messages[0], '--write-media', temp_file]
-            result = subprocess.run(cmd, capture_output=True)
+            # One temp path is reused for every voice; edge-tts overwrites it
+            fd, temp_file = tempfile.mkstemp(suffix=".wav")
+            os.close(fd)
             
-            if result.returncode == 0 and os.path.exists(temp_file):
-                # Play the audio
-                subprocess.run(['afplay', temp_file])
+            try:
+                for voice in edge_tts_voices:
+                    print(f"   Voice: {voice}")
+                    # Empty it so a failed run can't replay the previous voice
+                    os.truncate(temp_file, 0)
+                    
+                    # Generate speech
+                    cmd = ['edge-tts', '--voice', voice, '--text', test_messages[0], '--write-media', temp_file]
+                    result = subprocess.run(cmd, capture_output=True, close_fds=False)
+                    
+                    if result.returncode != 0 or os.path.getsize(temp_file) == 0:
+                        print("❌ Edge TTS generation failed")
+                        return False
+                    
+                    # Play the audio
+                    subprocess.run(['afplay', temp_file], close_fds=False)
+            finally:
                 os.unlink(temp_file)
-                print("✅ Edge TTS working!")
-                return True
-            else:
-                print("❌ Edge TTS generation failed")
-                return False
+            
+            print("✅ Edge TTS working!")
+            return True
         else:
             print("❌ Edge TTS not installed")
             print("   Install with: pip install edge-tts")
@@ -109,12 +174,30 @@ def test_system_speech():
     # Test different macOS voices
     voices_to_test = ['Samantha', 'Alex', 'Victoria', 'Allison', 'Ava']
     
+    # Availability comes from the cached catalog; only the first installed
+    # voice is actually spoken, since they all run on the same engine
+    available = _available_voices()
+    spoken = False
+    
     for voice in voices_to_test:
         try:
             print(f"   Testing voice: {voice}")
-            result = subprocess.run(['say', '-v', voice, f"Hello, this is {voice}"], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
+            if voice not in available:
+                print(f"   ❌ {voice} not available")
+                continue
+            
+            if spoken:
+                print(f"   ✅ {voice} installed")
+                continue
+            
+            if APPKIT_AVAILABLE:
+                works = speak_with_synthesizer(f"Hello, this is {voice}", voice)
+            else:
+                result = subprocess.run(['say', '-v', voice, f"Hello, this is {voice}"], 
+                                      capture_output=True, timeout=5, close_fds=False)
+                works = result.returncode == 0
+            if works:
+                spoken = True
                 print(f"   ✅ {voice} works")
             else:
                 print(f"   ❌ {voice} failed")
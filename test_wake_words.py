@@ -3,11 +3,26 @@
 Test different wake words to find the easiest one for your voice
 """
 
-import whisper
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+import numpy as np
 import pyaudio
-import wave
-import tempfile
 import os
+import hashlib
+import queue
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from whisper_runtime import transcribe_batch
+
+# openWakeWord's tiny keyword-spotting models score phrases that have a
+# pretrained model live, without running Whisper
+try:
+    from openwakeword.model import Model as WakeWordModel
+    OPENWAKEWORD_AVAILABLE = True
+except ImportError:
+    OPENWAKEWORD_AVAILABLE = False
 
 print("🎤 Wake Word Testing - Find Your Best Option")
 print("=" * 60)
@@ -27,18 +42,39 @@ wake_words = [
     "web assistant"      # Easy to say
 ]
 
-print("🧠 Loading Whisper...")
-model = whisper.load_model("base")
+# Words of each wake word, split once for the partial-match check
+wake_word_tokens = {word: set(word.split()) for word in wake_words}
+WORD_PATTERN = re.compile(r"\w+")
+
+# Clips are 1-3 English words, so the distilled English-only model is enough.
+# Weights are int8 (CTranslate2 has no int4); for a smaller footprint still,
+# set VOICENAV_WAKE_WORD_MODEL=tiny.en
+MODEL_NAME = os.environ.get("VOICENAV_WAKE_WORD_MODEL", "distil-small.en")
+print(f"🧠 Loading Whisper ({MODEL_NAME}, int8)...")
+model = WhisperModel(MODEL_NAME, device="cpu", compute_type="int8", cpu_threads=os.cpu_count())
+batched_model = BatchedInferencePipeline(model=model)
 print("✅ Ready!")
 print()
 
+# Phrases with a pretrained openWakeWord model; Whisper stays the audit
+KWS_MODELS = {"hey jarvis": "hey_jarvis", "hey mycroft": "hey_mycroft", "alexa": "alexa"}
+KWS_THRESHOLD = 0.5
+
+kws = None
+if OPENWAKEWORD_AVAILABLE:
+    try:
+        kws = WakeWordModel(wakeword_models=list(KWS_MODELS.values()))
+        print(f"🔑 Keyword spotting also scores: {', '.join(repr(p) for p in KWS_MODELS)}")
+    except Exception as e:
+        print(f"⚠️ openWakeWord models unavailable: {e}")
+
 print("📝 SUGGESTED WAKE WORDS:")
 for i, word in enumerate(wake_words, 1):
     print(f"   {i}. '{word}'")
 print()
 
 # Audio settings
-CHUNK = 1024
+CHUNK = 3840  # Frames per callback (0.24s at 16 kHz, three 80ms KWS frames)
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
 RATE = 16000
@@ -46,78 +82,185 @@ audio = pyaudio.PyAudio()
 
 results = {}
 
+# Audio accumulates in one growing buffer instead of a list of chunks
+buf = bytearray()
+
+# Keyword model scored during the current recording, and its best score
+kws_active = None
+kws_peak = 0.0
+
+def on_audio(in_data, frame_count, time_info, status):
+    global kws_peak
+    buf.extend(in_data)
+    if kws_active:
+        score = kws.predict(np.frombuffer(in_data, dtype=np.int16))[kws_active]
+        kws_peak = max(kws_peak, score)
+    return (None, pyaudio.paContinue)
+
+# One stream for every trial; PortAudio fills the buffer from its own
+# thread in large blocks while it is started
+stream = audio.open(format=FORMAT, channels=CHANNELS, rate=RATE, input=True,
+                    frames_per_buffer=CHUNK, stream_callback=on_audio, start=False)
+
+def record_clip(wake_word):
+    """
+    Record one attempt at a wake word
+    
+    Returns:
+        16 kHz float32 samples, or None if nothing was captured
+    """
+    input(f"Press ENTER to start recording '{wake_word}'...")
+    print(f"🎙️ RECORDING... Say: '{wake_word}' then press ENTER")
+    
+    global kws_active, kws_peak
+    buf.clear()
+    kws_active = KWS_MODELS.get(wake_word) if kws else None
+    kws_peak = 0.0
+    if kws_active:
+        kws.reset()
+    
+    # Recording runs until the next ENTER
+    stream.start_stream()
+    input()
+    stream.stop_stream()
+    
+    if not buf:
+        print("❌ No audio recorded")
+        return None
+    
+    print("✅ Recorded")
+    if kws_active:
+        detected = "detected" if kws_peak >= KWS_THRESHOLD else "not detected"
+        print(f"🔑 Keyword spotter: {detected} (peak score {kws_peak:.2f})")
+    # Whisper takes 16 kHz float32 samples directly, no WAV needed.
+    # paInt16 arrives in native byte order, so the buffer is viewed as-is
+    # and scaled in place rather than through a second temporary array
+    clip = np.frombuffer(buf, dtype=np.int16).astype(np.float32)
+    clip *= 1 / 32768.0
+    return clip
+
+# Transcripts of earlier runs, keyed by model and a hash of the samples
+TRANSCRIPT_DB = Path.home() / ".cache" / "voicenav" / "whisper.sqlite"
+TRANSCRIPT_DB.parent.mkdir(parents=True, exist_ok=True)
+transcript_db = sqlite3.connect(TRANSCRIPT_DB, check_same_thread=False)
+transcript_db.execute("CREATE TABLE IF NOT EXISTS transcripts (model TEXT, digest BLOB, text TEXT, "
+                      "PRIMARY KEY (model, digest))")
+transcript_db_lock = threading.Lock()
+
+def cached_transcribe(clips):
+    """
+    Transcribe clips, answering any already seen from the on-disk cache
+    
+    Only clips whose samples hash to an unknown key go to Whisper.
+    """
+    digests = [hashlib.blake2b(clip.tobytes(), digest_size=16).digest() for clip in clips]
+    with transcript_db_lock:
+        known = dict(transcript_db.execute(
+            f"SELECT digest, text FROM transcripts WHERE model = ? AND digest IN ({','.join('?' * len(digests))})",
+            (MODEL_NAME, *digests)
+        ).fetchall())
+    
+    misses = [i for i, digest in enumerate(digests) if digest not in known]
+    if misses:
+        texts = transcribe_batch([clips[i] for i in misses], batched_model=batched_model)
+        fresh = {digests[i]: text for i, text in zip(misses, texts)}
+        with transcript_db_lock, transcript_db:
+            transcript_db.executemany("INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?)",
+                                      [(MODEL_NAME, digest, text) for digest, text in fresh.items()])
+        known.update(fresh)
+    
+    return [known[digest] for digest in digests]
+
+def grade(wake_word, text):
+    """
+    Compare what Whisper heard with the wake word
+    
+    Returns:
+        str: "PERFECT", "PARTIAL" or "NO MATCH"
+    """
+    print(f"✅ Whisper heard for '{wake_word}': '{text}'")
+    
+    # Check accuracy
+    wake_word_clean = wake_word.lower()
+    if wake_word_clean in text:
+        print(f"🎉 PERFECT MATCH!")
+        return "PERFECT"
+    elif (wake_word_tokens.get(wake_word) or set(wake_word_clean.split())) & set(WORD_PATTERN.findall(text)):
+        print(f"✅ PARTIAL MATCH (some words recognized)")
+        return "PARTIAL"
+    else:
+        print(f"❌ NO MATCH")
+        return "NO MATCH"
+
+def test_wake_word(wake_word):
+    """Record, transcribe and grade a single wake word"""
+    clip = record_clip(wake_word)
+    if clip is None:
+        return "NO AUDIO"
+    print("🧠 Processing...")
+    return grade(wake_word, cached_transcribe([clip])[0])
+
+# First-pass clips are transcribed in the background while the next one
+# is being recorded, so only the last clip is waited for
+pending = queue.Queue()  # (wake word, samples) awaiting transcription
+transcripts = {}
+
+def transcribe_worker():
+    while True:
+        batch = [pending.get()]
+        # Clips that queued up meanwhile share the same batched call
+        while True:
+            try:
+                batch.append(pending.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            texts = cached_transcribe([clip for _, clip in batch])
+            transcripts.update((wake_word, text) for (wake_word, _), text in zip(batch, texts))
+        except Exception as e:
+            print(f"❌ Transcription failed: {e}")
+        finally:
+            for _ in batch:
+                pending.task_done()
+
+threading.Thread(target=transcribe_worker, daemon=True).start()
+
 try:
+    recorded = []
     for i, wake_word in enumerate(wake_words, 1):
-        print(f"\n🧪 TEST {i}/8: '{wake_word}'")
+        print(f"\n🧪 TEST {i}/{len(wake_words)}: '{wake_word}'")
         print("-" * 40)
-        
-        input(f"Press ENTER to start recording '{wake_word}'...")
-        print(f"🎙️ RECORDING... Say: '{wake_word}' then press ENTER")
-        
-        # Record
-        stream = audio.open(format=FORMAT, channels=CHANNELS, rate=RATE, 
-                          input=True, frames_per_buffer=CHUNK)
-        frames = []
-        
-        # Simple recording with timeout
-        import threading
-        recording = True
-        def stop():
-            global recording
-            input()
-            recording = False
-        
-        stop_thread = threading.Thread(target=stop)
-        stop_thread.daemon = True
-        stop_thread.start()
-        
-        while recording:
-            try:
-                data = stream.read(CHUNK, exception_on_overflow=False)
-                frames.append(data)
-            except:
-                break
-        
-        stream.stop_stream()
-        stream.close()
-        
-        # Process
-        if frames:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                wf = wave.open(temp_file.name, 'wb')
-                wf.setnchannels(CHANNELS)
-                wf.setsampwidth(audio.get_sample_size(FORMAT))
-                wf.setframerate(RATE)
-                wf.writeframes(b''.join(frames))
-                wf.close()
-                
-                print("🧠 Processing...")
-                result = model.transcribe(temp_file.name)
-                text = result["text"].strip().lower()
-                os.unlink(temp_file.name)
-            
-            print(f"✅ Whisper heard: '{text}'")
-            
-            # Check accuracy
-            wake_word_clean = wake_word.lower()
-            if wake_word_clean in text:
-                print(f"🎉 PERFECT MATCH!")
-                results[wake_word] = "PERFECT"
-            elif any(word in text for word in wake_word_clean.split()):
-                print(f"✅ PARTIAL MATCH (some words recognized)")
-                results[wake_word] = "PARTIAL"
-            else:
-                print(f"❌ NO MATCH")
-                results[wake_word] = "NO MATCH"
-        else:
-            print("❌ No audio recorded")
+        clip = record_clip(wake_word)
+        if clip is None:
             results[wake_word] = "NO AUDIO"
+        else:
+            pending.put((wake_word, clip))
+            recorded.append(wake_word)
+    
+    if recorded:
+        print(f"\n🧠 Whisper finishing {len(recorded)} recordings...")
+        pending.join()
+        for wake_word in recorded:
+            results[wake_word] = grade(wake_word, transcripts.get(wake_word, ""))
+    
+    # Tuning rounds reuse the loaded model instead of re-running the script
+    while True:
+        choice = input("\n🔁 Re-test a number, type a new phrase, or press ENTER to finish: ").strip()
+        if not choice:
+            break
+        if choice.isdigit() and 1 <= int(choice) <= len(wake_words):
+            wake_word = wake_words[int(choice) - 1]
+        else:
+            wake_word = choice.lower()
+        results[wake_word] = test_wake_word(wake_word)
 
 except KeyboardInterrupt:
     print("\n🛑 Stopping early...")
 
 finally:
+    stream.close()
     audio.terminate()
+    transcript_db.close()
 
 # Show final results
 print("\n" + "=" * 60)
@@ -5,16 +5,20 @@ Tests browser automation functionality
 """
 
 import sys
-import os
 import asyncio
 
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from voicenav.actions.browser_control import BrowserController
 
-from actions.browser_control import BrowserController
+# pytest-asyncio lets pytest drive these checks with one shared browser
+try:
+    import pytest
+    import pytest_asyncio
+    PYTEST_ASYNCIO_AVAILABLE = True
+except ImportError:
+    PYTEST_ASYNCIO_AVAILABLE = False
 
 
-async def test_browser_initialization():
+async def initialize_browser():
     """Test browser initialization"""
     print("🌐 Testing Browser Initialization")
     print("-" * 40)
@@ -45,7 +49,32 @@ async def test_browser_initialization():
         return None
 
 
-async def test_navigation(controller):
+async def fork_controller(controller):
+    """
+    Create a controller with its own page in a fresh context of an already running browser
+    
+    Args:
+        controller: Initialized BrowserController whose browser is shared
+    
+    Returns:
+        BrowserController: Controller driving the new page
+    """
+    context = await controller.browser.new_context(viewport={"width": 1280, "height": 720})
+    
+    forked = BrowserController()
+    forked.page = await context.new_page()
+    forked.is_initialized = True
+    return forked
+
+
+async def close_forked(forked):
+    """Close a forked controller's context, leaving the shared browser running"""
+    if forked.page:
+        await forked.page.context.close()
+        forked.page = None
+
+
+async def check_navigation(controller):
     """Test URL navigation"""
     print("\n🔗 Testing Navigation")
     print("-" * 40)
@@ -79,9 +108,6 @@ async def test_navigation(controller):
                     print(f"   Current URL: {current_url}")
                 
                 passed += 1
-                
-                # Wait a bit between tests
-                await asyncio.sleep(2)
             else:
                 print(f"❌ Failed to open {name}")
                 
@@ -92,7 +118,7 @@ async def test_navigation(controller):
     return passed == len(test_urls)
 
 
-async def test_scrolling(controller):
+async def check_scrolling(controller):
     """Test page scrolling"""
     print("\n📜 Testing Scrolling")
     print("-" * 40)
@@ -103,8 +129,8 @@ async def test_scrolling(controller):
     
     try:
         # Ensure we're on a page with content
+        # open_url returns once the page is network-idle
         await controller.open_url("https://example.com", "example")
-        await asyncio.sleep(1)
         
         # Test scroll down
         print("Testing scroll down...")
@@ -115,8 +141,6 @@ async def test_scrolling(controller):
         else:
             print("❌ Scroll down failed")
         
-        await asyncio.sleep(1)
-        
         # Test scroll up
         print("Testing scroll up...")
         success_up = await controller.scroll_page('up', 200)
@@ -134,7 +158,7 @@ async def test_scrolling(controller):
         return False
 
 
-async def test_content_reading(controller):
+async def check_content_reading(controller):
     """Test content reading"""
     print("\n📖 Testing Content Reading")
     print("-" * 40)
@@ -146,7 +170,6 @@ async def test_content_reading(controller):
     try:
         # Navigate to a page with content
         await controller.open_url("https://example.com", "example")
-        await asyncio.sleep(2)
         
         print("Testing content reading...")
         success = await controller.read_content('main')
@@ -165,7 +188,7 @@ async def test_content_reading(controller):
         return False
 
 
-async def test_navigation_controls(controller):
+async def check_navigation_controls(controller):
     """Test back/forward navigation"""
     print("\n⬅️➡️ Testing Navigation Controls")
     print("-" * 40)
@@ -177,11 +200,9 @@ async def test_navigation_controls(controller):
     try:
         # Navigate to first page
         await controller.open_url("https://example.com", "example")
-        await asyncio.sleep(1)
         
         # Navigate to second page
         await controller.open_url("https://httpbin.org/html", "httpbin")
-        await asyncio.sleep(1)
         
         # Test go back
         print("Testing go back...")
@@ -195,8 +216,6 @@ async def test_navigation_controls(controller):
         else:
             print("❌ Go back failed")
         
-        await asyncio.sleep(1)
-        
         # Test go forward
         print("Testing go forward...")
         success_forward = await controller.go_forward()
@@ -218,7 +237,7 @@ async def test_navigation_controls(controller):
         return False
 
 
-async def test_command_execution(controller):
+async def check_command_execution(controller):
     """Test complete command execution"""
     print("\n🎯 Testing Command Execution")
     print("-" * 40)
@@ -253,25 +272,22 @@ async def test_command_execution(controller):
     
     passed = 0
     
-    for i, command in enumerate(test_commands, 1):
-        try:
-            intent = command['intent']
-            print(f"Executing command {i}: {intent}")
-            
-            success = await controller.execute_command(command)
-            
-            if success:
-                print(f"✅ Command {intent} executed successfully")
-                passed += 1
-            else:
-                print(f"❌ Command {intent} failed")
-            
-            # Wait between commands
-            if i < len(test_commands):
-                await asyncio.sleep(1)
-                
-        except Exception as e:
-            print(f"❌ Command execution error for {intent}: {e}")
+    # Consecutive scrolls are sent to the page as one batch
+    try:
+        outcomes = await controller.execute_batch(test_commands)
+    except Exception as e:
+        print(f"❌ Command execution error: {e}")
+        outcomes = [False] * len(test_commands)
+    
+    for i, (command, success) in enumerate(zip(test_commands, outcomes), 1):
+        intent = command['intent']
+        print(f"Executed command {i}: {intent}")
+        
+        if success:
+            print(f"✅ Command {intent} executed successfully")
+            passed += 1
+        else:
+            print(f"❌ Command {intent} failed")
     
     print(f"\n📊 Command Execution: {passed}/{len(test_commands)} tests passed")
     return passed == len(test_commands)
@@ -286,25 +302,27 @@ async def run_all_tests():
     
     try:
         # Test 1: Initialization
-        controller = await test_browser_initialization()
+        controller = await initialize_browser()
         if not controller:
             print("\n❌ Cannot proceed without browser controller")
             return False
         
-        # Test 2: Navigation
-        nav_passed = await test_navigation(controller)
-        
-        # Test 3: Scrolling
-        scroll_passed = await test_scrolling(controller)
-        
-        # Test 4: Content Reading
-        content_passed = await test_content_reading(controller)
-        
-        # Test 5: Navigation Controls
-        controls_passed = await test_navigation_controls(controller)
+        # Tests 2-5 each navigate on their own page, so they run concurrently
+        # under the one browser process
+        forks = [await fork_controller(controller) for _ in range(4)]
+        try:
+            nav_passed, scroll_passed, content_passed, controls_passed = await asyncio.gather(
+                check_navigation(forks[0]),
+                check_scrolling(forks[1]),
+                check_content_reading(forks[2]),
+                check_navigation_controls(forks[3])
+            )
+        finally:
+            for forked in forks:
+                await close_forked(forked)
         
         # Test 6: Command Execution
-        commands_passed = await test_command_execution(controller)
+        commands_passed = await check_command_execution(controller)
         
         # Results summary
         tests = [
@@ -348,6 +366,37 @@ async def run_all_tests():
             print("✅ Cleanup complete")
 
 
+if PYTEST_ASYNCIO_AVAILABLE:
+    # One Chromium launch for the whole module instead of one per test
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def controller():
+        controller = await initialize_browser()
+        if not controller:
+            pytest.skip("Browser could not be initialized")
+        yield controller
+        await controller.cleanup()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_navigation(controller):
+        assert await check_navigation(controller)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_scrolling(controller):
+        assert await check_scrolling(controller)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_content_reading(controller):
+        assert await check_content_reading(controller)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_navigation_controls(controller):
+        assert await check_navigation_controls(controller)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_command_execution(controller):
+        assert await check_command_execution(controller)
+
+
 def main():
     """Run browser tests"""
     try:
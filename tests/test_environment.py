@@ -2,11 +2,14 @@
 Environment Test Script for VoiceNav
 Tests Python version, dependencies, and system capabilities
 """
+import os
 import sys
-import platform
 import importlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from voicenav.utils.sysinfo import platform_name, processor, machine
+
 # Color codes for terminal output
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -58,9 +61,9 @@ def check_system_info():
     """Print system information"""
     print_header("System Information")
     
-    print(f"Platform: {platform.platform()}")
-    print(f"Processor: {platform.processor()}")
-    print(f"Architecture: {platform.machine()}")
+    print(f"Platform: {platform_name()}")
+    print(f"Processor: {processor()}")
+    print(f"Architecture: {machine()}")
     print(f"Python Executable: {sys.executable}")
     
     # Check for macOS
@@ -72,6 +75,15 @@ def check_system_info():
         return True
 
 
+def _import_error(module_name):
+    """Import a module, returning the ImportError instead of raising it"""
+    try:
+        importlib.import_module(module_name)
+        return None
+    except ImportError as e:
+        return e
+
+
 def check_dependencies():
     """Check if required dependencies can be imported"""
     print_header("Dependency Check")
@@ -85,14 +97,17 @@ def check_dependencies():
         ("dotenv", "python-dotenv"),
     ]
     
+    # Import concurrently; native extensions release the GIL while loading
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+        errors = list(executor.map(_import_error, [module_name for module_name, _ in dependencies]))
+    
     all_ok = True
     
-    for module_name, package_name in dependencies:
-        try:
-            importlib.import_module(module_name)
+    for (module_name, package_name), error in zip(dependencies, errors):
+        if error is None:
             print_success(f"{package_name} is installed")
-        except ImportError as e:
-            print_error(f"{package_name} is NOT installed: {e}")
+        else:
+            print_error(f"{package_name} is NOT installed: {error}")
             all_ok = False
     
     return all_ok
@@ -120,6 +135,29 @@ def check_microphone_access():
         return False
 
 
+def _list_entries(root, parents):
+    """
+    Scan each parent directory once and sort its entries into dirs and files
+    
+    Args:
+        root: Project root the parents are relative to
+        parents: Relative directory names to scan ("." for the root)
+    
+    Returns:
+        tuple: (set of relative dir paths, set of relative file paths)
+    """
+    dirs, files = set(), set()
+    for parent in parents:
+        try:
+            with os.scandir(root / parent) as entries:
+                for entry in entries:
+                    relative = os.path.normpath(os.path.join(parent, entry.name))
+                    (dirs if entry.is_dir() else files).add(relative)
+        except OSError:
+            pass
+    return dirs, files
+
+
 def check_project_structure():
     """Check if project structure is correct"""
     print_header("Project Structure Check")
@@ -141,19 +179,22 @@ def check_project_structure():
         "src/utils/logger.py",
     ]
     
+    # One listing per parent directory instead of a stat per entry
+    existing_dirs, existing_files = _list_entries(
+        project_root, {str(Path(name).parent) for name in required_dirs + required_files}
+    )
+    
     all_ok = True
     
     for dir_name in required_dirs:
-        dir_path = project_root / dir_name
-        if dir_path.exists() and dir_path.is_dir():
+        if dir_name in existing_dirs:
             print_success(f"Directory exists: {dir_name}")
         else:
             print_error(f"Directory missing: {dir_name}")
             all_ok = False
     
     for file_name in required_files:
-        file_path = project_root / file_name
-        if file_path.exists() and file_path.is_file():
+        if file_name in existing_files:
             print_success(f"File exists: {file_name}")
         else:
             print_error(f"File missing: {file_name}")
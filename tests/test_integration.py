@@ -5,18 +5,65 @@ Tests complete Maya + Parser + Browser integration
 """
 
 import sys
-import os
 import asyncio
 import threading
-import queue
 import time
 
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from voicenav.input.voice_listener import create_voice_listener
+from voicenav.brain.command_parser import CommandParser
+from voicenav.actions.browser_control import BrowserController
 
-from input.voice_listener import create_voice_listener
-from brain.command_parser import CommandParser
-from actions.browser_control import BrowserController
+# Intents that load a new URL; each one starts a browser context of its own
+URL_INTENTS = {'open_url'}
+# Intents that never touch the page
+PAGE_FREE_INTENTS = {'help', 'stop_action'}
+
+
+async def ainput(prompt=""):
+    """
+    input() for coroutines: a daemon thread waits on stdin while the event loop keeps running
+    
+    Args:
+        prompt: Text shown before reading
+    
+    Returns:
+        str: The line typed, without the newline
+    """
+    loop = asyncio.get_running_loop()
+    line = loop.create_future()
+    
+    def deliver(setter, value):
+        if not line.done():
+            setter(value)
+    
+    def read():
+        try:
+            loop.call_soon_threadsafe(deliver, line.set_result, input(prompt))
+        except Exception as e:
+            loop.call_soon_threadsafe(deliver, line.set_exception, e)
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await line
+
+
+async def execute_in_order(browser, commands):
+    """
+    Execute parsed commands one after another on one controller
+    
+    Args:
+        browser: BrowserController to run them on
+        commands: Parsed commands from CommandParser
+    
+    Returns:
+        list: Success flag, or the exception raised, per command
+    """
+    outcomes = []
+    for parsed in commands:
+        try:
+            outcomes.append(await browser.execute_command(parsed))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
 
 
 class IntegrationTester:
@@ -29,8 +76,6 @@ class IntegrationTester:
         self.maya = None
         self.parser = None
         self.browser = None
-        self.command_queue = queue.Queue()
-        self.test_results = []
     
     async def initialize_components(self):
         """Initialize all Stage 2 components"""
@@ -102,6 +147,20 @@ class IntegrationTester:
         print(f"\n📊 Voice→Parser: {passed}/{len(test_commands)} tests passed")
         return passed == len(test_commands)
     
+    async def fork_browser(self):
+        """
+        Create a controller with its own page in a fresh context of the running browser
+        
+        Returns:
+            BrowserController: Controller driving the new page
+        """
+        context = await self.browser.browser.new_context(viewport={"width": 1280, "height": 720})
+        
+        forked = BrowserController()
+        forked.page = await context.new_page()
+        forked.is_initialized = True
+        return forked
+    
     async def test_parser_to_browser(self):
         """Test parser → browser pipeline"""
         print("\n🔗 Testing Parser → Browser Pipeline")
@@ -122,8 +181,8 @@ class IntegrationTester:
             }
         ]
         
-        passed = 0
-        
+        # Parse everything first; only correctly parsed commands run
+        to_execute = []
         for test in test_commands:
             try:
                 command_text = test['text']
@@ -134,27 +193,74 @@ class IntegrationTester:
                 
                 if parsed['intent'] == expected_intent:
                     print(f"✅ Parse: '{command_text}' → {parsed['intent']}")
-                    
-                    # Execute in browser
-                    success = await self.browser.execute_command(parsed)
-                    
-                    if success:
-                        print(f"✅ Execute: {parsed['intent']} completed")
-                        passed += 1
-                    else:
-                        print(f"❌ Execute: {parsed['intent']} failed")
+                    to_execute.append(parsed)
                 else:
                     print(f"❌ Parse: '{command_text}' → {parsed['intent']} (expected {expected_intent})")
                 
-                # Wait between commands
-                await asyncio.sleep(2)
-                
             except Exception as e:
                 print(f"❌ '{test['text']}' → error: {e}")
         
+        # Every URL change starts a chain on a fresh browser context, and the
+        # commands after it act on the page it loaded. Chains run concurrently
+        # with each other and with the page-free commands.
+        page_free = []
+        chains = []
+        for parsed in to_execute:
+            if parsed['intent'] in PAGE_FREE_INTENTS:
+                page_free.append(parsed)
+            elif parsed['intent'] in URL_INTENTS or not chains:
+                chains.append([parsed])
+            else:
+                chains[-1].append(parsed)
+        
+        browsers = [await self.fork_browser() for _ in chains]
+        try:
+            results = await asyncio.gather(
+                execute_in_order(self.browser, page_free),
+                *(execute_in_order(browser, chain) for browser, chain in zip(browsers, chains))
+            )
+        finally:
+            for browser in browsers:
+                await browser.page.context.close()
+        
+        executed = page_free + [parsed for chain in chains for parsed in chain]
+        outcomes = [outcome for result in results for outcome in result]
+        
+        passed = 0
+        for parsed, outcome in zip(executed, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❌ Execute: {parsed['intent']} → error: {outcome}")
+            elif outcome:
+                print(f"✅ Execute: {parsed['intent']} completed")
+                passed += 1
+            else:
+                print(f"❌ Execute: {parsed['intent']} failed")
+        
         print(f"\n📊 Parser→Browser: {passed}/{len(test_commands)} tests passed")
         return passed == len(test_commands)
     
+    def listen_for_command(self, timeout):
+        """
+        Listen until Maya hears a command or the timeout passes
+        
+        Args:
+            timeout: Seconds to keep listening
+        
+        Returns:
+            dict: Voice result with 'raw_text', or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        
+        while time.monotonic() < deadline:
+            try:
+                voice_result = self.maya.listen_once()
+            except Exception:
+                continue
+            if voice_result and voice_result.get('raw_text'):
+                return voice_result
+        
+        return None
+    
     async def test_interactive_integration(self):
         """Test interactive Maya → Parser → Browser pipeline"""
         print("\n🎯 Testing Interactive Integration")
@@ -164,7 +270,7 @@ class IntegrationTester:
         
         # Ask user if they want to run interactive test
         try:
-            response = input("\nRun interactive voice test? (y/n): ").lower().strip()
+            response = (await ainput("\nRun interactive voice test? (y/n): ")).lower().strip()
             if response != 'y':
                 print("⏭️  Skipping interactive test")
                 return True
@@ -180,7 +286,7 @@ class IntegrationTester:
         print("\nPress ENTER when ready...")
         
         try:
-            input()
+            await ainput()
         except KeyboardInterrupt:
             print("⏭️  Test cancelled")
             return True
@@ -196,23 +302,8 @@ class IntegrationTester:
             try:
                 print(f"\n🎤 Waiting for command {i+1}/{commands_to_test}...")
                 
-                # Use a timeout for voice listening
-                voice_result = None
-                
-                # Simple timeout mechanism
-                start_time = time.time()
-                timeout = 30  # 30 seconds per command
-                
-                while time.time() - start_time < timeout:
-                    try:
-                        # Try to get voice input
-                        voice_result = self.maya.listen_once()
-                        if voice_result and voice_result.get('raw_text'):
-                            break
-                    except:
-                        pass
-                    
-                    await asyncio.sleep(0.1)
+                # Listen on a worker thread so the event loop stays free
+                voice_result = await asyncio.to_thread(self.listen_for_command, 30)
                 
                 if voice_result and voice_result.get('raw_text'):
                     command_text = voice_result['raw_text']
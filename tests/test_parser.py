@@ -4,21 +4,73 @@ Test Script for VoiceNav Command Parser
 Tests command parsing accuracy for all 8 core commands
 """
 
+import io
 import sys
-import os
+import contextlib
+import functools
 
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from voicenav.brain.command_parser import CommandParser
 
-from brain.command_parser import CommandParser
 
+@functools.lru_cache(maxsize=1)
+def get_parser():
+    """Build the CommandParser (and its compiled patterns) once for all tests"""
+    return CommandParser()
 
+
+@contextlib.contextmanager
+def buffered_output():
+    """Collect a test's prints and write them to stdout in one go"""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+# Parameter check per intent; intents without an entry only need the intent to match
+_PARAM_CHECKS = {
+    'open_url': lambda params, expected: params.get('url') == expected,
+    'click_element': lambda params, expected: expected.lower() in params.get('text', '').lower(),
+    'scroll_down': lambda params, expected: params.get('direction') == expected,
+    'scroll_up': lambda params, expected: params.get('direction') == expected,
+    'read_content': lambda params, expected: params.get('target') == expected,
+}
+
+
+def _make_checker(expected_intent, expected_param):
+    """
+    Build a grader for one test case with its expectations resolved up front
+    
+    Args:
+        expected_intent: Intent the parser should return
+        expected_param: Expected parameter value, or None if not checked
+    
+    Returns:
+        Callable taking a parse result and returning (intent_correct, param_correct)
+    """
+    param_check = _PARAM_CHECKS.get(expected_intent) if expected_param is not None else None
+    
+    if param_check is None:
+        def check(result):
+            return result['intent'] == expected_intent, True
+    else:
+        def check(result):
+            return (result['intent'] == expected_intent,
+                    param_check(result['params'], expected_param))
+    
+    return check
+
+
+@buffered_output()
 def test_command_parser():
     """Test command parser with various inputs"""
     print("🧠 VoiceNav Command Parser Test")
     print("=" * 40)
     
-    parser = CommandParser()
+    parser = get_parser()
     
     # Test cases with expected results
     test_cases = [
@@ -85,27 +137,17 @@ def test_command_parser():
     passed = 0
     total = len(test_cases)
     
-    for i, (input_text, expected_intent, expected_param) in enumerate(test_cases, 1):
-        result = parser.parse(input_text)
-        
+    # One column per field, then parse the whole batch up front and grade it
+    inputs, expected_intents, expected_params = zip(*test_cases)
+    checkers = [_make_checker(ei, ep) for ei, ep in zip(expected_intents, expected_params)]
+    results = [parser.parse(input_text) for input_text in inputs]
+    
+    for i, (input_text, expected_intent, expected_param, result, check) in enumerate(
+            zip(inputs, expected_intents, expected_params, results, checkers), 1):
         intent = result['intent']
         params = result['params']
         confidence = result['confidence']
-        
-        # Check if intent matches
-        intent_correct = intent == expected_intent
-        
-        # Check specific parameter based on intent
-        param_correct = True
-        if expected_param is not None:
-            if intent == 'open_url':
-                param_correct = params.get('url') == expected_param
-            elif intent == 'click_element':
-                param_correct = expected_param.lower() in params.get('text', '').lower()
-            elif intent in ['scroll_down', 'scroll_up']:
-                param_correct = params.get('direction') == expected_param
-            elif intent == 'read_content':
-                param_correct = params.get('target') == expected_param
+        intent_correct, param_correct = check(result)
         
         # Overall result
         test_passed = intent_correct and param_correct
@@ -135,12 +177,13 @@ def test_command_parser():
         return False
 
 
+@buffered_output()
 def test_url_normalization():
     """Test URL normalization functionality"""
     print("\n🔗 Testing URL Normalization")
     print("-" * 40)
     
-    parser = CommandParser()
+    parser = get_parser()
     
     url_tests = [
         ("google", "https://google.com"),
@@ -172,12 +215,13 @@ def test_url_normalization():
     return passed == len(url_tests)
 
 
+@buffered_output()
 def test_element_parsing():
     """Test element description parsing"""
     print("\n🎯 Testing Element Parsing")
     print("-" * 40)
     
-    parser = CommandParser()
+    parser = get_parser()
     
     element_tests = [
         ("login button", "button", "login"),
@@ -7,12 +7,10 @@ Unit tests for VoiceNav Stage 3 UI components
 import unittest
 import sys
 import os
+import tempfile
+import importlib.util
 from unittest.mock import Mock, patch
 
-# Add src directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.append('src')
-
 
 class TestUIModuleImports(unittest.TestCase):
     """Test UI module imports"""
@@ -20,15 +18,15 @@ class TestUIModuleImports(unittest.TestCase):
     def test_ui_package_import(self):
         """Test UI package can be imported"""
         try:
-            import src.ui
-            self.assertTrue(hasattr(src.ui, 'VoiceNavMenuBar'))
+            import voicenav.ui
+            self.assertTrue(hasattr(voicenav.ui, 'VoiceNavMenuBar'))
         except ImportError as e:
             self.fail(f"UI package import failed: {e}")
     
     def test_menu_bar_import(self):
         """Test menu bar module import"""
         try:
-            from src.ui.menu_bar import VoiceNavMenuBar
+            from voicenav.ui.menu_bar import VoiceNavMenuBar
             self.assertTrue(callable(VoiceNavMenuBar))
         except ImportError as e:
             self.skipTest(f"Menu bar import failed (rumps not available?): {e}")
@@ -36,7 +34,7 @@ class TestUIModuleImports(unittest.TestCase):
     def test_settings_panel_import(self):
         """Test settings panel import"""
         try:
-            from src.ui.settings_panel import VoiceNavSettingsPanel
+            from voicenav.ui.settings_panel import VoiceNavSettingsPanel
             self.assertTrue(callable(VoiceNavSettingsPanel))
         except ImportError as e:
             self.skipTest(f"Settings panel import failed (tkinter/yaml not available?): {e}")
@@ -48,7 +46,7 @@ class TestSettingsPanel(unittest.TestCase):
     def setUp(self):
         """Setup test environment"""
         try:
-            from src.ui.settings_panel import VoiceNavSettingsPanel
+            from voicenav.ui.settings_panel import VoiceNavSettingsPanel
             self.settings_class = VoiceNavSettingsPanel
         except ImportError:
             self.skipTest("Settings panel not available")
@@ -87,6 +85,47 @@ class TestSettingsPanel(unittest.TestCase):
             self.assertTrue(hasattr(panel, 'vars'))
         except Exception as e:
             self.fail(f"Settings panel creation failed: {e}")
+    
+    def test_settings_schema(self):
+        """Test settings schema has unique keys and dotted config paths"""
+        schema = self.settings_class._SETTINGS_SCHEMA
+        keys = [row[1] for row in schema]
+        self.assertEqual(len(keys), len(set(keys)))
+        
+        for row in schema:
+            self.assertEqual(len(row[4].split('.')), 2, f"Bad config path: {row[4]}")
+            self.assertIn(row[6], list(self.settings_class._WIDGETS) + ['check'])
+    
+    def test_dotted_config_lookup(self):
+        """Test dotted-path config lookup with defaults"""
+        panel = Mock()
+        panel.config = {'voice': {'wake_word': 'Hey Maya'}}
+        panel._cfg_cache = {}
+        
+        self.assertEqual(self.settings_class._cfg(panel, 'voice.wake_word', 'x'), 'Hey Maya')
+        self.assertEqual(self.settings_class._cfg(panel, 'voice.timeout', 5), 5)
+        self.assertEqual(self.settings_class._cfg(panel, 'tts.voice', 'Samantha'), 'Samantha')
+        self.assertIn('voice.wake_word', panel._cfg_cache)
+    
+    def test_config_cache(self):
+        """Test parsed config is cached and handed out as copies"""
+        from voicenav.ui.settings_panel import _read_config_cached
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_path = os.path.join(tmp_dir, 'config.yaml')
+            with open(config_path, 'w') as f:
+                f.write("voice:\n  wake_word: Hey Maya\n")
+            
+            first = _read_config_cached(config_path)
+            first['voice']['wake_word'] = 'changed'
+            second = _read_config_cached(config_path)
+            self.assertEqual(second['voice']['wake_word'], 'Hey Maya')
+            
+            # Rewriting the file invalidates the cached entry
+            with open(config_path, 'w') as f:
+                f.write("voice:\n  wake_word: Hey Nova!\n")
+            third = _read_config_cached(config_path)
+            self.assertEqual(third['voice']['wake_word'], 'Hey Nova!')
 
 
 class TestMenuBar(unittest.TestCase):
@@ -95,7 +134,7 @@ class TestMenuBar(unittest.TestCase):
     def setUp(self):
         """Setup test environment"""
         try:
-            from src.ui.menu_bar import VoiceNavMenuBar
+            from voicenav.ui.menu_bar import VoiceNavMenuBar
             self.menu_class = VoiceNavMenuBar
         except ImportError:
             self.skipTest("Menu bar not available (rumps required)")
@@ -130,17 +169,17 @@ class TestMainIntegration(unittest.TestCase):
     def test_main_imports(self):
         """Test main.py can import required modules"""
         try:
-            import src.main
-            self.assertTrue(hasattr(src.main, 'run_menu_bar'))
-            self.assertTrue(hasattr(src.main, 'run_settings'))
-            self.assertTrue(hasattr(src.main, 'parse_args'))
+            import voicenav.main
+            self.assertTrue(hasattr(voicenav.main, 'run_menu_bar'))
+            self.assertTrue(hasattr(voicenav.main, 'run_settings'))
+            self.assertTrue(hasattr(voicenav.main, 'parse_args'))
         except ImportError as e:
             self.fail(f"Main module import failed: {e}")
     
     def test_argument_parser(self):
         """Test command line argument parsing"""
         try:
-            from src.main import parse_args
+            from voicenav.main import parse_args
             
             # Test with mock arguments
             with patch('sys.argv', ['main.py', '--help']):
@@ -160,40 +199,53 @@ class TestConfigIntegration(unittest.TestCase):
         """Test config.yaml exists and has UI section"""
         try:
             import yaml
+            try:
+                from yaml import CSafeLoader as SafeLoader
+            except ImportError:
+                from yaml import SafeLoader
             config_path = 'config.yaml'
             
-            if os.path.exists(config_path):
+            # A single open() both checks for the file and reads it
+            try:
                 with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                
-                # Check UI section exists
-                self.assertIn('ui', config, "config.yaml missing 'ui' section")
-                
-                # Check UI settings
-                ui_config = config['ui']
-                expected_keys = ['show_notifications', 'auto_start', 'minimize_to_tray', 'icon_style']
-                
-                for key in expected_keys:
-                    self.assertIn(key, ui_config, f"UI config missing '{key}'")
-            else:
+                    config = yaml.load(f, Loader=SafeLoader)
+            except FileNotFoundError:
                 self.skipTest("config.yaml not found")
+            
+            # Check UI section exists
+            self.assertIn('ui', config, "config.yaml missing 'ui' section")
+            
+            # Check UI settings
+            ui_config = config['ui']
+            expected_keys = ['show_notifications', 'auto_start', 'minimize_to_tray', 'icon_style']
+            
+            for key in expected_keys:
+                self.assertIn(key, ui_config, f"UI config missing '{key}'")
                 
         except ImportError:
             self.skipTest("PyYAML not available")
+        except unittest.SkipTest:
+            raise
         except Exception as e:
             self.fail(f"Config test failed: {e}")
 
 
+# pytest-xdist is optional; without it run_ui_tests uses the unittest runner
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+
 def run_ui_tests():
     """Run all UI tests"""
     print("🧪 Running VoiceNav UI Tests")
     print("=" * 50)
     
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
+    # With pytest-xdist the classes run in parallel worker processes, so the
+    # slow rumps/tkinter imports happen concurrently instead of one by one
+    if XDIST_AVAILABLE:
+        import pytest
+        return pytest.main([__file__, '-n', 'auto', '--tb=short']) == pytest.ExitCode.OK
     
-    # Add test cases
+    # Test cases
     test_classes = [
         TestUIModuleImports,
         TestSettingsPanel,
@@ -202,9 +254,10 @@ def run_ui_tests():
         TestConfigIntegration
     ]
     
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+    # The classes are already imported, so building the suite is just a
+    # dir() per class; one loader builds it in a single pass
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(map(loader.loadTestsFromTestCase, test_classes))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
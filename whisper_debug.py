@@ -4,22 +4,25 @@ Whisper-powered speech recognition debug
 Much more accurate than Google Speech API
 """
 
-import whisper
+import collections
+
+import numpy as np
 import pyaudio
-import wave
-import tempfile
-import os
+import queue
 import time
 
+from whisper_runtime import WAKE_MODEL_SIZE, load_model, to_float32, warmup, transcribe, transcribe_batch
+
 print("🎤 Whisper Speech Recognition Debug")
 print("=" * 50)
-print("Using OpenAI Whisper (offline, much more accurate)")
+print(f"Using faster-whisper, model {WAKE_MODEL_SIZE} (offline, much more accurate)")
 print("Press Ctrl+C to stop")
 print()
 
-# Load Whisper model (small model for speed)
+# Load Whisper model (small English-only model: this loop only listens for wake words)
 print("🧠 Loading Whisper model...")
-model = whisper.load_model("base")  # Good balance of speed/accuracy
+load_model(WAKE_MODEL_SIZE)
+warmup(WAKE_MODEL_SIZE)
 print("✅ Whisper model loaded!")
 print()
 
@@ -30,75 +33,130 @@ CHANNELS = 1
 RATE = 16000  # Whisper prefers 16kHz
 RECORD_SECONDS = 3  # Record 3-second chunks
 
+# Silence gate: chunks quieter than SPEECH_RATIO x the ambient noise floor never
+# reach Whisper. The floor is a low percentile of every recent chunk's int16 RMS,
+# so it tracks loud rooms too while the (rarer) speech chunks barely move it
+NOISE_FLOOR_MIN = 100.0
+NOISE_FLOOR_PERCENTILE = 20
+NOISE_HISTORY = 20
+SPEECH_RATIO = 3.0
+
+# At most QUEUE_DEPTH recorded chunks wait for Whisper
+QUEUE_DEPTH = 4
+
 # Initialize PyAudio
 audio = pyaudio.PyAudio()
 
+# Recorded chunks waiting for Whisper; the mic keeps streaming while
+# the main thread transcribes
+chunks = queue.Queue(maxsize=QUEUE_DEPTH)
+dropped = 0
+
+# The callback writes samples straight into one preallocated chunk buffer
+record = np.empty(RATE * RECORD_SECONDS, dtype=np.int16)
+filled = 0
+
+def on_audio(in_data, frame_count, time_info, status):
+    global dropped, filled
+    data = np.frombuffer(in_data, dtype=np.int16)
+    while len(data):
+        n = min(len(data), len(record) - filled)
+        record[filled:filled + n] = data[:n]
+        filled += n
+        data = data[n:]
+        if filled == len(record):
+            try:
+                chunks.put_nowait(record.copy())
+            except queue.Full:
+                # Whisper is behind; drop the chunk rather than block the audio thread
+                dropped += 1
+            filled = 0
+    return (None, pyaudio.paContinue)
+
+# One callback-mode stream records continuously for the whole session
+stream = audio.open(format=FORMAT,
+                  channels=CHANNELS,
+                  rate=RATE,
+                  input=True,
+                  frames_per_buffer=CHUNK,
+                  stream_callback=on_audio)
+
 print("🎤 LISTENING - Whisper will analyze 3-second chunks:")
 print("-" * 50)
 
 count = 0
+recent_rms = collections.deque(maxlen=NOISE_HISTORY)
 try:
     while True:
-        count += 1
-        
-        # Record audio chunk
-        print(f"[{count:03d}] 🎙️ Recording 3 seconds...")
-        
-        stream = audio.open(format=FORMAT,
-                          channels=CHANNELS,
-                          rate=RATE,
-                          input=True,
-                          frames_per_buffer=CHUNK)
-        
-        frames = []
-        for i in range(0, int(RATE / CHUNK * RECORD_SECONDS)):
-            data = stream.read(CHUNK)
-            frames.append(data)
+        # Wait for the next recorded chunk; any that queued up while Whisper
+        # was busy are taken too and share one batched call
+        batch = [chunks.get()]
+        while True:
+            try:
+                batch.append(chunks.get_nowait())
+            except queue.Empty:
+                break
         
-        stream.stop_stream()
-        stream.close()
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            wf = wave.open(temp_file.name, 'wb')
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(audio.get_sample_size(FORMAT))
-            wf.setframerate(RATE)
-            wf.writeframes(b''.join(frames))
-            wf.close()
-            
-            # Process with Whisper
-            print(f"[{count:03d}] 🧠 Processing with Whisper...")
-            result = model.transcribe(temp_file.name)
-            text = result["text"].strip().lower()
+        speech = []
+        for samples in batch:
+            count += 1
             
-            # Clean up temp file
-            os.unlink(temp_file.name)
-        
-        # Show results
-        if text:
-            print(f"[{count:03d}] 🎤 HEARD: '{text}'")
+            # Hand Whisper the samples directly: no WAV file or ffmpeg decode
+            pcm = to_float32(samples)
             
-            # Check for wake word
-            if 'hey voicenav' in text or 'hey voice nav' in text:
-                print(f"[{count:03d}] ✅ WAKE WORD DETECTED!")
-                print("     🔊 *BEEP* - This would trigger command mode!")
+            # Skip the encoder entirely on chunks at the noise floor (int16 RMS)
+            rms = float(np.sqrt(np.mean(pcm * pcm))) * 32768.0
+            # Judge against earlier chunks only, so a chunk never masks itself
+            noise_floor = NOISE_FLOOR_MIN
+            if recent_rms:
+                noise_floor = max(noise_floor, float(np.percentile(recent_rms, NOISE_FLOOR_PERCENTILE)))
+            recent_rms.append(rms)
+            if rms < SPEECH_RATIO * noise_floor:
+                print(f"[{count:03d}] 🔇 (silence, rms {rms:.0f})")
+                print()
+                continue
             
-            # Check for other keywords
-            if any(word in text for word in ['hello', 'computer', 'assistant']):
-                print(f"[{count:03d}] 💬 Common greeting detected")
-                
+            speech.append((count, pcm))
+        
+        if not speech:
+            continue
+        
+        # Process with Whisper
+        print(f"[{speech[0][0]:03d}] 🧠 Processing {len(speech)} chunk(s) with Whisper...")
+        if len(speech) == 1:
+            texts = [transcribe(speech[0][1], WAKE_MODEL_SIZE)]
         else:
-            print(f"[{count:03d}] 🔇 (silence or no speech)")
+            texts = transcribe_batch([pcm for _, pcm in speech], WAKE_MODEL_SIZE)
         
-        print()
+        # Show results
+        for n, text in zip((n for n, _ in speech), texts):
+            if text:
+                print(f"[{n:03d}] 🎤 HEARD: '{text}'")
+                
+                # Check for wake word
+                if 'hey voicenav' in text or 'hey voice nav' in text:
+                    print(f"[{n:03d}] ✅ WAKE WORD DETECTED!")
+                    print("     🔊 *BEEP* - This would trigger command mode!")
+                
+                # Check for other keywords
+                if any(word in text for word in ['hello', 'computer', 'assistant']):
+                    print(f"[{n:03d}] 💬 Common greeting detected")
+                    
+            else:
+                print(f"[{n:03d}] 🔇 (silence or no speech)")
+            
+            print()
 
 except KeyboardInterrupt:
     print("\n🛑 Stopping Whisper debug...")
+    stream.close()
     audio.terminate()
     print("✅ Whisper debug complete!")
     print(f"Total chunks processed: {count}")
+    if dropped:
+        print(f"Chunks dropped while Whisper was busy: {dropped}")
 
 except Exception as e:
     print(f"\n❌ Error: {e}")
+    stream.close()
     audio.terminate()
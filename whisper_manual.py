@@ -3,11 +3,11 @@
 Manual Whisper test - you control when to record
 """
 
-import whisper
+import ahocorasick
+import numpy as np
 import pyaudio
-import wave
-import tempfile
-import os
+
+from whisper_runtime import load_model, to_float32, warmup, transcribe
 
 print("🎤 Manual Whisper Test")
 print("=" * 40)
@@ -18,10 +18,22 @@ print()
 
 # Load Whisper model
 print("🧠 Loading Whisper model...")
-model = whisper.load_model("base")
+load_model()
+warmup()
 print("✅ Whisper ready!")
 print()
 
+# One automaton over wake words and activation words, so each transcript
+# is scanned once for both
+WAKE_WORDS = ['hey voicenav', 'hey voice nav', 'a voicenav', 'hey voice now']
+ACTIVATION_WORDS = ['hello', 'computer', 'assistant', 'system']
+phrase_matcher = ahocorasick.Automaton()
+for phrase in WAKE_WORDS:
+    phrase_matcher.add_word(phrase, 'wake')
+for phrase in ACTIVATION_WORDS:
+    phrase_matcher.add_word(phrase, 'activation')
+phrase_matcher.make_automaton()
+
 # Audio settings
 CHUNK = 1024
 FORMAT = pyaudio.paInt16
@@ -31,6 +43,23 @@ RATE = 16000
 # Initialize PyAudio
 audio = pyaudio.PyAudio()
 
+# Audio accumulates here while the stream is started
+buf = bytearray()
+
+def on_audio(in_data, frame_count, time_info, status):
+    buf.extend(in_data)
+    return (None, pyaudio.paContinue)
+
+# One callback-mode stream for every recording; the main thread only
+# waits for ENTER, so no stop thread or shared flag is needed
+stream = audio.open(format=FORMAT,
+                  channels=CHANNELS,
+                  rate=RATE,
+                  input=True,
+                  frames_per_buffer=CHUNK,
+                  stream_callback=on_audio,
+                  start=False)
+
 count = 0
 try:
     while True:
@@ -43,74 +72,35 @@ try:
             
         print(f"[{count:03d}] 🎙️ RECORDING... Press ENTER to stop")
         
-        # Start recording
-        stream = audio.open(format=FORMAT,
-                          channels=CHANNELS,
-                          rate=RATE,
-                          input=True,
-                          frames_per_buffer=CHUNK)
-        
-        frames = []
-        
         # Record until user presses enter
-        import threading
-        import sys
-        
-        recording = True
-        
-        def stop_recording():
-            global recording
-            input()  # Wait for Enter
-            recording = False
-        
-        # Start the stop thread
-        stop_thread = threading.Thread(target=stop_recording)
-        stop_thread.daemon = True
-        stop_thread.start()
-        
-        # Record audio
-        while recording:
-            try:
-                data = stream.read(CHUNK, exception_on_overflow=False)
-                frames.append(data)
-            except:
-                break
-        
+        buf.clear()
+        stream.start_stream()
+        input()  # Wait for Enter
         stream.stop_stream()
-        stream.close()
         
         print(f"[{count:03d}] ⏹️ Recording stopped. Processing...")
         
-        if frames:
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                wf = wave.open(temp_file.name, 'wb')
-                wf.setnchannels(CHANNELS)
-                wf.setsampwidth(audio.get_sample_size(FORMAT))
-                wf.setframerate(RATE)
-                wf.writeframes(b''.join(frames))
-                wf.close()
-                
-                # Process with Whisper
-                print(f"[{count:03d}] 🧠 Whisper analyzing...")
-                result = model.transcribe(temp_file.name)
-                text = result["text"].strip().lower()
-                
-                # Clean up temp file
-                os.unlink(temp_file.name)
+        if buf:
+            # Hand Whisper the samples directly: no WAV file or ffmpeg decode
+            pcm = to_float32(np.frombuffer(buf, dtype=np.int16))
+            
+            # Process with Whisper
+            print(f"[{count:03d}] 🧠 Whisper analyzing...")
+            text = transcribe(pcm)
             
             # Show results
             if text:
                 print(f"[{count:03d}] 🎤 HEARD: '{text}'")
                 
+                hits = {kind for _, kind in phrase_matcher.iter(text)}
+                
                 # Check for wake word (multiple variations)
-                wake_words = ['hey voicenav', 'hey voice nav', 'a voicenav', 'hey voice now']
-                if any(wake in text for wake in wake_words):
+                if 'wake' in hits:
                     print(f"[{count:03d}] ✅ WAKE WORD DETECTED!")
                     print("     🔊 *BEEP* - This would activate VoiceNav!")
                 
                 # Check for other keywords
-                if any(word in text for word in ['hello', 'computer', 'assistant', 'system']):
+                if 'activation' in hits:
                     print(f"[{count:03d}] 💬 Common activation word detected")
                     
             else:
@@ -122,6 +112,7 @@ except KeyboardInterrupt:
     print("\n🛑 Stopping...")
 
 finally:
+    stream.close()
     audio.terminate()
     print("✅ Manual test complete!")
     print(f"Total recordings: {count-1}")
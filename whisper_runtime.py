@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Shared faster-whisper model for the Whisper debug scripts
+int8 weights on CPU, int8 with fp16 activations on CUDA
+"""
+
+import bisect
+import functools
+import os
+
+import ctranslate2
+import numpy as np
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+MODEL_SIZE = "base"
+# Smaller English-only model for the always-on wake word loop
+WAKE_MODEL_SIZE = os.environ.get("VOICENAV_WAKE_WORD_MODEL", "tiny.en")
+RATE = 16000
+INT16_SCALE = np.float32(1 / 32768)
+
+
+def to_float32(samples):
+    """
+    Convert int16 PCM to float32 in [-1, 1] in a single pass
+    
+    Args:
+        samples: int16 numpy array
+    
+    Returns:
+        numpy.ndarray: float32 samples
+    """
+    return np.multiply(samples, INT16_SCALE, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=2)
+def load_model(model_size=MODEL_SIZE):
+    """
+    Load a quantized Whisper model once per process and size
+    
+    Args:
+        model_size: Whisper model size (tiny, base, small, ...)
+    
+    Returns:
+        WhisperModel: The loaded model
+    """
+    if ctranslate2.get_cuda_device_count() > 0:
+        device, compute_type = "cuda", "int8_float16"
+    else:
+        device, compute_type = "cpu", "int8"
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+@functools.lru_cache(maxsize=2)
+def load_batched_model(model_size=MODEL_SIZE):
+    """Wrap a shared model in a BatchedInferencePipeline, once per process and size"""
+    return BatchedInferencePipeline(model=load_model(model_size))
+
+
+def warmup(model_size=MODEL_SIZE, duration_s=1):
+    """
+    Run one throwaway transcription so the first real clip does not pay for
+    the model's one-time initialization
+    
+    Args:
+        model_size: Whisper model size to warm up
+        duration_s: Seconds of silence to transcribe
+    """
+    silence = np.zeros(RATE * duration_s, dtype=np.float32)
+    # No VAD here: it would drop the silence and skip the encoder entirely
+    segments, _ = load_model(model_size).transcribe(silence, language="en", beam_size=1, vad_filter=False)
+    list(segments)  # Segments are generated lazily
+
+
+def transcribe(pcm, model_size=MODEL_SIZE):
+    """
+    Transcribe one clip with greedy decoding
+    
+    Silero VAD (vad_filter) trims silence first, so only speech is decoded.
+    
+    Args:
+        pcm: float32 samples at 16kHz, normalised to [-1, 1]
+        model_size: Whisper model size to decode with
+    
+    Returns:
+        str: Lower-cased transcript
+    """
+    segments, _ = load_model(model_size).transcribe(pcm, language="en", beam_size=1, vad_filter=True)
+    return "".join(segment.text for segment in segments).strip().lower()
+
+
+def transcribe_batch(clips, model_size=MODEL_SIZE, batched_model=None, batch_size=8):
+    """
+    Transcribe several clips with one batched Whisper call
+    
+    The clips are concatenated and clip_timestamps makes each one its own
+    batch item, so the encoder runs over all of them together.
+    
+    Args:
+        clips: List of float32 sample arrays at 16kHz, normalised to [-1, 1]
+        model_size: Whisper model size to decode with
+        batched_model: Caller's own BatchedInferencePipeline; defaults to the
+            shared one for model_size
+        batch_size: Clips decoded per batch
+    
+    Returns:
+        list: Lower-cased transcript per clip, in order
+    """
+    clip_starts = []
+    clip_timestamps = []
+    offset = 0
+    for clip in clips:
+        clip_starts.append(offset / RATE)
+        # The batched pipeline slices the audio with these, so they are sample indices
+        clip_timestamps.append({"start": offset, "end": offset + len(clip)})
+        offset += len(clip)
+    
+    if batched_model is None:
+        batched_model = load_batched_model(model_size)
+    segments, _ = batched_model.transcribe(np.concatenate(clips), language="en",
+                                           batch_size=batch_size, beam_size=1, vad_filter=False,
+                                           clip_timestamps=clip_timestamps)
+    
+    # Map each segment back to its clip by where it sits in the batch
+    texts = [[] for _ in clips]
+    for segment in segments:
+        midpoint = (segment.start + segment.end) / 2
+        texts[max(0, bisect.bisect_right(clip_starts, midpoint) - 1)].append(segment.text)
+    
+    return [" ".join(parts).strip().lower() for parts in texts]